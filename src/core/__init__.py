@@ -1,11 +1,31 @@
-from fake_useragent import UserAgent
-from tenacity import retry, stop_after_attempt, wait_fixed, RetryError, wait_exponential
-from .logs import logger
-import requests
-from bs4 import BeautifulSoup
+import importlib
 import re
 import json
 import csv
 import os
 import time
 import random
+
+# Third-party modules are imported on first use, so importing a light submodule
+# (or running a PDF-only recipe) does not pay for requests, bs4 and friends.
+_LAZY = {
+    "UserAgent": ("fake_useragent", "UserAgent"),
+    "retry": ("tenacity", "retry"),
+    "stop_after_attempt": ("tenacity", "stop_after_attempt"),
+    "wait_fixed": ("tenacity", "wait_fixed"),
+    "RetryError": ("tenacity", "RetryError"),
+    "wait_exponential": ("tenacity", "wait_exponential"),
+    "logger": (".logs", "logger"),
+    "requests": ("requests", None),
+    "BeautifulSoup": ("bs4", "BeautifulSoup"),
+}
+
+
+def __getattr__(name):
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, attr = _LAZY[name]
+    module = importlib.import_module(module_name, __name__)
+    value = getattr(module, attr) if attr else module
+    globals()[name] = value
+    return value
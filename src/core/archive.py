@@ -0,0 +1,91 @@
+"""
+Compressed storage of raw HTTP response bodies in the SQLite archives.
+
+html_to_db-style archives used to hold `soup.prettify()` text. They now keep
+the server's bytes compressed in a `body` column, next to the codec, the
+encoding the page was decoded with and some fetch metadata, so a re-parse
+starts from exactly what the server sent. GenericDatabase.get_urls_and_html
+decompresses transparently and still reads old rows from the `html` column.
+
+zlib is always available; zstd is used when the `zstandard` package is
+installed (`pip install zstandard`).
+"""
+
+import zlib
+from typing import Any, Dict, Optional
+
+from sqlalchemy import Float, Integer, LargeBinary, String
+
+ZLIB = "zlib"
+ZSTD = "zstd"
+ZLIB_LEVEL = 6
+ZSTD_LEVEL = 10
+
+# Columns an archive table needs besides url/html
+ARCHIVE_COLUMNS = {
+    "body": LargeBinary,
+    "codec": String,
+    "encoding": String,
+    "status": Integer,
+    "content_type": String,
+    "etag": String,
+    "last_modified": String,
+    "fetched_at": Float,
+}
+
+
+def _zstd():
+    try:
+        import zstandard
+    except ImportError:
+        return None
+    return zstandard
+
+
+def default_codec() -> str:
+    return ZSTD if _zstd() else ZLIB
+
+
+def compress(data: bytes, codec: str = ZLIB) -> bytes:
+    if codec == ZLIB:
+        return zlib.compress(data, ZLIB_LEVEL)
+    if codec == ZSTD:
+        zstandard = _zstd()
+        if zstandard is None:
+            raise ValueError("zstd compression needs the zstandard package")
+        return zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(data)
+    raise ValueError(f"Unknown codec: {codec}")
+
+
+def decompress(data: bytes, codec: Optional[str]) -> bytes:
+    if not codec:
+        return data
+    if codec == ZLIB:
+        return zlib.decompress(data)
+    if codec == ZSTD:
+        zstandard = _zstd()
+        if zstandard is None:
+            raise ValueError("Archived page is zstd compressed; install zstandard to read it")
+        return zstandard.ZstdDecompressor().decompress(data)
+    raise ValueError(f"Unknown codec: {codec}")
+
+
+def decode_body(body: bytes, codec: Optional[str], encoding: Optional[str]) -> str:
+    """Decompress an archived body and decode it the way the fetch layer did."""
+    return decompress(body, codec).decode(encoding or "utf-8", errors="replace")
+
+
+def archive_record(page: Dict[str, Any], codec: Optional[str] = None) -> Dict[str, Any]:
+    """Build an archive row from a Fetcher.last_page dict."""
+    codec = codec or default_codec()
+    return {
+        "url": page["url"],
+        "body": compress(page["content"], codec),
+        "codec": codec,
+        "encoding": page["encoding"],
+        "status": page["status"],
+        "content_type": page["content_type"],
+        "etag": page["etag"],
+        "last_modified": page["last_modified"],
+        "fetched_at": page["fetched_at"],
+    }
@@ -1,20 +1,28 @@
-from typing import Any, Dict, List, Optional
-import os
-import csv
-import json
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Pattern, Tuple
 import logging
 from src.core.interfaces import IDataExtractor
 from src.core.services.pdf_service import PDFService
+from src.core.sinks import open_sink
 
 logger = logging.getLogger(__name__)
 
 class BasePDFExtractor(IDataExtractor):
     """
     Base class for PDF extraction.
+
+    Subclasses whose records can be parsed independently set `record_start`
+    to a pattern matching the first line of a record. Pages are then streamed
+    from the PDF and `parse` is called on chunks that end where a record
+    starts, carrying the unfinished record over to the next page, so memory
+    stays flat however large the PDF is.
     """
+
+    record_start: Optional[Pattern] = None
+    # A record still unfinished after this many characters is parsed as is
+    max_carry = 1_000_000
     def __init__(self, pdf_path: str, **kwargs):
         self.pdf_path = pdf_path
-        self.pdf_service = PDFService(pdf_path)
+        self.pdf_service = PDFService(pdf_path, workers=kwargs.get('workers', 1))
         self.kwargs = kwargs
 
     def extract(self, **kwargs) -> List[Dict[str, Any]]:
@@ -23,6 +31,9 @@ class BasePDFExtractor(IDataExtractor):
         """
         try:
             pages = kwargs.get('pages', self.kwargs.get('pages'))
+            if self.record_start is not None:
+                return list(self.iter_extract(pages))
+
             text_content = self.pdf_service.extract_text(pages=pages)
             if not text_content:
                 logger.warning(f"No text extracted from PDF: {self.pdf_path}")
@@ -33,35 +44,68 @@ class BasePDFExtractor(IDataExtractor):
             logger.error(f"PDF extraction failed: {e}")
             raise
 
+    def iter_extract(self, pages=None) -> Iterator[Dict[str, Any]]:
+        """Yield records page by page (requires `record_start`)."""
+        page_texts = self.pdf_service.iter_pages(pages)
+        extracted = False
+        for chunk in self.iter_chunks(page_texts):
+            extracted = extracted or bool(chunk.strip())
+            yield from self.parse_chunk(chunk)
+        if not extracted:
+            logger.warning(f"No text extracted from PDF: {self.pdf_path}")
+
+    def extract_to(self, output_path: str, **kwargs) -> int:
+        """
+        Extract straight into a sink for `output_path` and return the number
+        of records. With `record_start` set, each record is written as soon
+        as its page is parsed.
+        """
+        pages = kwargs.get('pages', self.kwargs.get('pages'))
+        records = self.iter_extract(pages) if self.record_start is not None else self.extract(**kwargs)
+        with open_sink(output_path) as sink:
+            return sink.write_many(records)
+
+    def iter_chunks(self, page_texts: Iterable[Tuple[int, str]]) -> Iterator[str]:
+        """
+        Regroup page texts into chunks that each end just before a record
+        start; the text after the last record start is carried over.
+        """
+        carry = ""
+        for _, text in page_texts:
+            # Only the new page (and the line it continues) can hold a new record start
+            scanned = carry.rfind("\n") + 1
+            carry += text
+            cut = self.last_record_start(carry, scanned)
+            if cut <= 0 and len(carry) > self.max_carry:
+                logger.warning(f"No record boundary in {len(carry)} characters, parsing them as is")
+                cut = len(carry)
+            if cut > 0:
+                yield carry[:cut]
+                carry = carry[cut:]
+        if carry:
+            yield carry
+
+    def last_record_start(self, text: str, pos: int = 0) -> int:
+        """Offset of the last record start in text[pos:] (0 if there is none)."""
+        start = 0
+        for match in self.record_start.finditer(text, pos):
+            start = match.start()
+        return start
+
     def parse(self, text: str) -> List[Dict[str, Any]]:
         """
         Parse the extracted text. Subclasses must implement this.
         """
         raise NotImplementedError("Subclasses must implement parse method")
 
-    def save(self, data: List[Dict[str, Any]], output_path: str):
+    def parse_chunk(self, chunk: str) -> List[Dict[str, Any]]:
+        """Parse one chunk from iter_chunks; subclasses that prepare the stream there skip that in parse."""
+        return self.parse(chunk)
+
+    def save(self, data: Iterable[Dict[str, Any]], output_path: str):
         """
-        Save the extracted data to a file.
+        Save the extracted records to a file, writing them one at a time
+        (see src/core/sinks.py for the formats). `data` may be a generator.
         """
-        os.makedirs(os.path.dirname(output_path), exist_ok=True)
-        if output_path.endswith('.csv'):
-             self._save_to_csv(data, output_path)
-        elif output_path.endswith('.json'):
-             self._save_to_json(data, output_path)
-        else:
-             raise ValueError("Unsupported format. Use .csv or .json")
-    
-    def _save_to_csv(self, data: List[Dict[str, Any]], output_path: str):
-        if not data:
-            logger.warning("No data to save")
-            return
-            
-        keys = data[0].keys()
-        with open(output_path, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=keys)
-            writer.writeheader()
-            writer.writerows(data)
-            
-    def _save_to_json(self, data: List[Dict[str, Any]], output_path: str):
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=4)
+        with open_sink(output_path) as sink:
+            sink.write_many(data)
@@ -1,16 +1,15 @@
+import asyncio
+import itertools
 import logging
-import random
-import time
 import re
-import requests
-import json
-import csv
-import os
-from bs4 import BeautifulSoup
-from fake_useragent import UserAgent
-from tenacity import retry, stop_after_attempt, wait_exponential, RetryError
-from typing import Any, Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from tenacity import RetryError
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional
+from src.core.fetch import Fetcher, get_user_agent
 from src.core.interfaces import IDataExtractor
+from src.core.parsers import make_soup
+from src.core.sessions import configure_pool, get_session
+from src.core.sinks import open_sink
 
 logger = logging.getLogger(__name__)
 
@@ -19,52 +18,40 @@ class BaseScraper(IDataExtractor):
     """
     Base scraper class that provides common functionality for all scrapers.
     This class implements the Template Method pattern for web scraping.
+
+    Subclasses may set `parser` to pick an HTML backend and `parse_only` to
+    build only the regions of the page they read (see src/core/parsers.py).
     """
 
+    parser: Optional[str] = None
+    parse_only = None
+
     def __init__(self, **kwargs):
         self.base_url = kwargs.get('base_url', '').strip()
         self.content = kwargs.get('content')
-        self.ua = UserAgent()
-        self.session = requests.Session()
+        self.ua = get_user_agent()
+        self.session = kwargs.get('session') or get_session(self.base_url)
+        self.fetcher = Fetcher(session=self.session,
+                               rate_limiter=kwargs.get('rate_limiter'),
+                               user_agent=self.ua,
+                               cache=kwargs.get('cache'),
+                               cassette=kwargs.get('cassette'))
+        self.parser = kwargs.get('parser') or self.parser
+        self.parse_only = kwargs.get('parse_only', self.parse_only)
         self.soup = None
 
-    @retry(stop=stop_after_attempt(5),
-           wait=wait_exponential(multiplier=2, min=5, max=30),
-           reraise=True)
     def fetch_page(self):
         """Fetch a web page with exponential backoff retry logic."""
-        headers = {
-            "User-Agent": self.ua.random,
-            "Accept-Language": "en-US,en;q=0.9"
-        }
-        self.session.headers.update(headers)
-
-        delay = random.uniform(2, 5)
-        logger.info(
-            f"Waiting {delay:.2f} seconds before request to {self.base_url}")
-        time.sleep(delay)
-
-        response = self.session.get(self.base_url, timeout=10)
-
-        if response.status_code == 404:
-            logger.warning(f"Page not found: {self.base_url} (404)")
-            return ""
-
-        if response.status_code == 429:
-            logger.warning(f"Rate limit hit! Retrying... ({self.base_url})")
-            raise Exception(f"Too many requests: {self.base_url} (429)")
+        return self.fetcher.fetch(self.base_url)
 
-        if response.status_code != 200:
-            logger.error(
-                f"Failed to fetch {self.base_url} (Status Code: {response.status_code})")
-            raise Exception(
-                f"Failed to fetch {self.base_url} (Status Code: {response.status_code})")
-
-        return response.text
+    async def afetch_page(self):
+        """Asyncio variant of fetch_page."""
+        return await self.fetcher.afetch(self.base_url)
 
     def pre_parse(self, html_content):
         """Prepare the HTML content for parsing."""
-        self.soup = BeautifulSoup(html_content, "html.parser")
+        self.html_content = html_content
+        self.soup = make_soup(html_content, self.parser, self.parse_only)
 
     def extract(self, **kwargs) -> List[Dict[str, Any]]:
         """
@@ -83,6 +70,117 @@ class BaseScraper(IDataExtractor):
              logger.error(f"Extraction failed: {e}")
              raise
 
+    async def aextract(self, **kwargs) -> List[Dict[str, Any]]:
+        """
+        Asyncio variant of extract. Parsing runs in a worker thread, like the
+        request itself, so the event loop keeps scheduling other fetches.
+        """
+        try:
+            html_content = self.content or kwargs.get('content') or await self.afetch_page()
+            return await asyncio.to_thread(self._parse, html_content)
+        except RetryError as e:
+            logger.error(
+                f"Retries failed for {self.base_url}. Error: {str(e)}")
+            raise
+        except Exception as e:
+             logger.error(f"Extraction failed: {e}")
+             raise
+
+    def _parse(self, html_content):
+        self.pre_parse(html_content)
+        return self.parse_page()
+
+    @classmethod
+    async def aextract_url(cls, url: str, **kwargs) -> List[Dict[str, Any]]:
+        """aextract for one URL; a failure after all retries is logged and gives []."""
+        scraper = cls(base_url=url, **kwargs)
+        try:
+            return await scraper.aextract()
+        except Exception as e:
+            logger.error(f"Failed to scrape {url}: {e}")
+            return []
+
+    @classmethod
+    async def aextract_many(cls, urls: Iterable[str], concurrency: int = 5,
+                            **kwargs) -> List[List[Dict[str, Any]]]:
+        """
+        Extract many URLs concurrently, at most `concurrency` at a time.
+        Requests still go through the per-host rate limiter, whose default
+        (DEFAULT_RATE requests per second) caps throughput whatever the
+        concurrency; raise it (get_rate_limiter().configure, --rate) to let
+        concurrent requests overlap.
+
+        Returns one result list per URL, in input order. A URL that fails after
+        all retries is logged and yields an empty list.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def extract_one(url):
+            async with semaphore:
+                return await cls.aextract_url(url, **kwargs)
+
+        return await asyncio.gather(*(extract_one(url) for url in urls))
+
+    @classmethod
+    async def aiter_extract(cls, urls: Iterable[str], concurrency: int = 5,
+                            **kwargs) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Yield each URL's result list as soon as it is extracted, so in
+        completion order. URLs are taken from `urls` only as one of the
+        `concurrency` slots frees up, so a long input is never all scheduled
+        (or held) at once.
+        """
+        urls = iter(urls)
+        pending = set()
+        try:
+            while True:
+                for url in itertools.islice(urls, concurrency - len(pending)):
+                    pending.add(asyncio.ensure_future(cls.aextract_url(url, **kwargs)))
+                if not pending:
+                    return
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    yield task.result()
+        finally:
+            for task in pending:
+                task.cancel()
+
+    @classmethod
+    def extract_many(cls, urls: Iterable[str], concurrency: int = 5,
+                     **kwargs) -> List[List[Dict[str, Any]]]:
+        """Blocking entry point for aextract_many."""
+        return cls._run(cls.aextract_many(urls, concurrency, **kwargs), concurrency)
+
+    @classmethod
+    def extract_many_to(cls, urls: Iterable[str], output_path: str, concurrency: int = 5,
+                        flush_every: int = 1000, **kwargs) -> int:
+        """
+        Extract many URLs in one event loop, writing each result to a sink for
+        `output_path` as it completes, and return the number of records.
+        The sink flushes every `flush_every` records, so a failed run keeps
+        what was done.
+        """
+        async def extract():
+            with open_sink(output_path, flush_every=flush_every) as sink:
+                async for records in cls.aiter_extract(urls, concurrency, **kwargs):
+                    sink.write_many(records)
+            return sink.count
+
+        return cls._run(extract(), concurrency)
+
+    @staticmethod
+    def _run(coroutine, concurrency):
+        configure_pool(concurrency)
+
+        async def run():
+            # Size the thread pool behind asyncio.to_thread to the concurrency;
+            # asyncio.run shuts it down on exit.
+            asyncio.get_running_loop().set_default_executor(
+                ThreadPoolExecutor(max_workers=concurrency))
+            return await coroutine
+
+        return asyncio.run(run())
+
     def parse_page(self) -> List[Dict[str, Any]]:
         """
         Parse the HTML content. This method should be overridden by subclasses.
@@ -90,32 +188,13 @@ class BaseScraper(IDataExtractor):
         raise NotImplementedError(
             "Subclasses must implement parse_page method")
 
-    def save(self, data: List[Dict[str, Any]], output_path: str):
+    def save(self, data: Iterable[Dict[str, Any]], output_path: str):
         """
-        Save the extracted data to a file.
+        Save the extracted records to a file, writing them one at a time
+        (see src/core/sinks.py for the formats). `data` may be a generator.
         """
-        os.makedirs(os.path.dirname(output_path), exist_ok=True)
-        if output_path.endswith('.csv'):
-             self._save_to_csv(data, output_path)
-        elif output_path.endswith('.json'):
-             self._save_to_json(data, output_path)
-        else:
-             raise ValueError("Unsupported format. Use .csv or .json")
-    
-    def _save_to_csv(self, data: List[Dict[str, Any]], output_path: str):
-        if not data:
-            logger.warning("No data to save")
-            return
-            
-        keys = data[0].keys()
-        with open(output_path, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=keys)
-            writer.writeheader()
-            writer.writerows(data)
-            
-    def _save_to_json(self, data: List[Dict[str, Any]], output_path: str):
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=4)
+        with open_sink(output_path) as sink:
+            sink.write_many(data)
 
     def get_html(self):
         """Return the prettified HTML content."""
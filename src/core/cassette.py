@@ -0,0 +1,161 @@
+"""
+Record/replay of HTTP traffic for offline, deterministic scraper runs.
+
+In record mode every response the fetch layer receives is saved to a SQLite
+archive indexed by method and URL. In replay mode the fetch layer serves those
+responses without touching the network (and without rate limiting), optionally
+with simulated latency, so recipes can be benchmarked end to end at full speed.
+
+Activate it for a whole run with environment variables:
+    SCRAPER_CASSETTE=data/gst.cassette SCRAPER_CASSETTE_MODE=record python -m src.main ...
+or in code:
+    with use_cassette("data/gst.cassette", mode="replay"):
+        GstExtractor(base_url=url).extract()
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from typing import List, Optional
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+RECORD = "record"
+REPLAY = "replay"
+CASSETTE_ENV = "SCRAPER_CASSETTE"
+CASSETTE_MODE_ENV = "SCRAPER_CASSETTE_MODE"
+
+
+class CassetteMiss(Exception):
+    """A replayed request has no recorded response."""
+
+
+class Cassette:
+    def __init__(self, path: str, mode: str = REPLAY, latency: float = 0.0,
+                 recorded_latency: bool = False):
+        """
+        Args:
+            path: SQLite file holding the recorded interactions
+            mode: "record" or "replay"
+            latency: Fixed delay (seconds) added to every replayed response
+            recorded_latency: Also replay the response time measured when recording
+        """
+        if mode not in (RECORD, REPLAY):
+            raise ValueError(f"Unknown cassette mode: {mode}")
+        if mode == REPLAY and not os.path.exists(path):
+            raise FileNotFoundError(f"Cassette not found: {path}")
+        self.path = path
+        self.mode = mode
+        self.latency = latency
+        self.recorded_latency = recorded_latency
+        self._lock = threading.Lock()
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS interactions (
+                method TEXT NOT NULL,
+                url TEXT NOT NULL,
+                status INTEGER NOT NULL,
+                headers TEXT NOT NULL,
+                encoding TEXT,
+                body BLOB NOT NULL,
+                elapsed REAL NOT NULL,
+                recorded_at REAL NOT NULL,
+                PRIMARY KEY (method, url)
+            )""")
+        self._conn.commit()
+
+    @property
+    def replaying(self) -> bool:
+        return self.mode == REPLAY
+
+    def record(self, url: str, response, method: str = "GET"):
+        """Save a response; a later recording of the same request replaces it."""
+        row = (
+            method, url, response.status_code,
+            json.dumps(dict(response.headers)),
+            response.encoding,
+            response.content,
+            response.elapsed.total_seconds(),
+            time.time(),
+        )
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO interactions VALUES (?, ?, ?, ?, ?, ?, ?, ?)", row)
+            self._conn.commit()
+
+    def play(self, url: str, method: str = "GET") -> requests.Response:
+        """Return the recorded response for a request, after the simulated latency."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT status, headers, encoding, body, elapsed FROM interactions "
+                "WHERE method = ? AND url = ?", (method, url)).fetchone()
+        if row is None:
+            raise CassetteMiss(f"No recorded response for {method} {url}")
+
+        status, headers, encoding, body, elapsed = row
+        delay = self.latency + (elapsed if self.recorded_latency else 0.0)
+        if delay > 0:
+            time.sleep(delay)
+
+        response = requests.Response()
+        response.status_code = status
+        response.headers = CaseInsensitiveDict(json.loads(headers))
+        response.encoding = encoding
+        response._content = body
+        response.url = url
+        return response
+
+    def urls(self, host: Optional[str] = None) -> List[str]:
+        """Recorded URLs in recording order, optionally only those on `host`."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT url FROM interactions ORDER BY recorded_at").fetchall()
+        urls = [row[0] for row in rows]
+        if host:
+            urls = [url for url in urls if f"//{host}" in url]
+        return urls
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+_cassette: Optional[Cassette] = None
+_configured = False
+
+
+def set_cassette(cassette: Optional[Cassette]):
+    """Make `cassette` the process-wide one (None turns recording/replay off)."""
+    global _cassette, _configured
+    _cassette = cassette
+    _configured = True
+
+
+def get_cassette() -> Optional[Cassette]:
+    """
+    Return the process-wide cassette. Unless set explicitly it comes from the
+    SCRAPER_CASSETTE / SCRAPER_CASSETTE_MODE environment variables.
+    """
+    if not _configured:
+        path = os.environ.get(CASSETTE_ENV)
+        set_cassette(Cassette(path, os.environ.get(CASSETTE_MODE_ENV, REPLAY)) if path else None)
+    return _cassette
+
+
+@contextmanager
+def use_cassette(path: str, mode: str = REPLAY, **kwargs):
+    """Record or replay all fetches made inside the block."""
+    previous = get_cassette()
+    cassette = Cassette(path, mode, **kwargs)
+    set_cassette(cassette)
+    try:
+        yield cassette
+    finally:
+        set_cassette(previous)
+        cassette.close()
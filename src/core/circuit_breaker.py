@@ -0,0 +1,136 @@
+"""
+Per-host circuit breaker for the fetch layer.
+
+When a host keeps failing (or tells us to back off with Retry-After), the
+breaker opens and every worker for that host pauses instead of adding to the
+storm. Once the pause is over a single probe request is let through: success
+closes the breaker, failure opens it again. A probe abandoned before its
+outcome is recorded (e.g. a cancelled task) must be handed back with
+release_probe(), or no request to the host would ever be let through again.
+"""
+
+import contextvars
+import logging
+import threading
+import time
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+logger = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+DEFAULT_FAILURE_THRESHOLD = 3
+DEFAULT_RESET_TIMEOUT = 30.0
+PROBE_POLL_INTERVAL = 0.5
+
+# (breaker, probe number) of the probe claimed in this thread or task
+_claimed_probe = contextvars.ContextVar("claimed_probe", default=None)
+
+
+class CircuitBreaker:
+    """
+    Like the rate limiter, `before_request()` never blocks: it returns how long
+    the caller should wait before asking again (0 means go ahead), so threads
+    and coroutines can both use it.
+    """
+
+    def __init__(self, name: str = "", failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+                 reset_timeout: float = DEFAULT_RESET_TIMEOUT):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = CLOSED
+        self.failures = 0
+        self._open_until = 0.0
+        self._probe_in_flight = False
+        self._probes = 0
+        self._lock = threading.Lock()
+
+    def before_request(self) -> float:
+        with self._lock:
+            if self.state == CLOSED:
+                return 0.0
+            now = time.monotonic()
+            if self.state == OPEN:
+                if now < self._open_until:
+                    return self._open_until - now
+                self.state = HALF_OPEN
+            if self._probe_in_flight:
+                return PROBE_POLL_INTERVAL
+            self._probe_in_flight = True
+            self._probes += 1
+            _claimed_probe.set((self, self._probes))
+            logger.info(f"Circuit for {self.name} half-open, sending probe request")
+            return 0.0
+
+    def release_probe(self):
+        """
+        Hand back the probe this thread or task claimed in before_request()
+        if its outcome was never recorded, so the next request can probe.
+        Does nothing otherwise; call it in a finally after every request.
+        """
+        claim = _claimed_probe.get()
+        if claim is None or claim[0] is not self:
+            return
+        _claimed_probe.set(None)
+        with self._lock:
+            if self._probe_in_flight and self._probes == claim[1]:
+                self._probe_in_flight = False
+                logger.info(f"Circuit for {self.name} probe abandoned, the next request probes")
+
+    def record_success(self):
+        with self._lock:
+            if self.state != CLOSED:
+                logger.info(f"Circuit for {self.name} closed")
+            self.state = CLOSED
+            self.failures = 0
+            self._probe_in_flight = False
+
+    def record_failure(self, retry_after: Optional[float] = None):
+        """
+        Count a failed request. A server-advised delay opens the breaker at once
+        for at least that long; otherwise it opens after `failure_threshold`
+        consecutive failures, or straight away if the probe failed.
+        """
+        with self._lock:
+            self.failures += 1
+            self._probe_in_flight = False
+            if (retry_after is None and self.state == CLOSED
+                    and self.failures < self.failure_threshold):
+                return
+            pause = self.reset_timeout if retry_after is None else retry_after
+            self._open_until = max(self._open_until, time.monotonic() + pause)
+            self.state = OPEN
+            logger.warning(
+                f"Circuit for {self.name} open, pausing requests for {pause:.1f}s "
+                f"({self.failures} consecutive failures)")
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+_settings = {"failure_threshold": DEFAULT_FAILURE_THRESHOLD, "reset_timeout": DEFAULT_RESET_TIMEOUT}
+_lock = threading.Lock()
+
+
+def get_circuit_breaker(url: str) -> CircuitBreaker:
+    """Return the shared breaker for the host of `url`."""
+    host = urlsplit(url).netloc.lower()
+    breaker = _breakers.get(host)
+    if breaker is None:
+        with _lock:
+            breaker = _breakers.get(host)
+            if breaker is None:
+                breaker = _breakers[host] = CircuitBreaker(host, **_settings)
+    return breaker
+
+
+def configure_circuit_breakers(failure_threshold: Optional[int] = None,
+                               reset_timeout: Optional[float] = None):
+    """Change the settings used for breakers created from now on."""
+    with _lock:
+        if failure_threshold is not None:
+            _settings["failure_threshold"] = failure_threshold
+        if reset_timeout is not None:
+            _settings["reset_timeout"] = reset_timeout
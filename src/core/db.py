@@ -1,5 +1,6 @@
 from sqlalchemy import create_engine, Table, MetaData, and_, or_, text, Column, String
 from sqlalchemy.orm import sessionmaker
+from .archive import decode_body
 
 
 class GenericDatabase:
@@ -14,13 +15,29 @@ class GenericDatabase:
         return Table(table_name, self.metadata, autoload_with=self.engine)
 
     def get_urls_and_html(self, table_name):
-        """Generator to fetch URLs and HTML one by one."""
+        """
+        Generator to fetch URLs and HTML one by one. Compressed raw bodies
+        (see core/archive.py) are decompressed and decoded on the fly.
+        """
         table = self.get_table(table_name)
         # Fetch only required columns
-        query = self.session.query(table.c.url, table.c.html)
+        columns = [table.c.url, table.c.html]
+        archived = "body" in table.c
+        if archived:
+            columns += [table.c.body, table.c.codec, table.c.encoding]
+        query = self.session.query(*columns)
 
         for row in query:
-            yield row.url, row.html
+            if archived and row.body is not None:
+                yield row.url, decode_body(row.body, row.codec, row.encoding)
+            else:
+                yield row.url, row.html
+
+    def get_urls(self, table_name):
+        """Generator to fetch stored URLs one by one."""
+        table = self.get_table(table_name)
+        for row in self.session.query(table.c.url):
+            yield row.url
 
     def query_with_filters(self, table_name, filters=None, conjunction="and", limit=None, offset=None):
         table = self.get_table(table_name)
@@ -100,6 +117,19 @@ class GenericDatabase:
             table.create(self.engine)
             self.metadata.reflect(bind=self.engine)
 
+    def add_missing_columns(self, table_name, columns):
+        """Add the columns that a table created by an older version lacks."""
+        table = self.get_table(table_name)
+        missing = {name: col_type for name, col_type in columns.items() if name not in table.c}
+        if not missing:
+            return
+        with self.engine.begin() as conn:
+            for col_name, col_type in missing.items():
+                type_sql = col_type().compile(dialect=self.engine.dialect)
+                conn.execute(text(f'ALTER TABLE "{table_name}" ADD COLUMN "{col_name}" {type_sql}'))
+        self.metadata.remove(table)
+        self.metadata.reflect(bind=self.engine)
+
     def url_exists(self, table_name, url):
         """Check if a given URL already exists in the database."""
         table = self.get_table(table_name)
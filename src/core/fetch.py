@@ -0,0 +1,282 @@
+"""
+Fetch layer shared by BaseScraper and utils.scraper.Scraper.
+
+Every page request goes through Fetcher, which serves fresh pages from the HTTP
+cache, applies the per-host rate limit to the requests that do go out, uses the
+pooled session for the host and maps the response status to page text or an
+error. Requests to a host that keeps failing are paused by its circuit breaker.
+Both the blocking and the asyncio path retry the same way, waiting as long as
+the server asked for when it sent Retry-After.
+
+With a cassette active (see src.core.cassette), responses are recorded as they
+arrive, or replayed with no network, cache, rate limit or breaker involved.
+
+After each fetch `Fetcher.last_page` holds the raw body and its metadata, for
+callers that archive the server bytes rather than the decoded text.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+from tenacity import (retry, retry_if_exception_type, retry_if_not_exception_type, stop_after_attempt,
+                      wait_exponential)
+
+from .cassette import CassetteMiss, get_cassette
+from .circuit_breaker import get_circuit_breaker
+from .http_cache import get_http_cache
+from .rate_limit import get_rate_limiter
+from .sessions import get_session
+
+logger = logging.getLogger(__name__)
+
+MAX_RETRY_AFTER = 300
+
+_user_agent = None
+_user_agent_lock = threading.Lock()
+
+
+def get_user_agent():
+    """
+    Return the process-wide UserAgent. Building one loads its data file, so it
+    is done once, on first use, and shared by every scraper.
+    """
+    global _user_agent
+    if _user_agent is None:
+        with _user_agent_lock:
+            if _user_agent is None:
+                from fake_useragent import UserAgent
+                _user_agent = UserAgent()
+    return _user_agent
+
+
+class FetchError(Exception):
+    """A page could not be fetched."""
+
+    def __init__(self, message, url=None, status_code=None):
+        super().__init__(message)
+        self.url = url
+        self.status_code = status_code
+
+
+class ThrottledError(FetchError):
+    """
+    The server refused the request for now (429 or 503). `retry_after` is the
+    delay it advised in seconds, or None if it sent no Retry-After header.
+    """
+
+    def __init__(self, message, url=None, status_code=None, retry_after=None):
+        super().__init__(message, url, status_code)
+        self.retry_after = retry_after
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header given in seconds or as an HTTP date."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+class wait_retry_after:
+    """Tenacity wait that honors a server-advised delay, else uses `fallback`."""
+
+    def __init__(self, fallback):
+        self.fallback = fallback
+
+    def __call__(self, retry_state):
+        exc = retry_state.outcome.exception() if retry_state.outcome else None
+        if isinstance(exc, ThrottledError) and exc.retry_after is not None:
+            return exc.retry_after
+        return self.fallback(retry_state)
+
+
+fetch_retry = retry(stop=stop_after_attempt(5),
+                    wait=wait_retry_after(wait_exponential(multiplier=2, min=5, max=30)),
+                    # Cancellation and Ctrl-C are BaseExceptions and end the fetch
+                    retry=retry_if_exception_type(Exception) & retry_if_not_exception_type(CassetteMiss),
+                    reraise=True)
+
+
+class Fetcher:
+    """
+    Fetch pages over the shared per-host sessions.
+
+    `session`, `rate_limiter`, `cache` and `cassette` default to the
+    process-wide ones; pass them to pin a scraper to its own.
+    """
+
+    def __init__(self, session=None, rate_limiter=None, user_agent=None, cache=None,
+                 cassette=None):
+        self.session = session
+        self.rate_limiter = rate_limiter
+        self.ua = user_agent or get_user_agent()
+        self.cache = cache
+        self.cassette = cassette
+        self.last_page = None
+
+    def request_headers(self):
+        return {
+            "User-Agent": self.ua.random,
+            "Accept-Language": "en-US,en;q=0.9"
+        }
+
+    def _cassette(self):
+        return self.cassette or get_cassette()
+
+    def _lookup(self, url):
+        # An active cassette bypasses the cache so recordings hold full responses.
+        if self._cassette():
+            return None, None
+        cache = self.cache or get_http_cache()
+        entry = cache.lookup(url, self.request_headers()) if cache else None
+        return cache, entry
+
+    def _remember(self, url, status, content, encoding, content_type=None, etag=None,
+                  last_modified=None, from_cache=False):
+        self.last_page = {
+            "url": url,
+            "status": status,
+            "content": content,
+            "encoding": encoding,
+            "content_type": content_type,
+            "etag": etag,
+            "last_modified": last_modified,
+            "fetched_at": time.time(),
+            "from_cache": from_cache,
+        }
+
+    def _serve_cached(self, cache, entry):
+        content = cache.read_bytes(entry)
+        self._remember(entry["url"], entry["status"], content, entry.get("encoding"),
+                       entry.get("content_type"), entry.get("etag"), entry.get("last_modified"),
+                       from_cache=True)
+        return content.decode(entry.get("encoding") or "utf-8", errors="replace")
+
+    def _reserve(self, url):
+        delay = (self.rate_limiter or get_rate_limiter()).reserve(url)
+        if delay > 0:
+            logger.debug(f"Waiting {delay:.2f} seconds before request to {url}")
+        return delay
+
+    def _get(self, url, extra_headers=None):
+        session = self.session or get_session(url)
+        headers = self.request_headers()
+        headers.update(extra_headers or {})
+        response = session.get(url, headers=headers, timeout=10)
+        cassette = self._cassette()
+        if cassette:
+            cassette.record(url, response)
+        return response
+
+    def _replay(self, url):
+        return self.handle_response(url, self._cassette().play(url))
+
+    def _send(self, url, cache, entry):
+        breaker = get_circuit_breaker(url)
+        validators = cache.validators(entry) if entry else None
+        try:
+            page = self.handle_response(url, self._get(url, validators), cache, entry)
+        except ThrottledError as e:
+            breaker.record_failure(e.retry_after)
+            raise
+        except Exception:
+            breaker.record_failure()
+            raise
+        breaker.record_success()
+        return page
+
+    def handle_response(self, url, response, cache=None, entry=None):
+        """Map the HTTP status to page text, an empty page or an error."""
+        if response.status_code == 304 and entry:
+            logger.debug(f"Not modified, serving cached copy: {url}")
+            return self._serve_cached(cache, cache.refresh(entry, response))
+
+        if response.status_code == 404:
+            logger.warning(f"Page not found: {url} (404)")
+            self._remember(url, 404, b"", None)
+            return ""
+
+        if response.status_code in (429, 503):
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            if retry_after is not None:
+                retry_after = min(retry_after, MAX_RETRY_AFTER)
+            logger.warning(
+                f"Throttled by server ({response.status_code}), retry after "
+                f"{retry_after if retry_after is not None else 'backoff'}s ({url})")
+            raise ThrottledError(
+                f"Too many requests: {url} ({response.status_code})",
+                url, response.status_code, retry_after)
+
+        if response.status_code != 200:
+            logger.error(
+                f"Failed to fetch {url} (Status Code: {response.status_code})")
+            raise FetchError(
+                f"Failed to fetch {url} (Status Code: {response.status_code})",
+                url, response.status_code)
+
+        if cache:
+            cache.store(url, self.request_headers(), response)
+        self._remember(url, response.status_code, response.content,
+                       response.encoding or response.apparent_encoding,
+                       response.headers.get("Content-Type"), response.headers.get("ETag"),
+                       response.headers.get("Last-Modified"))
+        return response.text
+
+    @fetch_retry
+    def fetch(self, url):
+        """Fetch a web page with exponential backoff retry logic."""
+        cassette = self._cassette()
+        if cassette and cassette.replaying:
+            return self._replay(url)
+
+        cache, entry = self._lookup(url)
+        if entry and cache.is_fresh(entry):
+            logger.debug(f"Cache hit: {url}")
+            return self._serve_cached(cache, entry)
+
+        breaker = get_circuit_breaker(url)
+        while (pause := breaker.before_request()) > 0:
+            time.sleep(pause)
+        try:
+            time.sleep(self._reserve(url))
+            return self._send(url, cache, entry)
+        finally:
+            breaker.release_probe()
+
+    @fetch_retry
+    async def afetch(self, url):
+        """
+        Asyncio variant of fetch. The rate-limit wait and retry backoff are
+        awaited; cache I/O and the blocking request run in a worker thread.
+        """
+        cassette = self._cassette()
+        if cassette and cassette.replaying:
+            return await asyncio.to_thread(self._replay, url)
+
+        cache, entry = await asyncio.to_thread(self._lookup, url)
+        if entry and cache.is_fresh(entry):
+            logger.debug(f"Cache hit: {url}")
+            return await asyncio.to_thread(self._serve_cached, cache, entry)
+
+        breaker = get_circuit_breaker(url)
+        while (pause := breaker.before_request()) > 0:
+            await asyncio.sleep(pause)
+        try:
+            await asyncio.sleep(self._reserve(url))
+            return await asyncio.to_thread(self._send, url, cache, entry)
+        finally:
+            # A cancelled probe (e.g. by aiter_extract) must not keep the host closed
+            breaker.release_probe()
@@ -0,0 +1,246 @@
+"""
+Persistent crawl frontier.
+
+URLs move through pending -> in_flight -> done / failed in a SQLite table, so
+a crawl can stop at any point and resume where it left off. Higher priority
+URLs are handed out first.
+
+A Bloom filter kept next to the database answers "have we seen this URL?"
+in memory: add_many() only goes to SQLite for URLs the filter has not seen,
+so re-adding a crawl's known URLs costs no queries. The price is that a new
+URL colliding with the filter is skipped, with probability `error_rate`
+(0.1% by default); the filter is rebuilt twice as large whenever it holds
+more URLs than its capacity, so that rate holds as the frontier grows. The
+filter is also rebuilt from the table when its file is missing or does not
+match the table (e.g. after a crash).
+"""
+
+import hashlib
+import math
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Iterable, List
+
+PENDING = "pending"
+IN_FLIGHT = "in_flight"
+DONE = "done"
+FAILED = "failed"
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter over strings, using double hashing on blake2b."""
+
+    def __init__(self, capacity: int = 1_000_000, error_rate: float = 0.001):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.size = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, item: str):
+        digest = hashlib.blake2b(item.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return ((h1 + i * h2) % self.size for i in range(self.hashes))
+
+    def add(self, item: str):
+        for pos in self._positions(item):
+            self.bits[pos >> 3] |= 1 << (pos & 7)
+
+    def __contains__(self, item: str) -> bool:
+        return all(self.bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(item))
+
+    def save(self, path: str, count: int = 0):
+        """Write the filter to `path`, recording how many items it holds."""
+        header = f"{self.capacity} {self.error_rate} {count}\n".encode("ascii")
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(header)
+            f.write(self.bits)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str):
+        """Read a filter written by `save`; returns (filter, item count)."""
+        with open(path, "rb") as f:
+            try:
+                capacity, error_rate, count = f.readline().split()
+                bloom = cls(int(capacity), float(error_rate))
+            except ValueError:
+                raise ValueError(f"Corrupt Bloom filter file: {path}")
+            bits = f.read()
+        if len(bits) != len(bloom.bits):
+            raise ValueError(f"Corrupt Bloom filter file: {path}")
+        bloom.bits = bytearray(bits)
+        return bloom, int(count)
+
+
+class Frontier:
+    """
+    Usage:
+        frontier = Frontier("./data/current.frontier.db")
+        frontier.add_many(urls)
+        for url in frontier.claim(10):
+            ...
+            frontier.mark_done(url)
+        frontier.close()
+    """
+
+    def __init__(self, path: str, capacity: int = 1_000_000, error_rate: float = 0.001,
+                 save_every: int = 1000):
+        """
+        Args:
+            path: SQLite file for the frontier (the Bloom filter goes to <path>.bloom)
+            capacity: Expected number of URLs, used to size a new Bloom filter
+            error_rate: Bloom filter false-positive rate
+            save_every: Persist the Bloom filter after this many new URLs
+        """
+        self.path = path
+        self.bloom_path = f"{path}.bloom"
+        self.save_every = save_every
+        self._unsaved = 0
+        self._lock = threading.Lock()
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.executescript(
+            """CREATE TABLE IF NOT EXISTS frontier (
+                url TEXT PRIMARY KEY,
+                state TEXT NOT NULL,
+                priority INTEGER NOT NULL DEFAULT 0,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                error TEXT,
+                updated_at REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS frontier_next
+                ON frontier (state, priority DESC, updated_at);""")
+        self._conn.commit()
+        self.bloom = self._load_bloom(capacity, error_rate)
+        # URLs claimed by a crashed run go back to the queue
+        self.requeue_in_flight()
+
+    def _load_bloom(self, capacity, error_rate):
+        count = self._count()
+        try:
+            bloom, saved_count = BloomFilter.load(self.bloom_path)
+            if saved_count == count and count <= bloom.capacity:
+                self._urls = count
+                return bloom
+        except (FileNotFoundError, ValueError):
+            pass
+        return self._build_bloom(max(capacity, count * 2), error_rate)
+
+    def _build_bloom(self, capacity, error_rate):
+        bloom = BloomFilter(capacity, error_rate)
+        self._urls = 0
+        for (url,) in self._conn.execute("SELECT url FROM frontier"):
+            bloom.add(url)
+            self._urls += 1
+        return bloom
+
+    def seen(self, url: str) -> bool:
+        """True if `url` was ever added. Usually answered from memory alone."""
+        if url not in self.bloom:
+            return False
+        with self._lock:
+            return self._conn.execute(
+                "SELECT 1 FROM frontier WHERE url = ?", (url,)).fetchone() is not None
+
+    def add(self, url: str, priority: int = 0) -> bool:
+        """Queue `url` unless it was seen before. Returns True if it was new."""
+        return self.add_many([url], priority) == 1
+
+    def add_many(self, urls: Iterable[str], priority: int = 0, state: str = PENDING) -> int:
+        """
+        Queue every unseen URL in one transaction. Returns how many were new.
+        URLs already in the Bloom filter are skipped without a query.
+        """
+        now = time.time()
+        with self._lock:
+            rows = []
+            for url in urls:
+                url = url.strip()
+                if not url or url in self.bloom:
+                    continue
+                if self._urls + len(rows) >= self.bloom.capacity:
+                    # Grow before the filter fills up and starts skipping new URLs
+                    self.bloom = self._build_bloom(self.bloom.capacity * 2, self.bloom.error_rate)
+                    for row in rows:
+                        self.bloom.add(row[0])
+                    self._unsaved = self.save_every
+                self.bloom.add(url)
+                rows.append((url, state, priority, now))
+            cursor = self._conn.executemany(
+                "INSERT OR IGNORE INTO frontier (url, state, priority, updated_at) "
+                "VALUES (?, ?, ?, ?)", rows)
+            self._conn.commit()
+            added = cursor.rowcount if rows else 0
+            self._urls += added
+            self._unsaved += added
+            if self._unsaved >= self.save_every:
+                self._save_bloom()
+        return added
+
+    def claim(self, limit: int = 1) -> List[str]:
+        """Move up to `limit` pending URLs, highest priority first, to in_flight."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT url FROM frontier WHERE state = ? "
+                "ORDER BY priority DESC, updated_at LIMIT ?", (PENDING, limit)).fetchall()
+            urls = [row[0] for row in rows]
+            self._conn.executemany(
+                "UPDATE frontier SET state = ?, attempts = attempts + 1, updated_at = ? "
+                "WHERE url = ?", [(IN_FLIGHT, time.time(), url) for url in urls])
+            self._conn.commit()
+        return urls
+
+    def _set_state(self, url, state, error=None):
+        with self._lock:
+            self._conn.execute(
+                "UPDATE frontier SET state = ?, error = ?, updated_at = ? WHERE url = ?",
+                (state, error, time.time(), url))
+            self._conn.commit()
+
+    def mark_done(self, url: str):
+        self._set_state(url, DONE)
+
+    def mark_failed(self, url: str, error: str = None):
+        self._set_state(url, FAILED, error)
+
+    def requeue_in_flight(self) -> int:
+        """Return in_flight URLs to pending (e.g. after a crash)."""
+        return self._requeue(IN_FLIGHT)
+
+    def retry_failed(self) -> int:
+        """Return failed URLs to pending."""
+        return self._requeue(FAILED)
+
+    def _requeue(self, state):
+        with self._lock:
+            cursor = self._conn.execute(
+                "UPDATE frontier SET state = ?, updated_at = ? WHERE state = ?",
+                (PENDING, time.time(), state))
+            self._conn.commit()
+        return cursor.rowcount
+
+    def counts(self) -> Dict[str, int]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT state, COUNT(*) FROM frontier GROUP BY state").fetchall()
+        counts = {PENDING: 0, IN_FLIGHT: 0, DONE: 0, FAILED: 0}
+        counts.update(dict(rows))
+        return counts
+
+    def _count(self):
+        return self._conn.execute("SELECT COUNT(*) FROM frontier").fetchone()[0]
+
+    def _save_bloom(self):
+        self.bloom.save(self.bloom_path, self._count())
+        self._unsaved = 0
+
+    def close(self):
+        with self._lock:
+            self._save_bloom()
+            self._conn.close()
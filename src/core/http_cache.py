@@ -0,0 +1,161 @@
+"""
+On-disk HTTP response cache for the fetch layer.
+
+Entries are keyed by URL plus the request headers that change the response.
+Bodies are stored content-addressed (by SHA-256), so identical pages are kept
+once. Fresh entries are served without touching the network; stale ones are
+revalidated with If-None-Match / If-Modified-Since, and a 304 only refreshes
+the stored entry.
+
+Layout:
+    <directory>/meta/<key[:2]>/<key>.json
+    <directory>/bodies/<digest[:2]>/<digest>
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from typing import Any, Dict, Optional
+
+DEFAULT_TTL = 24 * 60 * 60
+VARY_HEADERS = ("Accept", "Accept-Language")
+CACHE_DIR_ENV = "SCRAPER_HTTP_CACHE"
+
+
+def _write_atomic(path, data: bytes):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+class HttpCache:
+    """
+    Usage:
+        cache = HttpCache("./data/http_cache", ttl=3600)
+        entry = cache.lookup(url, headers)
+        if entry and cache.is_fresh(entry):
+            html = cache.read_text(entry)
+    """
+
+    def __init__(self, directory: str, ttl: Optional[float] = DEFAULT_TTL):
+        """
+        Args:
+            directory: Root directory of the cache
+            ttl: Seconds an entry is served without revalidation (None: forever)
+        """
+        self.directory = directory
+        self.ttl = ttl
+
+    def key(self, url: str, headers: Optional[Dict[str, str]] = None) -> str:
+        headers = headers or {}
+        parts = [url] + [f"{name}: {headers.get(name, '')}" for name in VARY_HEADERS]
+        return hashlib.sha256("\n".join(parts).encode("utf-8")).hexdigest()
+
+    def _meta_path(self, key):
+        return os.path.join(self.directory, "meta", key[:2], f"{key}.json")
+
+    def _body_path(self, digest):
+        return os.path.join(self.directory, "bodies", digest[:2], digest)
+
+    def lookup(self, url: str, headers: Optional[Dict[str, str]] = None) -> Optional[Dict[str, Any]]:
+        """Return the stored entry for the request, or None."""
+        try:
+            with open(self._meta_path(self.key(url, headers)), "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+        if not os.path.exists(self._body_path(entry["digest"])):
+            return None
+        return entry
+
+    def is_fresh(self, entry: Dict[str, Any]) -> bool:
+        if self.ttl is None:
+            return True
+        return time.time() - entry["stored_at"] < self.ttl
+
+    @staticmethod
+    def validators(entry: Dict[str, Any]) -> Dict[str, str]:
+        """Conditional request headers for revalidating a stale entry."""
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def read_bytes(self, entry: Dict[str, Any]) -> bytes:
+        with open(self._body_path(entry["digest"]), "rb") as f:
+            return f.read()
+
+    def read_text(self, entry: Dict[str, Any]) -> str:
+        return self.read_bytes(entry).decode(entry.get("encoding") or "utf-8", errors="replace")
+
+    def store(self, url: str, headers: Optional[Dict[str, str]], response) -> Optional[Dict[str, Any]]:
+        """Store a 200 response. Responses marked no-store are skipped."""
+        if "no-store" in response.headers.get("Cache-Control", ""):
+            return None
+
+        body = response.content
+        digest = hashlib.sha256(body).hexdigest()
+        body_path = self._body_path(digest)
+        if not os.path.exists(body_path):
+            _write_atomic(body_path, body)
+
+        entry = {
+            "url": url,
+            "key": self.key(url, headers),
+            "status": response.status_code,
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+            "content_type": response.headers.get("Content-Type"),
+            "encoding": response.encoding or response.apparent_encoding,
+            "digest": digest,
+            "size": len(body),
+            "stored_at": time.time(),
+        }
+        self._write_entry(entry)
+        return entry
+
+    def refresh(self, entry: Dict[str, Any], response) -> Dict[str, Any]:
+        """Mark an entry fresh again after a 304 Not Modified."""
+        entry = dict(entry, stored_at=time.time())
+        entry["etag"] = response.headers.get("ETag") or entry.get("etag")
+        entry["last_modified"] = response.headers.get("Last-Modified") or entry.get("last_modified")
+        self._write_entry(entry)
+        return entry
+
+    def _write_entry(self, entry):
+        _write_atomic(self._meta_path(entry["key"]),
+                      json.dumps(entry, ensure_ascii=False).encode("utf-8"))
+
+
+_http_cache: Optional[HttpCache] = None
+_configured = False
+_lock = threading.Lock()
+
+
+def configure_http_cache(directory: Optional[str], ttl: Optional[float] = DEFAULT_TTL):
+    """Enable the process-wide cache in `directory`, or disable it with None."""
+    global _http_cache, _configured
+    with _lock:
+        _http_cache = HttpCache(directory, ttl) if directory else None
+        _configured = True
+
+
+def get_http_cache() -> Optional[HttpCache]:
+    """
+    Return the process-wide cache. Unless configured explicitly it is enabled
+    by the SCRAPER_HTTP_CACHE environment variable, and off otherwise.
+    """
+    if not _configured:
+        configure_http_cache(os.environ.get(CACHE_DIR_ENV))
+    return _http_cache
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional
 
 class IDataExtractor(ABC):
     """
@@ -17,7 +17,7 @@ class IDataExtractor(ABC):
         pass
 
     @abstractmethod
-    def save(self, data: List[Dict[str, Any]], output_path: str):
+    def save(self, data: Iterable[Dict[str, Any]], output_path: str):
         """
         Save the extracted data to a file.
         """
@@ -1,52 +1,30 @@
-import fitz
-import re
-import json
+from .mcq_grammar import KIRAN, compile_grammar
+from .services import pdf_service as services
+from .sinks import JSONSink
 
 
-class PDFService:
-    def __init__(self, pdf_path):
-        self.pdf_path = pdf_path
+class PDFService(services.PDFService):
+    """
+    The shared PDFService (page cache, worker processes), with extract_text
+    still returning {page_num: text} as this module's own service did.
+    """
 
     def extract_text(self, pages=None):
-        extracted_text = {}
-        try:
-            doc = fitz.open(self.pdf_path)  # Open the PDF document
-            target_pages = range(doc.page_count) if pages is None else pages
-            for page_num in target_pages:
-                page = doc[page_num]
-                text = page.get_text("text")
-                extracted_text[page_num] = text
-
-            doc.close()  # Close the PDF document
-        except Exception as e:
-            print(f"Error opening or processing PDF: {e}")
-            return None  # Or handle the error as needed
-
-        return extracted_text
+        return self.extract_text_dict(pages)
 
 
 class MCQExtractor:
     def __init__(self, pdf_service: PDFService):
         self.pdf_service = pdf_service
+        self.scanner = compile_grammar(KIRAN)
         self.mcqs = []
 
     def process_mcqs(self, text):
-        mcq_pattern = re.compile(
-            r"^\s*(\d+)\.\s*(.*?)\s*\(1\)\s*([^()]+?)\s*\(2\)\s*([^()]+?)\s*\(3\)\s*([^()]+?)\s*(?:\(4\)\s*([^()]+?))?",
-            re.MULTILINE
-        )
-
-        matches = mcq_pattern.findall(text)
-        for match in matches:
-            # Ensure we have exactly 6 values (filling missing options with an empty string)
-            match = list(match)  # Convert tuple to list to modify it
-            while len(match) < 6:
-                match.append('')
-
-            question_no, question, a, b, c, d = map(str.strip, match)
+        for groups in self.scanner.questions(text):
+            a, b, c, d = self.scanner.inline_options(groups)
             self.mcqs.append({
-                "question_no": question_no,
-                "question": question,
+                "question_no": groups["no"].strip(),
+                "question": groups["question"].strip(),
                 "a": a,
                 "b": b,
                 "c": c,
@@ -54,18 +32,14 @@ class MCQExtractor:
             })
 
     def process_answers(self, text):
-        answer_pattern = re.compile(
-            r"(\d+)\.\s+\((\d)\)"
-        )
-        matches = answer_pattern.findall(text)
         self.answer_dict = {}
-        for question_no, answer in matches:
-            self.answer_dict[question_no] = answer
+        for groups, _ in self.scanner.answers(text):
+            self.answer_dict[groups["no"]] = groups["answer"]
         print(len(self.answer_dict.items()))
 
     def to_json(self, output_path="mcqs.json"):
-        with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(self.mcqs, f, indent=4, ensure_ascii=False)
+        with JSONSink(output_path) as sink:
+            sink.write_many(self.mcqs)
 
     def run(self, pages=None):
         text = self.pdf_service.extract_text(pages)
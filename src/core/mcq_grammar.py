@@ -0,0 +1,196 @@
+"""
+Declarative MCQ book formats.
+
+Question banks differ in how they write a question, an option, an answer-key
+entry and where an explanation ends. An MCQGrammar states those as data and
+compile_grammar() turns it into an MCQScanner, once per grammar, shared by
+every extractor reading that format. Supporting a new book is a new grammar.
+
+Two styles are supported:
+
+* regex: `question` matches one question (named groups `no`, `question`, and
+  `a`..`f` when options are written inline); `option` matches one option
+  inside a question; `answer` matches one answer-key entry (groups `no`,
+  `answer`), which owns the text up to the next entry as its explanation
+  when `explanation` is set.
+* markers: a record is `question_marker`, the `option_markers` in order,
+  then `answer_marker` followed by `answer_letter` (a regex, group 1); the
+  rest, up to the next question marker, is the explanation. Scanned with
+  str.find, keeping the next occurrence of every marker, so no part of the
+  text is searched twice for the same marker: linear time, even when a
+  whole block sits on one line.
+
+Patterns are regex strings with inline flags, e.g. "(?m)^...".
+"""
+
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from .segments import segments
+
+OPTION_KEYS = "abcdef"
+
+
+@dataclass(frozen=True)
+class MCQGrammar:
+    question: Optional[str] = None
+    option: Optional[str] = None
+    answer: Optional[str] = None
+    explanation: bool = False
+    question_marker: Optional[str] = None
+    option_markers: Tuple[str, ...] = ()
+    answer_marker: Optional[str] = None
+    answer_letter: Optional[str] = None
+
+
+# Numbered questions on their own line, "(a)" option lines, then an answer
+# key of "Q12.B" entries each followed by its explanation
+NUMBERED = MCQGrammar(
+    question=r"(?ms)^\s*(?P<no>\d+)\.\s*\n(?P<question>.*?)(?=\n\s*\d+\.\s*\n|\Z)",
+    option=r"(?m)^\([a-f]\)\s*(.+)$",
+    answer=r"(?ms)^Q\s*(?P<no>\d+)\.(?P<answer>[A-F | a-f])",
+    explanation=True,
+)
+
+# Arihant: "12. question (a) .. (b) .. (c) .. (d) ..", answer key "12. (b)"
+ARIHANT = MCQGrammar(
+    question=r"(?ms)^(?P<no>\d+)\.\s*(?P<question>.*?)\s*\(a\)\s*(?P<a>.*?)\s*\(b\)\s*(?P<b>.*?)"
+             r"\s*\(c\)\s*(?P<c>.*?)\s*\(d\)\s*(?P<d>.*?)$",
+    answer=r"(?m)^(?P<no>\d+)\.\s*\((?P<answer>\w)\)",
+)
+
+# Kiran: options numbered (1) to (4), answer key "12. (3)"
+KIRAN = MCQGrammar(
+    question=r"(?m)^\s*(?P<no>\d+)\.\s*(?P<question>.*?)\s*\(1\)\s*(?P<a>[^()]+?)\s*\(2\)\s*(?P<b>[^()]+?)"
+             r"\s*\(3\)\s*(?P<c>[^()]+?)\s*(?:\(4\)\s*(?P<d>[^()]+?))?",
+    answer=r"(?P<no>\d+)\.\s+\((?P<answer>\d)\)",
+)
+
+# DGGCA: "Q) .. A. .. B. .. C. .. D. .. Answer: B. explanation"
+DGGCA = MCQGrammar(
+    question_marker="Q)",
+    option_markers=("A.", "B.", "C.", "D."),
+    answer_marker="Answer:",
+    answer_letter=r"\s*([A-D])\.",
+)
+
+
+def _compile(pattern):
+    return re.compile(pattern) if pattern else None
+
+
+class MCQScanner:
+    def __init__(self, grammar: MCQGrammar):
+        self.grammar = grammar
+        self.question = _compile(grammar.question)
+        self.option = _compile(grammar.option)
+        self.answer = _compile(grammar.answer)
+        self.answer_letter = _compile(grammar.answer_letter)
+        self.marks = grammar.option_markers + (grammar.answer_marker,)
+
+    def questions(self, text: str) -> Iterator[Dict[str, Optional[str]]]:
+        """Yield the named groups of every question match."""
+        for match in self.question.finditer(text):
+            yield match.groupdict()
+
+    def split_options(self, text: str) -> Tuple[str, List[str]]:
+        """Return `text` without its option lines, and the options, in one pass."""
+        rest, options, last = [], [], 0
+        for match in self.option.finditer(text):
+            rest.append(text[last:match.start()])
+            options.append(match.group(1))
+            last = match.end()
+        rest.append(text[last:])
+        return "".join(rest), options
+
+    @staticmethod
+    def inline_options(groups: Dict[str, Optional[str]]) -> List[str]:
+        """Stripped a..f groups of a question match; options it did not reach are ""."""
+        return [(groups[key] or "").strip() for key in OPTION_KEYS if key in groups]
+
+    def answers(self, text: str) -> Iterator[Tuple[Dict[str, Optional[str]], Optional[str]]]:
+        """Yield (groups, explanation) per answer-key entry; explanation is None without them."""
+        if not self.grammar.explanation:
+            for match in self.answer.finditer(text):
+                yield match.groupdict(), None
+            return
+        for match, end in segments(self.answer, text):
+            yield match.groupdict(), text[match.end():end].strip()
+
+    def records(self, content: str,
+                on_malformed: Optional[Callable[[str, str], Any]] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Yield {question, options, answer, explanation} per marker-style record.
+        A record cut short by the next question marker or the end of the text
+        is passed to on_malformed(text, reason) and skipped.
+        """
+        question_mark, marks = self.grammar.question_marker, self.marks
+        waiting, explanation = -1, len(marks)
+        state, bounds, start, body = waiting, [], 0, 0
+        pos, size = 0, len(content)
+        # Next occurrence of each marker at or after the last search (size: none)
+        found = {}
+
+        def next_at(mark):
+            at = found.get(mark, -1)
+            if at < pos:
+                at = content.find(mark, pos)
+                found[mark] = at = size if at == -1 else at
+            return at
+
+        def malformed(end, reason):
+            if on_malformed is not None:
+                on_malformed(content[start:end], reason)
+
+        while True:
+            next_question = next_at(question_mark)
+            expected = marks[state] if 0 <= state < len(marks) else None
+            hit = next_at(expected) if expected else size
+
+            if hit < next_question:
+                bounds.append((hit, hit + len(expected)))
+                pos = hit + len(expected)
+                state += 1
+                if state == explanation:
+                    letter = self.answer_letter.match(content, pos)
+                    if letter is None:
+                        malformed(pos, f"no answer letter after {expected}")
+                        state = waiting
+                        continue
+                    bounds.append(letter.span(1))
+                    pos = body = letter.end()
+                continue
+
+            if next_question == size:
+                break
+            if state == explanation:
+                yield self._record(content, bounds, body, next_question)
+            elif state != waiting:
+                malformed(next_question, f"missing {expected}")
+            state, bounds, start = 0, [(next_question, next_question + len(question_mark))], next_question
+            pos = next_question + len(question_mark)
+
+        if state == explanation:
+            yield self._record(content, bounds, body, size)
+        elif state != waiting:
+            malformed(size, f"missing {marks[state]}")
+
+    @staticmethod
+    def _record(content, bounds, explanation_start, end):
+        # Each field runs from the end of its marker to the start of the next
+        fields = [content[bounds[i][1]:bounds[i + 1][0]].strip() for i in range(len(bounds) - 2)]
+        letter_start, letter_end = bounds[-1]
+        return {
+            "question": fields[0],
+            "options": fields[1:],
+            "answer": content[letter_start:letter_end],
+            "explanation": content[explanation_start:end].strip(),
+        }
+
+
+@lru_cache(maxsize=None)
+def compile_grammar(grammar: MCQGrammar) -> MCQScanner:
+    """The scanner for `grammar`, compiled on first use and shared afterwards."""
+    return MCQScanner(grammar)
@@ -0,0 +1,147 @@
+"""
+Persistent cache of extracted PDF page text.
+
+Entries are keyed by the PDF's SHA-256, page number, extraction mode and the
+PyMuPDF version, so a renamed or copied file still hits, and an edited file
+or a MuPDF upgrade misses. Re-running a parser after changing only its
+regexes then skips MuPDF entirely.
+
+Enable it for a run with the SCRAPER_PAGE_CACHE environment variable (a
+SQLite file) or configure_page_cache(); warm or inspect it with
+src/scripts/page_cache.py.
+"""
+
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+
+PAGE_CACHE_ENV = "SCRAPER_PAGE_CACHE"
+HASH_CHUNK_SIZE = 1 << 20
+
+_digests: Dict[Tuple[str, float, int], str] = {}
+
+
+def file_sha256(path: str) -> str:
+    """SHA-256 of a file, remembered per (path, mtime, size) for this process."""
+    stat = os.stat(path)
+    key = (os.path.abspath(path), stat.st_mtime, stat.st_size)
+    if key not in _digests:
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            while chunk := f.read(HASH_CHUNK_SIZE):
+                digest.update(chunk)
+        _digests[key] = digest.hexdigest()
+    return _digests[key]
+
+
+class PageTextCache:
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.executescript(
+            """CREATE TABLE IF NOT EXISTS pages (
+                pdf_sha256 TEXT NOT NULL,
+                page INTEGER NOT NULL,
+                mode TEXT NOT NULL,
+                engine TEXT NOT NULL,
+                text TEXT NOT NULL,
+                stored_at REAL NOT NULL,
+                PRIMARY KEY (pdf_sha256, mode, engine, page)
+            );
+            CREATE TABLE IF NOT EXISTS documents (
+                pdf_sha256 TEXT PRIMARY KEY,
+                path TEXT NOT NULL,
+                page_count INTEGER
+            );""")
+        self._conn.commit()
+
+    def get_many(self, digest: str, pages: Iterable[int], mode: str, engine: str) -> Dict[int, str]:
+        """Return {page: text} for the requested pages that are cached."""
+        pages = list(pages)
+        if not pages:
+            return {}
+        found = {}
+        with self._lock:
+            # Stay under SQLite's bound-parameter limit
+            for start in range(0, len(pages), 500):
+                chunk = pages[start:start + 500]
+                rows = self._conn.execute(
+                    f"SELECT page, text FROM pages WHERE pdf_sha256 = ? AND mode = ? AND engine = ? "
+                    f"AND page IN ({','.join('?' * len(chunk))})",
+                    (digest, mode, engine, *chunk)).fetchall()
+                found.update(rows)
+        return found
+
+    def put_many(self, digest: str, texts: Dict[int, str], mode: str, engine: str):
+        now = time.time()
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO pages VALUES (?, ?, ?, ?, ?, ?)",
+                [(digest, page, mode, engine, text, now) for page, text in texts.items()])
+            self._conn.commit()
+
+    def remember_document(self, digest: str, path: str, page_count: Optional[int] = None):
+        """Record where a PDF lives; a page_count of None keeps the one stored."""
+        with self._lock:
+            self._conn.execute(
+                """INSERT INTO documents VALUES (?, ?, ?)
+                   ON CONFLICT (pdf_sha256) DO UPDATE SET
+                       path = excluded.path,
+                       page_count = COALESCE(excluded.page_count, page_count)""",
+                (digest, os.path.abspath(path), page_count))
+            self._conn.commit()
+
+    def stats(self) -> List[Tuple]:
+        """Per document and engine: (sha256, path, page_count, mode, engine, cached pages, bytes)."""
+        with self._lock:
+            return self._conn.execute(
+                """SELECT p.pdf_sha256, d.path, d.page_count, p.mode, p.engine,
+                          COUNT(*), SUM(LENGTH(CAST(p.text AS BLOB)))
+                   FROM pages p LEFT JOIN documents d ON d.pdf_sha256 = p.pdf_sha256
+                   GROUP BY p.pdf_sha256, p.mode, p.engine
+                   ORDER BY d.path""").fetchall()
+
+    def clear(self, digest: Optional[str] = None) -> int:
+        """Drop the pages of one PDF, or everything. Returns the number of pages removed."""
+        with self._lock:
+            if digest:
+                cursor = self._conn.execute("DELETE FROM pages WHERE pdf_sha256 = ?", (digest,))
+                self._conn.execute("DELETE FROM documents WHERE pdf_sha256 = ?", (digest,))
+            else:
+                cursor = self._conn.execute("DELETE FROM pages")
+                self._conn.execute("DELETE FROM documents")
+            self._conn.commit()
+        return cursor.rowcount
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+_page_cache: Optional[PageTextCache] = None
+_configured = False
+_lock = threading.Lock()
+
+
+def configure_page_cache(path: Optional[str]):
+    """Enable the process-wide page cache in SQLite file `path`, or disable it with None."""
+    global _page_cache, _configured
+    with _lock:
+        _page_cache = PageTextCache(path) if path else None
+        _configured = True
+
+
+def get_page_cache() -> Optional[PageTextCache]:
+    """
+    Return the process-wide page cache. Unless configured explicitly it is
+    enabled by the SCRAPER_PAGE_CACHE environment variable, and off otherwise.
+    """
+    if not _configured:
+        configure_page_cache(os.environ.get(PAGE_CACHE_ENV))
+    return _page_cache
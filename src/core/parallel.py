@@ -0,0 +1,63 @@
+"""
+Batch fan-out to a process pool for CPU-bound work (re-parsing archives,
+PDF pages, ...).
+
+Items are grouped into batches so each task carries enough work to pay for
+pickling, and at most `window` batches are in flight so a multi-GB input is
+never read into memory ahead of the workers.
+"""
+
+import itertools
+import os
+from collections import deque
+from concurrent.futures import Executor, FIRST_COMPLETED, ProcessPoolExecutor, wait
+from contextlib import ExitStack
+from typing import Callable, Iterable, Iterator, List, Optional, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def batched(items: Iterable[T], batch_size: int) -> Iterator[List[T]]:
+    iterator = iter(items)
+    while batch := list(itertools.islice(iterator, batch_size)):
+        yield batch
+
+
+def map_batches(fn: Callable[[List[T]], R], items: Iterable[T], workers: Optional[int] = None,
+                batch_size: int = 50, ordered: bool = True,
+                window: Optional[int] = None, executor: Optional[Executor] = None) -> Iterator[R]:
+    """
+    Yield fn(batch) for consecutive batches of `items`, computed in a pool of
+    `workers` processes (all cores by default; 1 runs inline).
+
+    Args:
+        fn: Module-level function taking a list of items (it must be picklable)
+        ordered: Yield results in input order; False yields them as they finish
+        window: Maximum batches in flight (default: 2 per worker)
+        executor: Pool to submit to instead of starting one; it is left
+            running, so one pool can serve several calls
+    """
+    workers = workers or os.cpu_count() or 1
+    batches = batched(items, batch_size)
+    if workers == 1:
+        yield from map(fn, batches)
+        return
+
+    window = window or workers * 2
+    with ExitStack() as stack:
+        pool = executor or stack.enter_context(ProcessPoolExecutor(max_workers=workers))
+        pending = deque(pool.submit(fn, batch) for batch in itertools.islice(batches, window))
+        while pending:
+            if ordered:
+                done = [pending.popleft()]
+            else:
+                finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+                done = [future for future in pending if future in finished]
+                for future in done:
+                    pending.remove(future)
+            for future in done:
+                yield future.result()
+                batch = next(batches, None)
+                if batch is not None:
+                    pending.append(pool.submit(fn, batch))
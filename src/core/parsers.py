@@ -0,0 +1,89 @@
+"""
+HTML parser backend selection for pre_parse.
+
+Recipes keep using the BeautifulSoup API (select, find_all, find_next_sibling,
+...); only the tree builder underneath changes. "html.parser" is the pure
+Python default, "lxml" is several times faster when installed
+(`pip install lxml`). Unavailable backends fall back to html.parser.
+
+The backend is picked, in order, from the recipe (`parser` class attribute or
+`parser=` keyword), the process-wide default set with `set_default_parser`,
+and the SCRAPER_PARSER environment variable.
+
+Recipes can also declare the regions of the page they need (`parse_only`, a
+SoupStrainer or `Regions` of several); only those subtrees are then built.
+"""
+
+import logging
+import os
+import re
+from typing import Optional
+
+from bs4 import BeautifulSoup, SoupStrainer
+from bs4.builder import builder_registry
+from bs4.filter import ElementFilter
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PARSER = "html.parser"
+PARSER_ENV = "SCRAPER_PARSER"
+
+_default_parser: Optional[str] = None
+_unavailable = set()
+
+
+def set_default_parser(name: Optional[str]):
+    """Use `name` for every recipe that does not pick a parser itself (None resets)."""
+    global _default_parser
+    if name is not None and builder_registry.lookup(name) is None:
+        raise ValueError(f"Unknown or unavailable HTML parser: {name}")
+    _default_parser = name
+
+
+def get_default_parser() -> str:
+    return _default_parser or os.environ.get(PARSER_ENV) or DEFAULT_PARSER
+
+
+def resolve_parser(name: Optional[str] = None) -> str:
+    """Return the backend to use, falling back to html.parser if `name` is not installed."""
+    name = name or get_default_parser()
+    if builder_registry.lookup(name) is None:
+        if name not in _unavailable:
+            _unavailable.add(name)
+            logger.warning(f"HTML parser {name!r} is not available, using {DEFAULT_PARSER}")
+        return DEFAULT_PARSER
+    return name
+
+
+def has_class(class_name: str):
+    """
+    Class matcher for SoupStrainer. While parsing, `class` is still the raw
+    attribute string, so a plain class_="x" misses class="x y".
+    """
+    return re.compile(rf"(?:^|\s){re.escape(class_name)}(?:\s|$)")
+
+
+class Regions(ElementFilter):
+    """
+    parse_only filter that keeps every region matched by any of `strainers`:
+        Regions(SoupStrainer(class_=has_class("wpProQuiz_listItem")), SoupStrainer("script"))
+    """
+
+    def __init__(self, *strainers: SoupStrainer):
+        super().__init__()
+        self.strainers = strainers
+
+    @property
+    def excludes_everything(self) -> bool:
+        return all(strainer.excludes_everything for strainer in self.strainers)
+
+    def allow_tag_creation(self, nsprefix, name, attrs) -> bool:
+        return any(strainer.allow_tag_creation(nsprefix, name, attrs) for strainer in self.strainers)
+
+    def allow_string_creation(self, string) -> bool:
+        return any(strainer.allow_string_creation(string) for strainer in self.strainers)
+
+
+def make_soup(html_content, parser: Optional[str] = None, parse_only=None) -> BeautifulSoup:
+    """Build a BeautifulSoup tree with the selected backend."""
+    return BeautifulSoup(html_content, resolve_parser(parser), parse_only=parse_only)
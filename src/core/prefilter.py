@@ -0,0 +1,53 @@
+"""
+Literal prefilter for multi-branch patterns.
+
+A pattern like "Ans: (b)|Solution - c|Correct Answer: d|..." makes the regex
+engine try every branch at every position of the text. When each match has
+to start with one of a few literals ("Ans", "Sol", "Correct"), those are
+located with str.find, which skips through the text several times faster,
+and the pattern is only tried where one of them starts. search() returns exactly
+what pattern.search() would.
+
+The text is scanned in windows that double in size, so a match near the
+start of a long text is found without looking at the rest of it. Texts
+shorter than the first window are searched directly, as the finds cost more
+than they save there.
+"""
+
+import re
+from typing import Iterable, Iterator, Optional, Match
+
+FIRST_WINDOW = 4096
+
+
+class PrefilteredPattern:
+    def __init__(self, pattern: str, literals: Iterable[str], flags: int = 0):
+        """`literals` must include a prefix of every possible match of `pattern`."""
+        self.pattern = re.compile(pattern, flags)
+        self.literals = tuple(literals)
+
+    def candidates(self, text: str, pos: int = 0) -> Iterator[int]:
+        """Yield, in order, every position from `pos` where one of the literals starts."""
+        size, window = len(text), FIRST_WINDOW
+        while pos < size:
+            stop = min(size, pos + window)
+            hits = []
+            for literal in self.literals:
+                # Occurrences starting before `stop`, even if they run past it
+                limit = min(size, stop + len(literal) - 1)
+                at = text.find(literal, pos, limit)
+                while at != -1:
+                    hits.append(at)
+                    at = text.find(literal, at + 1, limit)
+            yield from sorted(set(hits))
+            pos, window = stop, window * 2
+
+    def search(self, text: str, pos: int = 0) -> Optional[Match]:
+        if len(text) - pos < FIRST_WINDOW:
+            return self.pattern.search(text, pos)
+        match = self.pattern.match
+        for at in self.candidates(text, pos):
+            found = match(text, at)
+            if found:
+                return found
+        return None
@@ -0,0 +1,124 @@
+"""
+Per-host request rate limiting.
+
+The fetch layer asks the limiter for a slot before every network request. The
+limit is expressed as requests per second per host (with a burst allowance),
+and is shared by every thread and scraper instance in the process.
+"""
+
+import random
+import threading
+import time
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+DEFAULT_RATE = 0.5
+DEFAULT_BURST = 1
+DEFAULT_JITTER = 0.5
+
+
+class TokenBucket:
+    """
+    Token bucket that hands out reservations instead of blocking.
+
+    `reserve()` takes a token (going into debt if none is left) and returns how
+    long the caller must wait before using it, so it works for both threads
+    (time.sleep) and coroutines (asyncio.sleep).
+    """
+
+    def __init__(self, rate: float, burst: int = 1, jitter: float = 0.0):
+        self.rate = rate
+        self.burst = burst
+        self.jitter = jitter
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        if not self.rate:
+            return 0.0
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        # Jitter only shifts when the caller fires; it does not cost throughput.
+        return wait + random.uniform(0, self.jitter) if self.jitter else wait
+
+
+class HostRateLimiter:
+    """
+    Token buckets keyed by host, with a default limit and per-host overrides.
+
+    Usage:
+        limiter = get_rate_limiter()
+        limiter.configure("gst.jamku.app", rate=2, burst=3)
+        delay = limiter.reserve(url)
+    """
+
+    def __init__(self, rate: Optional[float] = DEFAULT_RATE, burst: int = DEFAULT_BURST,
+                 jitter: float = DEFAULT_JITTER):
+        self._default = (rate, burst, jitter)
+        self._limits: Dict[str, Tuple[Optional[float], int, float]] = {}
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def configure(self, host: Optional[str] = None, rate: Optional[float] = None,
+                  burst: Optional[int] = None, jitter: Optional[float] = None):
+        """
+        Set the limit for `host`, or the default limit when no host is given.
+        A rate of 0 disables limiting.
+        """
+        host = host.lower() if host else None
+        with self._lock:
+            current = self._limits.get(host, self._default) if host else self._default
+            limit = (
+                current[0] if rate is None else rate,
+                current[1] if burst is None else burst,
+                current[2] if jitter is None else jitter,
+            )
+            if host:
+                self._limits[host] = limit
+                self._buckets.pop(host, None)
+            else:
+                self._default = limit
+                self._buckets = {h: b for h, b in self._buckets.items() if h in self._limits}
+
+    def _bucket(self, host):
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            with self._lock:
+                bucket = self._buckets.get(host)
+                if bucket is None:
+                    rate, burst, jitter = self._limits.get(host, self._default)
+                    bucket = self._buckets[host] = TokenBucket(rate, burst, jitter)
+        return bucket
+
+    def reserve(self, url: str) -> float:
+        """Reserve a request slot for the host of `url`; return seconds to wait."""
+        return self._bucket(urlsplit(url).netloc.lower()).reserve()
+
+    def acquire(self, url: str) -> float:
+        """Block until a request slot for the host of `url` is available."""
+        delay = self.reserve(url)
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+
+_rate_limiter = HostRateLimiter()
+
+
+def get_rate_limiter() -> HostRateLimiter:
+    """Return the process-wide rate limiter."""
+    return _rate_limiter
+
+
+def set_rate_limiter(limiter):
+    """
+    Replace the process-wide rate limiter. Any object with a
+    `reserve(url) -> seconds` method can be plugged in.
+    """
+    global _rate_limiter
+    _rate_limiter = limiter
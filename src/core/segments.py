@@ -0,0 +1,25 @@
+"""
+Offset-based text segmentation.
+
+Question banks are split by heading patterns (units, sub-units, question
+numbers, answer-key entries): each heading owns the text up to the next one.
+Pairing consecutive matches of a single finditer pass keeps that linear,
+instead of searching again from every heading.
+"""
+
+from typing import Iterator, Match, Pattern, Tuple
+
+
+def segments(pattern: Pattern, text: str) -> Iterator[Tuple[Match, int]]:
+    """
+    Yield (match, end) for every match of `pattern` in `text`, where `end`
+    is the start of the next match (or the end of the text), so a
+    segment's body is text[match.end():end].
+    """
+    previous = None
+    for match in pattern.finditer(text):
+        if previous is not None:
+            yield previous, match.start()
+        previous = match
+    if previous is not None:
+        yield previous, len(text)
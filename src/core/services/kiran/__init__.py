@@ -1,85 +1,51 @@
 from core.services.pdf_service import PDFService
 from core.services.mcq_service import MCQExtractor
-from core import re
+from ...mcq_grammar import NUMBERED, compile_grammar
 
 
 class GenericMCQExtractor(MCQExtractor):
+    # Override to read a differently written book
+    grammar = NUMBERED
+
     def __init__(self, pdf_service, **kwargs):
-        super().__init__(**kwargs)
-        self.pdf_service = pdf_service
+        super().__init__(pdf_service=pdf_service, **kwargs)
+        self.scanner = compile_grammar(self.grammar)
         self.questions = {}
         self.explanations = {}
         self.mcqs = []
         self.text = ""
 
-    def get_mcq_pattern(self):
-        """Override this method to change how MCQs are detected."""
-        return re.compile(r"^\s*(\d+)\.\s*\n(.*?)(?=\n\s*\d+\.\s*\n|\Z)", re.DOTALL | re.MULTILINE)
-
-    def get_explanation_pattern(self):
-        """Override this method to change how explanations are detected."""
-        return re.compile(r"^Q\s*(\d+)\.([A-F | a-f])", re.DOTALL | re.MULTILINE)
-
-    def get_options_pattern(self):
-        """Override this method for different option formats."""
-        return re.compile(r"^\([a-f]\)\s*(.+)$", re.MULTILINE)
-
     def process_questions(self):
-        mcq_pattern = self.get_mcq_pattern()
         last_question_no = 0
-        mcqs = mcq_pattern.findall(self.text)
 
-        for mcq in mcqs:
-            question_no = int(mcq[0])
+        for groups in self.scanner.questions(self.text):
+            question_no = int(groups["no"])
             if question_no != last_question_no + 1 and last_question_no != 0:
                 continue
 
-            question_text = mcq[1]
-            options = self._extract_options(question_text)
-            question_text = self._remove_options_from_text(
-                question_text).strip()
+            question_text, options = self.scanner.split_options(groups["question"])
 
             self.questions[question_no] = {
-                "question": question_text, "question_no": question_no}
+                "question": question_text.strip(), "question_no": question_no}
             for idx, option in enumerate(options):
                 self.questions[question_no][chr(ord('a') + idx)] = option
 
             last_question_no = question_no
 
     def process_explanation(self):
-        explanation_pattern = self.get_explanation_pattern()
         last_question_no = 0
 
-        for match in explanation_pattern.finditer(self.text):
-            question_no = int(match.group(1))
+        for groups, explanation_content in self.scanner.answers(self.text):
+            question_no = int(groups["no"])
             if question_no != last_question_no + 1 and last_question_no != 0:
                 continue
 
-            explanation_content = self._get_explanation_content(match)
             self.explanations[question_no] = {
-                "answer": match.group(2).lower(),
+                "answer": groups["answer"].lower(),
                 "explanation": explanation_content
             }
             last_question_no = question_no
 
-    def _extract_options(self, question_text):
-        options_pattern = self.get_options_pattern()
-        return options_pattern.findall(question_text)
-
-    def _remove_options_from_text(self, question_text):
-        options_pattern = self.get_options_pattern()
-        return options_pattern.sub("", question_text)
-
-    def _get_explanation_content(self, match):
-        start = match.end()
-        next_match = next(self._find_next_explanation(match), None)
-        end = start + (next_match.start() if next_match else len(self.text))
-        return self.text[start:end].strip()
-
-    def _find_next_explanation(self, match):
-        explanation_pattern = self.get_explanation_pattern()
-        return explanation_pattern.finditer(self.text[match.end():])
-
     def get_mcqs(self, source_name):
         self.mcqs = [
             {
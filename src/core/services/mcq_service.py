@@ -1,40 +1,35 @@
-from core import re, json, csv, os
 from core.services.pdf_service import PDFService
+from ..sinks import CSVSink, JSONSink
 
 
 class MCQExtractor:
     def __init__(self, **kwargs):
         self.pdf_service = kwargs["pdf_service"]
-        self.output_path = kwargs.get("output_path", "mcqs.json")
+        # Used by to_json and to_csv when no path is passed to them
+        self.output_path = kwargs.get("output_path")
 
     def process_mcqs(self):
         pass
 
     def to_json(self, output_path=None, mode="w"):
-        with open(output_path, mode=mode, encoding="utf-8") as f:
-            json.dump(self.mcqs, f, indent=4, ensure_ascii=False)
+        """Write the MCQs as a JSON array, whatever the file extension (default mcqs.json)."""
+        if mode != "w":
+            raise ValueError("to_json cannot append to a JSON array; write each run to its own "
+                             "file, or use to_csv(mode=\"a\")")
+        with JSONSink(output_path or self.output_path or "mcqs.json") as sink:
+            sink.write_many(self.mcqs)
 
-    def to_csv(self, output_path=None, mode="w"):
+    csv_header = ['question', 'answer', 'explanation',
+                  'a', 'b', 'c', 'd', 'e', 'f', 'source', 'subject']
+
+    def csv_sink(self, output_path=None, mode="w"):
+        """A CSV sink with the MCQ columns (default mcqs.csv); other keys of an MCQ are left out."""
+        return CSVSink(output_path or self.output_path or "mcqs.csv", fieldnames=self.csv_header,
+                       extrasaction="ignore", append=mode == "a")
 
-        with open(output_path, mode=mode, encoding="utf-8") as f:
-            writer = csv.writer(f)
-            writer.writerow(['question', 'answer', 'explanation',
-                            'a', 'b', 'c', 'd', 'e', 'f', 'source', 'subject'])
-
-            for mcq in self.mcqs:
-                writer.writerow([
-                    mcq['question'],
-                    mcq['answer'],
-                    mcq.get('explanation', ''),
-                    mcq['a'],
-                    mcq['b'],
-                    mcq['c'],
-                    mcq['d'],
-                    mcq.get('e', ''),
-                    mcq.get('f', ''),
-                    mcq['source'],
-                    mcq["subject"],
-                ])
+    def to_csv(self, output_path=None, mode="w"):
+        with self.csv_sink(output_path, mode) as sink:
+            sink.write_many(self.mcqs)
 
     def run(self, pages=None):
         self.text = self.pdf_service.extract_text(pages)
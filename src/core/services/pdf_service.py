@@ -1,39 +1,105 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
 import fitz
 
+from ..page_cache import file_sha256, get_page_cache
+from ..parallel import batched, map_batches
+
+# Contiguous page chunks handed to each worker per task; more chunks than
+# workers keeps them all busy when some pages are much slower than others.
+CHUNKS_PER_WORKER = 4
+TEXT_MODE = "text"
+# Pages looked up in / added to the page cache at a time
+CACHE_WINDOW = 256
+
+
+def _extract_pages(pdf_path, page_nums):
+    """Worker task: open the PDF in this process and return [(page_num, text)]."""
+    doc = fitz.open(pdf_path)
+    try:
+        return [(page_num, doc[page_num].get_text(TEXT_MODE)) for page_num in page_nums]
+    finally:
+        doc.close()
+
 
 class PDFService:
-    def __init__(self, pdf_path, **kwargs):
+    def __init__(self, pdf_path, workers=1, cache=None, **kwargs):
+        """
+        Args:
+            pdf_path: PDF to read
+            workers: Processes used to extract page text (1 extracts inline,
+                None uses every core); each opens its own document
+            cache: PageTextCache to use instead of the process-wide one
+        """
         self.pdf_path = pdf_path
+        self.workers = workers
+        self.cache = cache
+
+    def iter_pages(self, pages=None, workers=None):
+        """
+        Yield (page_num, text) in page order, extracting lazily so only a
+        few pages are held in memory at a time. With a page cache enabled,
+        cached pages skip MuPDF and newly extracted ones are added.
+        """
+        workers = (self.workers if workers is None else workers) or os.cpu_count() or 1
+        page_count = None
+        if pages is None:
+            with fitz.open(self.pdf_path) as doc:
+                page_count = doc.page_count
+            pages = range(page_count)
+
+        cache = self.cache or get_page_cache()
+        if cache is None:
+            yield from self._extract(list(pages), workers)
+            return
+
+        digest = file_sha256(self.pdf_path)
+        cache.remember_document(digest, self.pdf_path, page_count)
+        # Started on the first cache miss and shared by every window
+        pool = None
+        try:
+            for window in batched(pages, CACHE_WINDOW):
+                texts = cache.get_many(digest, window, TEXT_MODE, fitz.VersionBind)
+                missing = [page_num for page_num in window if page_num not in texts]
+                if missing:
+                    if pool is None and workers > 1:
+                        pool = ProcessPoolExecutor(max_workers=workers)
+                    extracted = dict(self._extract(missing, workers, pool))
+                    cache.put_many(digest, extracted, TEXT_MODE, fitz.VersionBind)
+                    texts.update(extracted)
+                for page_num in window:
+                    yield page_num, texts[page_num]
+        finally:
+            if pool is not None:
+                pool.shutdown()
+
+    def _extract(self, pages, workers, pool=None):
+        if workers == 1:
+            with fitz.open(self.pdf_path) as doc:
+                for page_num in pages:
+                    yield page_num, doc[page_num].get_text(TEXT_MODE)
+            return
+
+        chunk_size = max(1, -(-len(pages) // (workers * CHUNKS_PER_WORKER)))
+        for chunk in map_batches(partial(_extract_pages, self.pdf_path), pages,
+                                 workers, chunk_size, executor=pool):
+            yield from chunk
 
-    def extract_text_dict(self, pages=None):
-        extracted_text = {}
+    def extract_text_dict(self, pages=None, workers=None):
         try:
-            doc = fitz.open(self.pdf_path)
-            target_pages = range(doc.page_count) if pages is None else pages
-            for page_num in target_pages:
-                page = doc[page_num]
-                text = page.get_text("text")
-                extracted_text[page_num] = text
-            doc.close()
+            return dict(self.iter_pages(pages, workers))
         except Exception as e:
             print(f"Error opening or processing PDF: {e}")
             return None
-        return extracted_text
 
-    def extract_text_string(self, pages=None):
-        extracted_text = ""
+    def extract_text_string(self, pages=None, workers=None):
         try:
-            doc = fitz.open(self.pdf_path)
-            target_pages = range(doc.page_count) if pages is None else pages
-            for page_num in target_pages:
-                page = doc[page_num]
-                text = page.get_text("text")
-                extracted_text += text
-            doc.close()
+            return "".join(text for _, text in self.iter_pages(pages, workers))
         except Exception as e:
             print(f"Error opening or processing PDF: {e}")
             return None
-        return extracted_text
 
-    def extract_text(self, pages=None):
-        return self.extract_text_string(pages)
+    def extract_text(self, pages=None, workers=None):
+        return self.extract_text_string(pages, workers)
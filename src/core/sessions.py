@@ -0,0 +1,69 @@
+"""
+Process-wide HTTP session registry.
+
+Scrapers used to build a fresh requests.Session per instance, so no TCP/TLS
+connection was ever reused across pages. Sessions are now shared per host and
+their connection pools are sized to the number of concurrent workers.
+"""
+
+import threading
+from typing import Dict
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+DEFAULT_POOL_SIZE = 10
+
+_sessions: Dict[str, requests.Session] = {}
+_lock = threading.Lock()
+_pool_size = DEFAULT_POOL_SIZE
+
+
+def _host(url):
+    return urlsplit(url).netloc.lower()
+
+
+def _build_session(pool_size):
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def get_session(url: str) -> requests.Session:
+    """Return the shared session for the host of `url`, creating it on first use."""
+    host = _host(url)
+    session = _sessions.get(host)
+    if session is None:
+        with _lock:
+            session = _sessions.get(host)
+            if session is None:
+                session = _sessions[host] = _build_session(_pool_size)
+    return session
+
+
+def configure_pool(pool_size: int):
+    """
+    Size connection pools to the number of concurrent workers.
+
+    Pools only grow. Existing sessions are remounted with the new pool size.
+    """
+    global _pool_size
+    with _lock:
+        if pool_size <= _pool_size:
+            return
+        _pool_size = pool_size
+        for session in _sessions.values():
+            adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+
+
+def close_sessions():
+    """Close every shared session and forget it."""
+    with _lock:
+        for session in _sessions.values():
+            session.close()
+        _sessions.clear()
@@ -0,0 +1,277 @@
+"""
+Streaming record sinks.
+
+Extractors write records to a sink one at a time instead of building the
+whole result list and dumping it at the end, so memory stays flat however
+many records a run produces. open_sink() picks the sink from the file name:
+
+    .csv  .json  .jsonl / .ndjson   (add .gz to compress)
+    .db  .sqlite  .sqlite3          (a table of records)
+
+A sink writes to "<path>.part" and flushes every `flush_every` records or
+`flush_interval` seconds. Closing it moves the file into place atomically,
+so a finished output is never half written. If the run fails, what was
+flushed stays in the .part file. With append=True records are added to the
+existing file directly.
+"""
+
+import csv
+import gzip
+import json
+import logging
+import os
+import sqlite3
+import time
+from typing import Any, Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+PART_SUFFIX = ".part"
+
+Record = Dict[str, Any]
+
+
+class RecordSink:
+    def __init__(self, path: str, fieldnames: Optional[Iterable[str]] = None, append: bool = False,
+                 flush_every: int = 1000, flush_interval: float = 5.0):
+        """`fieldnames` fixes the columns of tabular sinks; by default they are the first record's keys."""
+        self.path = path
+        self.fieldnames = list(fieldnames) if fieldnames else None
+        self.append = append
+        self.flush_every = flush_every
+        self.flush_interval = flush_interval
+        self.target = path if append else path + PART_SUFFIX
+        self.count = 0
+        self.closed = False
+        self._pending = 0
+        self._flushed_at = time.monotonic()
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._open()
+
+    def write(self, record: Record):
+        self._write(record)
+        self.count += 1
+        self._pending += 1
+        if (self._pending >= self.flush_every
+                or time.monotonic() - self._flushed_at >= self.flush_interval):
+            self.flush()
+
+    def write_many(self, records: Iterable[Record]) -> int:
+        """Write every record; returns the sink's record count so far."""
+        for record in records:
+            self.write(record)
+        return self.count
+
+    def flush(self):
+        self._flush()
+        self._pending = 0
+        self._flushed_at = time.monotonic()
+
+    def close(self):
+        """Flush, close and move the output into place."""
+        if self.closed:
+            return
+        self.flush()
+        self._close()
+        self.closed = True
+        if not self.append:
+            os.replace(self.target, self.path)
+
+    def abort(self):
+        """Flush and close, leaving what was written in the .part file."""
+        if self.closed:
+            return
+        self.flush()
+        self._close()
+        self.closed = True
+        logger.warning(f"Partial output ({self.count} records) left in {self.target}")
+
+    def discard(self):
+        """Close without publishing anything."""
+        if self.closed:
+            return
+        self._close()
+        self.closed = True
+        if not self.append:
+            os.remove(self.target)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+    def _open(self):
+        raise NotImplementedError
+
+    def _write(self, record: Record):
+        raise NotImplementedError
+
+    def _flush(self):
+        raise NotImplementedError
+
+    def _close(self):
+        raise NotImplementedError
+
+
+class TextSink(RecordSink):
+    """A sink writing text, gzip-compressed when the path ends in .gz."""
+
+    def _open(self):
+        mode = "at" if self.append else "wt"
+        opener = gzip.open if self.path.endswith(".gz") else open
+        # Flushing a gzip stream ends a deflate block, so a partial file
+        # decompresses up to the last flush
+        self.file = opener(self.target, mode, encoding="utf-8", newline="")
+
+    def _flush(self):
+        self.file.flush()
+
+    def _close(self):
+        self.file.close()
+
+
+class CSVSink(TextSink):
+    def __init__(self, path: str, fieldnames: Optional[Iterable[str]] = None,
+                 extrasaction: str = "raise", **kwargs):
+        """Keys missing from a record are written empty; extra keys raise unless extrasaction="ignore"."""
+        self.extrasaction = extrasaction
+        self.writer = None
+        super().__init__(path, fieldnames, **kwargs)
+
+    def _open(self):
+        # Appending to a file that already has rows must not repeat the header
+        self.has_header = self.append and os.path.exists(self.target) and os.path.getsize(self.target) > 0
+        super()._open()
+
+    def _start(self):
+        self.writer = csv.DictWriter(self.file, fieldnames=self.fieldnames, restval="",
+                                     extrasaction=self.extrasaction)
+        if not self.has_header:
+            self.writer.writeheader()
+
+    def _write(self, record: Record):
+        if self.writer is None:
+            if self.fieldnames is None:
+                self.fieldnames = list(record.keys())
+            self._start()
+        self.writer.writerow(record)
+
+    def close(self):
+        if not self.closed and self.writer is None:
+            if self.fieldnames is None:
+                # No record and no columns: not even a header to write
+                logger.warning("No data to save")
+                self.discard()
+                return
+            self._start()
+        super().close()
+
+
+class JSONLSink(TextSink):
+    """One JSON object per line."""
+
+    def _write(self, record: Record):
+        self.file.write(json.dumps(record, ensure_ascii=False))
+        self.file.write("\n")
+
+
+class JSONSink(TextSink):
+    """A JSON array, one record per line."""
+
+    def _open(self):
+        if self.append:
+            raise ValueError("Cannot append to a JSON array; use .jsonl")
+        super()._open()
+        self.file.write("[")
+
+    def _write(self, record: Record):
+        self.file.write(",\n" if self.count else "\n")
+        self.file.write(json.dumps(record, ensure_ascii=False))
+
+    def _close(self):
+        self.file.write("\n]\n" if self.count else "]\n")
+        super()._close()
+
+
+def _quote(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
+
+
+def _sql_value(value: Any) -> Any:
+    if value is None or isinstance(value, (str, int, float, bytes)):
+        return value
+    if isinstance(value, (dict, list, tuple)):
+        return json.dumps(value, ensure_ascii=False)
+    return str(value)
+
+
+class SQLiteSink(RecordSink):
+    """Records as rows of `table`; nested values are stored as JSON text."""
+
+    def __init__(self, path: str, fieldnames: Optional[Iterable[str]] = None,
+                 table: str = "records", extrasaction: str = "raise", **kwargs):
+        self.table = table
+        self.extrasaction = extrasaction
+        self.insert = None
+        self.rows: List[tuple] = []
+        super().__init__(path, fieldnames, **kwargs)
+
+    def _open(self):
+        if not self.append and os.path.exists(self.target):
+            os.remove(self.target)
+        self.conn = sqlite3.connect(self.target)
+
+    def _prepare(self):
+        columns = ", ".join(map(_quote, self.fieldnames))
+        self.conn.execute(f"CREATE TABLE IF NOT EXISTS {_quote(self.table)} ({columns})")
+        self.insert = (f"INSERT INTO {_quote(self.table)} ({columns}) "
+                       f"VALUES ({', '.join('?' * len(self.fieldnames))})")
+        self.columns = set(self.fieldnames)
+
+    def _write(self, record: Record):
+        if self.insert is None:
+            if self.fieldnames is None:
+                self.fieldnames = list(record.keys())
+            self._prepare()
+        if self.extrasaction == "raise" and not self.columns.issuperset(record):
+            extra = sorted(set(record) - self.columns)
+            raise ValueError(f"Record has fields not in the table: {extra}")
+        self.rows.append(tuple(_sql_value(record.get(name)) for name in self.fieldnames))
+
+    def _flush(self):
+        if self.rows:
+            self.conn.executemany(self.insert, self.rows)
+            self.rows = []
+        self.conn.commit()
+
+    def _close(self):
+        if self.insert is None and self.fieldnames:
+            self._prepare()
+        self.conn.commit()
+        self.conn.close()
+
+
+SINKS = {
+    ".csv": CSVSink,
+    ".json": JSONSink,
+    ".jsonl": JSONLSink,
+    ".ndjson": JSONLSink,
+    ".db": SQLiteSink,
+    ".sqlite": SQLiteSink,
+    ".sqlite3": SQLiteSink,
+}
+
+
+def open_sink(path: str, **kwargs) -> RecordSink:
+    """The sink for `path`, chosen by its extension; kwargs go to the sink."""
+    base = path[:-len(".gz")] if path.endswith(".gz") else path
+    sink_class = SINKS.get(os.path.splitext(base)[1].lower())
+    if sink_class is None or (base != path and not issubclass(sink_class, TextSink)):
+        raise ValueError(f"Unsupported format: {path}. Use .csv, .json, .jsonl "
+                         f"(optionally .gz) or .db/.sqlite")
+    return sink_class(path, **kwargs)
@@ -1,13 +1,26 @@
 import argparse
+import importlib
 import sys
 import logging
 import csv
 from typing import List
-from src.recipes.dggca_recipe import DggcaExtractor
-from src.recipes.gst_recipe import GstExtractor
 
 logger = logging.getLogger(__name__)
 
+# Recipes are imported only when selected, so a PDF-only run never loads the
+# HTTP stack and `--help` loads no recipe at all.
+RECIPES = {
+    "dggca": "src.recipes.dggca_recipe:DggcaExtractor",
+    "gst": "src.recipes.gst_recipe:GstExtractor",
+}
+
+
+def load_recipe(source: str):
+    """Import and return the extractor class registered for `source`."""
+    module_name, class_name = RECIPES[source].split(":")
+    return getattr(importlib.import_module(module_name), class_name)
+
+
 def parse_pages(pages_str: str) -> List[int]:
     """Parse page string '1,2,5-7' into list of integers."""
     pages = []
@@ -22,8 +35,13 @@ def parse_pages(pages_str: str) -> List[int]:
     # fitz uses 0-indexed pages, user likely provides 1-indexed
     return [p - 1 for p in pages]
 
-def process_gst_csv(input_csv: str, output_csv: str):
-    """Process GST CSV input."""
+def process_gst_csv(input_csv: str, output_csv: str, concurrency: int = 5, flush_every: int = 100):
+    """
+    Process GST CSV input. GSTINs are scraped in one event loop, `concurrency`
+    at a time, and each result is written as soon as it arrives (in completion
+    order). The output is flushed every `flush_every` records, so memory stays
+    flat and a failed run keeps what was already written.
+    """
     # This resembles the old logic but uses the new Extractor
     if not input_csv:
         logger.error("Input CSV required for GST batch mode")
@@ -42,39 +60,34 @@ def process_gst_csv(input_csv: str, output_csv: str):
         logger.error(f"Input file not found: {input_csv}")
         sys.exit(1)
     
-    all_data = []
-    extractor = GstExtractor(base_url="") # Dummy URL, updated later
-    
-    for gstin in ids_to_process:
-        if not gstin: continue
-        url = f"https://gst.jamku.app/gstin/{gstin}"
-        logger.info(f"Scraping GSTIN: {gstin}")
-        
-        # We can re-instantiate or just update base_url if possible, 
-        # but re-instantiating is safer for state
-        # Or simpler:
-        extractor = GstExtractor(base_url=url) 
-        
-        try:
-            result = extractor.extract()
-            if result:
-                all_data.extend(result)
-        except Exception as e:
-            logger.error(f"Failed to scrape {gstin}: {e}")
-            
-    # Save results
-    if all_data:
-        extractor.save(all_data, output_csv)
-        logger.info(f"Saved {len(all_data)} records to {output_csv}")
+    GstExtractor = load_recipe("gst")
+    urls = [f"https://gst.jamku.app/gstin/{gstin}" for gstin in ids_to_process if gstin]
+    logger.info(f"Scraping {len(urls)} GSTINs with concurrency {concurrency}")
+
+    # Failures are logged per GSTIN and come back as empty results
+    count = GstExtractor.extract_many_to(urls, output_csv, concurrency=concurrency,
+                                         flush_every=flush_every)
+
+    if count:
+        logger.info(f"Saved {count} records to {output_csv}")
     else:
         logger.warning("No data extracted for GST")
 
 def main():
     parser = argparse.ArgumentParser(description="Scraper Tool")
-    parser.add_argument("--source", type=str, required=True, choices=["dggca", "gst"], help="Source to scrape")
+    parser.add_argument("--source", type=str, required=True, choices=sorted(RECIPES), help="Source to scrape")
     parser.add_argument("--input", type=str, help="Input file path (PDF for dggca, CSV for gst)")
     parser.add_argument("--output", type=str, required=True, help="Output file path")
     parser.add_argument("--pages", type=str, help="Pages to scrape (e.g. '1,2,3' or '1-5') for PDF")
+    parser.add_argument("--concurrency", type=int, default=5,
+                        help="Concurrent requests for web sources (only faster with --rate raised too)")
+    parser.add_argument("--rate", type=float,
+                        help="Max requests per second per host for web sources (default 0.5)")
+    parser.add_argument("--cache-dir", type=str, help="Directory for the on-disk HTTP cache (web sources)")
+    parser.add_argument("--cache-ttl", type=float, default=24 * 60 * 60, help="Seconds a cached page is served without revalidation")
+    parser.add_argument("--parser", type=str, help="HTML parser backend for web sources (html.parser, lxml)")
+    parser.add_argument("--workers", type=int, default=1, help="Processes for PDF page extraction (0 = all cores)")
+    parser.add_argument("--page-cache", type=str, help="SQLite file caching extracted PDF page text")
     
     args = parser.parse_args()
     
@@ -86,15 +99,33 @@ def main():
              sys.exit(1)
         
         pages = parse_pages(args.pages)
-        extractor = DggcaExtractor(pdf_path=args.input, source=args.source)
-        data = extractor.extract(pages=pages)
-        extractor.save(data, args.output)
-        logger.info(f"DGGCA extraction complete. Saved to {args.output}")
+        if args.page_cache:
+            from src.core.page_cache import configure_page_cache
+            configure_page_cache(args.page_cache)
+        extractor = load_recipe("dggca")(pdf_path=args.input, source=args.source,
+                                         workers=args.workers or None)
+        count = extractor.extract_to(args.output, pages=pages)
+        logger.info(f"DGGCA extraction complete. Saved {count} records to {args.output}")
         
     elif args.source == "gst":
+        from src.core.http_cache import configure_http_cache
+        from src.core.parsers import set_default_parser
+        from src.core.rate_limit import DEFAULT_RATE, get_rate_limiter
+
+        if args.rate is not None:
+            get_rate_limiter().configure(rate=args.rate)
+        elif args.concurrency > 1:
+            # Concurrent requests only overlap if the per-host rate allows it
+            logger.warning(f"--concurrency {args.concurrency} without --rate: requests stay limited to "
+                           f"{DEFAULT_RATE} per second per host; raise --rate to scrape faster")
+        if args.cache_dir:
+            configure_http_cache(args.cache_dir, ttl=args.cache_ttl)
+        if args.parser:
+            set_default_parser(args.parser)
+
         # Check if input is a CSV file
         if args.input:
-            process_gst_csv(args.input, args.output)
+            process_gst_csv(args.input, args.output, args.concurrency)
         else:
              logger.error("GST source requires --input pointing to a CSV file")
              sys.exit(1)
@@ -1,6 +1,15 @@
 from core.services.pdf_service import PDFService
 import re
 from core import csv
+from core.segments import segments
+
+
+UNIT_PATTERN = re.compile(r"\nUNIT-(\d+) (.+)\n")
+SUBUNIT_PATTERN = re.compile(r"(\d+\.\d+) (.+)")
+QUESTION_PATTERN = re.compile(
+    r"^\s*(\d+)\.\s*([^\n]+?)(?:\((\d+)M(?:,\s*(\d+)W)?(?:,\s*(CSE|IFoS)\s*(\d+))?\))?",
+    re.MULTILINE
+)
 
 
 class QuestionParser:
@@ -11,51 +20,25 @@ class QuestionParser:
         self.questions = []
 
     def parse(self):
-        self.parse_questions(self.text)
+        self.questions.extend(self.parse_questions(self.text))
 
     def parse_questions(self, text):
-        units = self.split_units(text)
-        for unit_number, unit_title, unit_content in units:
-            # print(unit_content, "\n", "-"*20, "\n")
-            subunits = self.split_subunits(unit_content)
-            for sub_unit_number, sub_unit_title, questions_text in subunits:
-                # print(questions_text, "\n", "-"*20, "\n")
-                self.extract_questions(
+        """Yield a record per question, unit by unit and sub-unit by sub-unit."""
+        for unit_number, unit_title, unit_content in self.split_units(text):
+            for sub_unit_number, sub_unit_title, questions_text in self.split_subunits(unit_content):
+                yield from self.extract_questions(
                     unit_title, sub_unit_title, questions_text)
 
     def split_units(self, text):
-        unit_matches = re.split(r"\nUNIT-(\d+) (.+)\n", text)[1:]
-        return [(unit_matches[i], unit_matches[i+1].strip(), unit_matches[i+2]) for i in range(0, len(unit_matches), 3)]
+        for match, end in segments(UNIT_PATTERN, text):
+            yield match.group(1), match.group(2).strip(), text[match.end():end]
 
     def split_subunits(self, unit_content):
-        subunit_matches = list(re.finditer(r"(\d+\.\d+) (.+)", unit_content))
-
-        subunits = []
-        for i, match in enumerate(subunit_matches):
-            subunit_number = match.group(1)
-            subunit_title = match.group(2).strip()
-
-            start_index = match.end()
-            end_index = subunit_matches[i + 1].start() if i + \
-                1 < len(subunit_matches) else len(unit_content)
-
-            subunit_text = unit_content[start_index:end_index].strip()
-            subunits.append((subunit_number, subunit_title, subunit_text))
-
-        return subunits
+        for match, end in segments(SUBUNIT_PATTERN, unit_content):
+            yield match.group(1), match.group(2).strip(), unit_content[match.end():end].strip()
 
     def extract_questions(self, unit_title, sub_unit_title, questions_text):
-        print(questions_text, "\n", "-"*20, "\n")
-
-        pattern = re.compile(
-            r"^\s*(\d+)\.\s*([^\n]+?)(?:\((\d+)M(?:,\s*(\d+)W)?(?:,\s*(CSE|IFoS)\s*(\d+))?\))?",
-            re.MULTILINE
-        )
-
-        questions = []
-        last_match_end = 0
-
-        for match in pattern.finditer(questions_text):
+        for match, end in segments(QUESTION_PATTERN, questions_text):
             q_no = int(match.group(1))
             q_text = match.group(2).strip() if match.group(2) else None
             marks = int(match.group(3)) if match.group(3) else None
@@ -63,18 +46,13 @@ class QuestionParser:
             exam = match.group(5) if match.group(5) else None
             year = int(match.group(6)) if match.group(6) else None
 
-            # Find the full question text
-            start_idx = match.end()
-            next_match = next(pattern.finditer(
-                questions_text, start_idx), None)
-            end_idx = next_match.start() if next_match else len(questions_text)
-
-            full_question_text = questions_text[start_idx:end_idx].strip()
+            # The question runs on until the next question number
+            full_question_text = questions_text[match.end():end].strip()
 
             # Merge first line with full question text (ensuring no extra spaces)
             full_question = "".join([q_text, full_question_text]).strip()
 
-            questions.append({
+            yield {
                 "unit": unit_title,
                 "sub_unit": sub_unit_title,
                 "question_no": q_no,
@@ -83,9 +61,7 @@ class QuestionParser:
                 "words": words,
                 "exam": exam,
                 "year": year
-            })
-
-        self.questions.extend(questions)
+            }
 
     def to_csv(self, filename):
         with open(filename, mode='w', newline='', encoding='utf-8') as file:
@@ -1,8 +1,13 @@
 from core.services.pdf_service import PDFService
 from core.services.mcq_service import MCQExtractor
-import re
+from core.mcq_grammar import ARIHANT, compile_grammar
+from core.sinks import CSVSink
+from bisect import bisect_right
+from itertools import accumulate
 from core import csv
 
+OUTPUT_PATH = "./data/arihant/output/mcqs.csv"
+
 
 def subjects():
     with open("./data/arihant/arihantMCQIndex.csv") as f:
@@ -11,10 +16,35 @@ def subjects():
         return [(row[0] + " - " + row[1], range(int(row[2]) - 1, int(row[3]))) for row in reader]
 
 
+class SubjectIndex:
+    """Maps a page to the index entries whose page range contains it."""
+
+    def __init__(self, entries):
+        self.entries = sorted(entries, key=lambda entry: (entry[1].start, entry[1].stop))
+        self.starts = [pages.start for _, pages in self.entries]
+        # Furthest range end up to each position: a lookup walks back only
+        # while an earlier range can still reach the page
+        self.reach = list(accumulate((pages.stop for _, pages in self.entries), max))
+
+    def entries_at(self, page):
+        """Positions of the entries containing `page`, in index order."""
+        found = []
+        i = bisect_right(self.starts, page) - 1
+        while i >= 0 and self.reach[i] > page:
+            if self.entries[i][1].stop > page:
+                found.append(i)
+            i -= 1
+        return found[::-1]
+
+    def pages(self):
+        return sorted({page for _, pages in self.entries for page in pages})
+
+
 class ArihantMCQExtractor(MCQExtractor):
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
+        self.scanner = compile_grammar(ARIHANT)
         self.questions = {}
         self.explanations = {}
         self.mcqs = []
@@ -22,35 +52,23 @@ class ArihantMCQExtractor(MCQExtractor):
         self.subject = kwargs.get("subject")
 
     def process_questions(self):
-        mcq_pattern = re.compile(
-            r"""^(\d+)\.\s*(.*?)\s*\(a\)\s*(.*?)\s*\(b\)\s*(.*?)\s*\(c\)\s*(.*?)\s*\(d\)\s*(.*?)$""",
-            re.DOTALL | re.MULTILINE
-        )
-        mcqs = mcq_pattern.findall(self.text)
-
-        for mcq in mcqs:
-            question_no = int(mcq[0])
-            question_text = mcq[1].strip()
-            options = {
-                "a": mcq[2].strip(),
-                "b": mcq[3].strip(),
-                "c": mcq[4].strip(),
-                "d": mcq[5].strip()
-            }
+        for groups in self.scanner.questions(self.text):
+            question_no = int(groups["no"])
+            a, b, c, d = self.scanner.inline_options(groups)
 
             self.questions[question_no] = {
                 "question_no": question_no,
-                "question": question_text,
-                **options
+                "question": groups["question"].strip(),
+                "a": a,
+                "b": b,
+                "c": c,
+                "d": d
             }
 
     def process_explanation(self):
-        answer_pattern = re.compile(r"^(\d+)\.\s*\((\w)\)", re.MULTILINE)
-        matches = answer_pattern.findall(self.text)
-
-        for match in matches:
-            question_no = int(match[0])
-            answer = match[1].lower()
+        for groups, _ in self.scanner.answers(self.text):
+            question_no = int(groups["no"])
+            answer = groups["answer"].lower()
 
             if question_no in self.questions:
                 self.explanations[question_no] = {"answer": answer}
@@ -72,17 +90,55 @@ class ArihantMCQExtractor(MCQExtractor):
         ]
 
     def run(self, **kwargs):
-        self.text = self.pdf_service.extract_text(**kwargs)
+        return self.parse(self.pdf_service.extract_text(**kwargs))
+
+    def parse(self, text):
+        self.text = text
         self.process_questions()
         self.process_explanation()
         self.get_mcqs()
         return self.mcqs
 
 
+def extract_all(pdf_path, output_path=OUTPUT_PATH, entries=None, workers=1):
+    """
+    Extract every subject of the index in one pass over the book and write a
+    single CSV. Pages are read once, in order (`workers` > 1 extracts them in
+    parallel), and each subject is parsed as soon as its last page is read.
+    """
+    index = SubjectIndex(entries or subjects())
+    pdf_service = PDFService(pdf_path, workers=workers)
+    page_texts = {}
+
+    def flush(position):
+        subject = index.entries[position][0]
+        extractor = ArihantMCQExtractor(pdf_service=pdf_service, subject=subject)
+        extractor.parse("".join(page_texts.pop(position)))
+        sink.write_many(extractor.mcqs)
+
+    with CSVSink(output_path, fieldnames=MCQExtractor.csv_header, extrasaction="ignore") as sink:
+        for page_num, text in pdf_service.iter_pages(index.pages()):
+            current = index.entries_at(page_num)
+            for position in [p for p in page_texts if p not in current]:
+                flush(position)
+            for position in current:
+                page_texts.setdefault(position, []).append(text)
+        for position in list(page_texts):
+            flush(position)
+    return sink.count
+
+
 def main(**kwargs):
-    pdf_service = PDFService(kwargs["pdf_path"])
-    extractor = ArihantMCQExtractor(
-        pdf_service=pdf_service, output_path=kwargs["output_path"], subject=kwargs["subject"])
-    mcqs = extractor.run(pages=kwargs["pages"])
-    extractor.to_csv(
-        mode="a", output_path="./data/arihant/output/mcqs.csv")
+    """
+    Extract every subject in the index from the book at `pdf_path` into one
+    CSV at `output_path` (overwritten), and return the number of MCQs.
+    main() used to take one `subject` and its `pages` and append them to
+    OUTPUT_PATH; those keys are rejected so an old call cannot silently
+    overwrite the combined CSV with a run over the whole book.
+    """
+    old_keys = sorted({"subject", "pages"} & kwargs.keys())
+    if old_keys:
+        raise TypeError(f"main() no longer takes {', '.join(old_keys)}: it extracts every subject "
+                        f"of the index into one CSV; pass `entries` to choose subjects and pages")
+    return extract_all(kwargs["pdf_path"], output_path=kwargs.get("output_path", OUTPUT_PATH),
+                       entries=kwargs.get("entries"), workers=kwargs.get("workers", 1))
@@ -1,36 +1,43 @@
+import logging
 import re
-import unicodedata
 from typing import Any, Dict, List
 from src.core.base_pdf import BasePDFExtractor
+from src.core.mcq_grammar import DGGCA, compile_grammar
+from src.core.normalize import iter_normalized, normalize_text
+
+logger = logging.getLogger(__name__)
 
 class DggcaExtractor(BasePDFExtractor):
     """
     Extractor for DGGCA PDF documents.
     """
 
+    # Questions are grouped under date headings; each date is parsed on its own
+    record_start = re.compile(r'^\d{1,2}(?:st|nd|rd|th)\s+\w+$', re.MULTILINE)
+
+    def __init__(self, pdf_path: str, **kwargs):
+        super().__init__(pdf_path, **kwargs)
+        # Question records that could not be parsed: {date, reason, text}
+        self.malformed: List[Dict[str, Any]] = []
+
     def parse(self, text: str) -> List[Dict[str, Any]]:
-        normalized_text = self.normalize_text(text)
-        dates = self.split_dates(normalized_text)
+        return self.parse_chunk(self.normalize_text(text))
+
+    def parse_chunk(self, chunk: str) -> List[Dict[str, Any]]:
+        # Chunks come from the normalized page stream, see iter_chunks
         all_questions = []
-        for date, content in dates:
+        for date, content in self.split_dates(chunk):
             questions = self.extract_questions(date, content)
             all_questions.extend(questions)
         return all_questions
 
+    def iter_chunks(self, page_texts):
+        # Normalize the page stream once, then cut it at date headings
+        pieces = iter_normalized(text for _, text in page_texts)
+        return super().iter_chunks((None, piece) for piece in pieces)
+
     def normalize_text(self, text):
-        text = unicodedata.normalize("NFKC", text)  # Normalize Unicode
-        # Remove hidden LTR/RTL markers
-        text = re.sub(r'[\u202A-\u202E]', '', text)
-        # Replace multiple spaces/tabs with a single space
-        text = re.sub(r'[ \t]+', ' ', text)
-        text = re.sub(r'\n+', '\n', text)  # Ensure single newlines
-        # Add space between merged words
-        text = re.sub(r'(\w)([A-Z])', r'\1 \2', text)
-        # Fix misplaced spaces before punctuation
-        text = text.replace(" .", ".").replace(" ,", ",")
-        # Fix misplaced spaces around parentheses
-        text = text.replace(" (", "(").replace(" )", ")")
-        return text.strip()
+        return normalize_text(text)
 
     def split_dates(self, text):
         date_pattern = re.compile(
@@ -53,31 +60,29 @@ class DggcaExtractor(BasePDFExtractor):
         return dates_with_content
 
     def extract_questions(self, date, content):
+        """
+        Parse one date block with the DGGCA grammar's marker scanner (linear
+        time, however the block is split into lines). Records cut short by the next Q) or the end of the block are
+        reported in `self.malformed` and skipped.
+        """
+        scanner = compile_grammar(DGGCA)
         questions = []
-        question_pattern = re.compile(
-            r'Q\)\s*(.*?)\s*'  # Question
-            r'A\.\s*(.*?)\s*'  # Option A
-            r'B\.\s*(.*?)\s*'  # Option B
-            r'C\.\s*(.*?)\s*'  # Option C
-            r'D\.\s*(.*?)\s*'  # Option D
-            r'Answer:\s*([A-D])\.\s*(.*?)\s*'  # Correct answer
-            r'(.*?)(?=Q\)|$)',  # Explanation (until next question or end)
-            re.DOTALL
-        )
-
-        matches = question_pattern.findall(content)
-        for match in matches:
-            question, a, b, c, d, answer, correct_option, explanation = match
+        for record in scanner.records(content, lambda text, reason: self.report_malformed(date, text, reason)):
+            a, b, c, d = record["options"]
             questions.append({
                 "metadata": {
                     "date": date},
-                "question": question.strip(),
-                "a": a.strip(),
-                "b": b.strip(),
-                "c": c.strip(),
-                "d": d.strip(),
-                "answer": answer.strip().lower(),
-                "explanation": explanation.strip() if explanation.strip() else None,
+                "question": record["question"],
+                "a": a,
+                "b": b,
+                "c": c,
+                "d": d,
+                "answer": record["answer"].lower(),
+                "explanation": record["explanation"] or None,
                 "source": self.kwargs.get("source"),
             })
         return questions
+
+    def report_malformed(self, date, text, reason):
+        logger.warning(f"Skipping malformed question under {date}: {reason}")
+        self.malformed.append({"date": date, "reason": reason, "text": text.strip()})
@@ -3,6 +3,7 @@ import re
 import csv
 import os
 from typing import Any, Dict, List, Optional
+from bs4 import NavigableString
 from src.core.base_scraper import BaseScraper
 
 logger = logging.getLogger(__name__)
@@ -11,26 +12,26 @@ class GstExtractor(BaseScraper):
     """
     Extractor for GST details.
     """
+
+    # No parse_only: a strainer decides from a start tag alone, so the card
+    # holding a label and its value can only be kept by its own tag/class,
+    # which the scraped pages do not give us. Keeping only p/h2/li makes
+    # labels of different cards siblings, and a label with no value then
+    # takes the next card's value.
+    parse_only = None
+
     def parse_page(self) -> List[Dict[str, Any]]:
         # The BaseScraper extract/scrape method calls this.
         # It expects a list of dicts.
-        data = {}
         try:
-            gstin_details = self.soup.find_all("p", class_="text-cyan-700")
-
-            for p in gstin_details:
-                label = p.get_text(strip=True).title()
-                value_element = p.find_next_sibling(["h2", "p"])
-                value = value_element.get_text(
-                    strip=True).title() if value_element else "N/A"
-                data[label] = value
+            data, list_codes, strings = self.scan_page()
 
             # Address processing
             address = data.get("Place Of Business (Address)", "N/A")
             city, district, state, pincode = self.extract_address_parts(address)
             
             # Extract HSN codes if available
-            hsn_codes = self.extract_hsn_codes()
+            hsn_codes = self.extract_hsn_codes(list_codes, strings)
             
             # Format the output record with all available fields
             # Handle Status - if Registration Status is empty, mark as "Active" (default assumption)
@@ -61,6 +62,51 @@ class GstExtractor(BaseScraper):
             logger.error(f"Error parsing GST details: {e}")
             return []
 
+    def scan_page(self):
+        """
+        Collect the label/value pairs, the HSN codes listed in <li> items and
+        the page text for the HSN fallback, in a single walk of the tree.
+
+        A label's value is its first following h2/p sibling, as
+        find_next_sibling(["h2", "p"]) would return it: labels wait in
+        `pending` under their parent until the next h2/p with that parent.
+        The text strings are those soup.get_text() would join; they are only
+        joined if the fallback needs them.
+        """
+        labels = []  # [label, value element] in document order
+        pending = {}  # id(parent) -> indexes of labels still waiting for a value
+        list_codes = []
+        strings = []
+        text_types = self.soup.interesting_string_types or self.soup.MAIN_CONTENT_STRING_TYPES
+        if isinstance(text_types, type):
+            text_types = (text_types,)
+
+        for element in self.soup.descendants:
+            if isinstance(element, NavigableString):
+                if type(element) in text_types:
+                    strings.append(element)
+                continue
+            if element.name == "li":
+                text = element.get_text(strip=True)
+                # HSN codes are 6-8 digit numbers
+                if text.isdigit() and len(text) in [6, 8]:
+                    list_codes.append(text)
+                continue
+            if element.name not in ("p", "h2"):
+                continue
+
+            for index in pending.pop(id(element.parent), ()):
+                labels[index][1] = element
+            if element.name == "p" and "text-cyan-700" in element.get("class", ()):
+                pending.setdefault(id(element.parent), []).append(len(labels))
+                labels.append([element.get_text(strip=True).title(), None])
+
+        data = {}
+        for label, value_element in labels:
+            data[label] = value_element.get_text(
+                strip=True).title() if value_element else "N/A"
+        return data, list_codes, strings
+
     def extract_address_parts(self, address):
         """Extract city, district, state, pincode from address."""
         parts = address.split(", ")
@@ -75,23 +121,21 @@ class GstExtractor(BaseScraper):
         else:
             return "N/A", "N/A", "N/A", "N/A"
     
-    def extract_hsn_codes(self):
-        """Extract HSN codes from the page."""
+    def extract_hsn_codes(self, list_codes=None, strings=None):
+        """
+        Extract HSN codes from the page. `list_codes` and `strings` are what
+        scan_page collected; the page is scanned if they are not given.
+        """
         try:
-            hsn_codes = []
-            
             # Method 1: Look for list items (HSN codes are often in <li> tags)
-            list_items = self.soup.find_all('li')
-            for li in list_items:
-                text = li.get_text(strip=True)
-                # HSN codes are 6-8 digit numbers
-                if text.isdigit() and len(text) in [6, 8]:
-                    hsn_codes.append(text)
+            if list_codes is None or strings is None:
+                _, list_codes, strings = self.scan_page()
+            hsn_codes = list(list_codes)
             
             # Method 2: Regex search in page text as fallback
             if not hsn_codes:
                 code_pattern = re.compile(r'\b(\d{6}|\d{8})\b')
-                page_text = self.soup.get_text()
+                page_text = "".join(strings)
                 matches = code_pattern.findall(page_text)
                 
                 for match in matches:
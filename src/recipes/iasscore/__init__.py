@@ -1,10 +1,13 @@
 
 from utils.scraper import MicroTopicsIasscoreUrls, MicroTopicsIasscore
+from core.http_cache import configure_http_cache
 import json
 import os
 
 
 def main():
+    configure_http_cache('./data/http_cache')
+
     def get_url():
         return "https://iasscore.in/upsc-syllabus/history/ancient-history"
 
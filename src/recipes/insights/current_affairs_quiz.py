@@ -1,78 +1,115 @@
-import time
+import os
 from tqdm import tqdm
 from utils.scraper import SecureQuizUrl, MCQInsights, Scraper
 import csv
+from core.archive import ARCHIVE_COLUMNS, archive_record
 from core.db import GenericDatabase, String
+from core.frontier import Frontier, DONE, PENDING
+from core.http_cache import configure_http_cache
+from core.parallel import map_batches
 
 source = "current"
 csv_file = f"./data/{source}.csv"
 ouput_file = f"./data/{source}_outputs.csv"
+http_cache_dir = "./data/http_cache"
+frontier_file = f"./data/{source}.frontier.db"
+csv_header = ["question", "answer", "explanation", "a", "b", "c", "d", "e", "f", "source"]
 
 
 def main():
-    to_csv(ouput_file)
+    to_csv(ouput_file, workers=os.cpu_count())
     return
     to_csv(ouput_file)
     return
 
 
-def to_csv(output_file):
+def question_rows(url, html):
+    """Parse one archived page into CSV rows."""
+    scraper = MCQInsights(base_url=url)
+    scraper.scrape(content=html)
+
+    questions = scraper.scraped_data[0] if scraper.scraped_data else []
+
+    return [[
+        question.get("question", ""),
+        question.get("answer", ""),
+        question.get("explanation", ""),
+        question.get("a", ""),
+        question.get("b", ""),
+        question.get("c", ""),
+        question.get("d", ""),
+        question.get("e", ""),
+        question.get("f", ""),
+        url
+    ] for question in questions]
+
+
+def parse_batch(pages):
+    """Worker task: CSV rows for a batch of (url, html) pairs."""
+    return [row for url, html in pages for row in question_rows(url, html)]
+
+
+def to_csv(output_file, workers=1, ordered=True, batch_size=50):
+    """
+    Re-parse the archived pages into a CSV. With workers > 1 batches of pages
+    are parsed in a process pool; ordered=False writes each batch as soon as
+    it is done instead of in archive order.
+    """
     db_path = f"sqlite:///data/{source}.db"
     db = GenericDatabase(db_path)
 
     with open(output_file, mode="w", newline="", encoding="utf-8") as file:
         writer = csv.writer(file)
 
-        writer.writerow(
-            ["question", "answer", "explanation", "a", "b", "c", "d", "e", "f", "source"])
-
-        for url, html in db.get_urls_and_html("scraped_html"):
-            scraper = MCQInsights(base_url=url)
-            scraper.scrape(content=html)
+        writer.writerow(csv_header)
 
-            questions = scraper.scraped_data[0] if scraper.scraped_data else []
+        pages = db.get_urls_and_html("scraped_html")
+        for rows in map_batches(parse_batch, pages, workers, batch_size, ordered):
+            writer.writerows(rows)
 
-            if not questions:
-                continue  # Skip if no questions found
 
-            for question in questions:
-                writer.writerow([
-                    question.get("question", ""),
-                    question.get("answer", ""),
-                    question.get("explanation", ""),
-                    question.get("a", ""),
-                    question.get("b", ""),
-                    question.get("c", ""),
-                    question.get("d", ""),
-                    question.get("e", ""),
-                    question.get("f", ""),
-                    url
-                ])
+def open_frontier():
+    """
+    Open the crawl frontier. When it is first created it is seeded with the
+    already archived URLs (as done) and the URLs from the CSV (as pending).
+    """
+    seed = not os.path.exists(frontier_file)
+    frontier = Frontier(frontier_file)
+    if seed:
+        db = GenericDatabase(f"sqlite:///data/{source}.db")
+        if source in db.metadata.tables:
+            frontier.add_many(db.get_urls(source), state=DONE)
+        db.close()
+        frontier.add_many(line for line in get_url() if line.strip() != "URL")
+    return frontier
 
 
-def html_to_db():
-    urls = get_url()
+def html_to_db(batch_size=50):
+    configure_http_cache(http_cache_dir)
     db = GenericDatabase(f"sqlite:///data/{source}.db")
-    db.create_table_if_not_exists(source, {"url": String, "html": String})
+    # Raw response bytes are archived compressed; `html` is only read for old rows
+    db.create_table_if_not_exists(source, {"url": String, "html": String, **ARCHIVE_COLUMNS})
+    db.add_missing_columns(source, ARCHIVE_COLUMNS)
+    frontier = open_frontier()
 
-    total_urls = len(urls)
-    start_time = time.time()
-
-    with tqdm(total=total_urls, desc="Processing URLs", unit="url") as pbar:
-        for index, url in enumerate(urls, start=1):
-            # Update progress bar with estimated time left
-            elapsed_time = time.time() - start_time
-            avg_time_per_url = elapsed_time / index
-            remaining_time = (avg_time_per_url * (total_urls - index)) / 3600
-
-            pbar.set_postfix({"ETA": f"{remaining_time:.2f} hrs"})
-            pbar.update(1)
-            if db.url_exists(source, url):
-                continue
-            scraper = Scraper(base_url=url)
-            scraper.scrape()
-            html = scraper.get_html()
-            db.insert(source, {"url": url, "html": html}, unique_field="url")
+    # Pending URLs are claimed in batches; a crash leaves them in flight and
+    # the next run puts them back in the queue.
+    try:
+        with tqdm(total=frontier.counts()[PENDING], desc="Processing URLs", unit="url") as pbar:
+            while urls := frontier.claim(batch_size):
+                for url in urls:
+                    try:
+                        scraper = Scraper(base_url=url)
+                        scraper.fetch_page()
+                        db.insert(source, archive_record(scraper.fetcher.last_page))
+                        frontier.mark_done(url)
+                    except Exception as e:
+                        print(f"Failed {url}: {e}")
+                        frontier.mark_failed(url, str(e))
+                    pbar.update(1)
+    finally:
+        frontier.close()
+        db.close()
 
 
 def get_url(start=None, end=None):
@@ -109,18 +146,8 @@ def get_url_csv():
         # "https://www.insightsonindia.com/insights-current-affairs-revision-through-daily-mcqs/?lcp_page0=4#lcp_instance_0",
         # "https://www.insightsonindia.com/insta-dart/",
     ]
-    scraped_urls = []
-    existing_urls = set()  # Use a set for efficient checking of existing URLs
-
-    # Load existing URLs from CSV if it exists
-    try:
-        with open(csv_file, mode="r", encoding="utf-8") as file:
-            reader = csv.reader(file)
-            next(reader, None)  # Skip the header row if it exists
-            for row in reader:
-                existing_urls.add(row[0])  # Add existing URLs to the set
-    except FileNotFoundError:
-        pass  # If the file doesn't exist, start with an empty set
+    configure_http_cache(http_cache_dir)
+    frontier = open_frontier()
 
     try:
         for url in urls:
@@ -131,29 +158,12 @@ def get_url_csv():
                 continue
             print(f"Scraped URLs from {url}")
 
-            for scraped_url in scraper.urls:
-                if (
-                    scraped_url not in existing_urls
-                ):  # check if url is already present or not
-                    scraped_urls.append(scraped_url)
-                    existing_urls.add(
-                        scraped_url
-                    )  # Add the new URL to the set to avoid duplicates in the current run
-
-        if scraped_urls:
-            with open(csv_file, mode="w", newline="", encoding="utf-8") as file:
-                writer = csv.writer(file)
-                writer.writerow(["URL"])  # Add header
-                for (
-                    url
-                    # Write all unique URLs (including existing ones)
-                ) in existing_urls:
-                    writer.writerow([url])
-            print(f"URLs saved to {csv_file}")
-        else:
-            # If no new url is there to add
-            print("No new unique URLs to add.")
+            # The frontier skips URLs it has already seen
+            added = frontier.add_many(scraper.urls)
+            print(f"{added} new URLs queued")
 
     except Exception as e:
         print(f"Error: {e}")
         raise e
+    finally:
+        frontier.close()
@@ -1,37 +1,34 @@
 from core.services.pdf_service import PDFService
 from core.services.mcq_service import MCQExtractor
-from core import re
+from core.mcq_grammar import NUMBERED, compile_grammar
 
 
 class VisionMCQExtractor(MCQExtractor):
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
+        self.scanner = compile_grammar(NUMBERED)
         self.questions = {}
         self.explanations = {}
         self.mcqs = []
 
     def process_questions(self):
-        mcq_pattern = re.compile(
-            r"^\s*(\d+)\.\s*\n(.*?)(?=\n\s*\d+\.\s*\n|\Z)", re.DOTALL | re.MULTILINE)
         last_question_no = 0
-        mcqs = mcq_pattern.findall(self.text)
 
-        for i, mcq in enumerate(mcqs):
-            question_no = int(mcq[0])
+        for groups in self.scanner.questions(self.text):
+            question_no = int(groups["no"])
 
             if question_no != last_question_no + 1 and last_question_no != 0:
                 continue
 
-            question_text = mcq[1]  # Directly assign the current question text
+            question_text = groups["question"]
 
             if "Copyright © by Vision IAS" in question_text:
                 question_text = question_text.split(
                     "Copyright © by Vision IAS")[0].strip()
 
-            options = self._extract_options(question_text)
-            question_text = self._remove_options_from_text(
-                question_text).strip()
+            question_text, options = self.scanner.split_options(question_text)
+            question_text = question_text.strip()
 
             self.questions[question_no] = {
                 "question": question_text,
@@ -43,41 +40,19 @@ class VisionMCQExtractor(MCQExtractor):
             last_question_no = question_no
 
     def process_explanation(self):
-        explanation_pattern = re.compile(
-            r"^Q\s*(\d+)\.([A-F | a-f])", re.DOTALL | re.MULTILINE)
         last_question_no = 0
 
-        for match in explanation_pattern.finditer(self.text):
-            question_no = int(match.group(1))
+        for groups, explanation_content in self.scanner.answers(self.text):
+            question_no = int(groups["no"])
             if question_no != last_question_no + 1 and last_question_no != 0:
                 continue
 
-            explanation_content = self._get_explanation_content(match)
             self.explanations[question_no] = {
-                "answer": match.group(2).lower(),
+                "answer": groups["answer"].lower(),
                 "explanation": explanation_content
             }
             last_question_no = question_no
 
-    def _extract_options(self, question_text):
-        options_pattern = re.compile(r"^\([a-f]\)\s*(.+)$", re.MULTILINE)
-        return options_pattern.findall(question_text)
-
-    def _remove_options_from_text(self, question_text):
-        options_pattern = re.compile(r"^[a-f]\)\s*(.+)$", re.MULTILINE)
-        return options_pattern.sub("", question_text)
-
-    def _get_explanation_content(self, match):
-        start = match.end()
-        next_match = next(self._find_next_explanation(match), None)
-        end = start + (next_match.start() if next_match else len(self.text))
-        return self.text[start:end].strip()
-
-    def _find_next_explanation(self, match):
-        explanation_pattern = re.compile(
-            r"^Q\s*(\d+)\.([A-F | a-f])", re.DOTALL | re.MULTILINE)
-        return explanation_pattern.finditer(self.text[match.end():])
-
     def get_mcqs(self):
         self.mcqs = [
             {
@@ -0,0 +1,112 @@
+"""
+Answer Marker Benchmark - Literal-prefiltered search vs plain regex search
+
+MCQInsights.build_answer_pattern matches an answer marker ("Ans: (b)",
+"Solution - c", "Correct Answer: d", ...) with a 13-branch pattern. This
+script checks that ANSWER_PATTERN.search, which only tries that pattern where
+one of the marker literals starts, finds exactly the match of a plain
+re.search, on random strings and on generated explanations, and times both.
+
+Usage:
+    python src/scripts/bench_answer_markers.py
+    python src/scripts/bench_answer_markers.py --kilobytes 10 100 1000 --repeat 5
+"""
+
+import argparse
+import os
+import random
+import re
+import sys
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
+sys.path[:0] = [os.path.join(ROOT, 'src'), ROOT]
+
+from core.prefilter import FIRST_WINDOW  # noqa: E402
+from utils.scraper import ANSWER_PATTERN, MCQInsights  # noqa: E402
+
+WORDS = ("the act provides that every state shall have a legislature and the governor may act on "
+         "the advice of the council of ministers under Article 163 of the Constitution of India "
+         "Statement 1 is correct as the Supreme Court held in the case Statement 2 is incorrect").split()
+MARKERS = ["Ans: (b)", "Ans-. c", "Ans. 2) d", "Solution:\nA", "Correct Answer: (c)", "Correct Option: a",
+           "Sol. b", "Answer - Both", "SOLUTION: d", "उत्तर: (a)", "Correct\n"]
+ALPHABET = ["A", "a", "b", "(", ")", ":", "-", ".", " ", "\n", "2", "ns", "ol", "Ans", "Sol",
+            "Correct", "Answer", "SOLUTION", "उत्तर"]
+
+
+def explanation(rng, size, marker_at):
+    """Prose of about `size` characters with an answer marker at the given fraction (None: no marker)."""
+    words, length = [], 0
+    while length < size:
+        word = rng.choice(WORDS)
+        words.append(word)
+        length += len(word) + 1
+    text = " ".join(words)
+    if marker_at is None:
+        return text
+    cut = text.rfind(" ", 0, int(len(text) * marker_at)) + 1
+    return text[:cut] + rng.choice(MARKERS) + " " + text[cut:]
+
+
+def same(a, b):
+    return (a and (a.span(), a.groups())) == (b and (b.span(), b.groups()))
+
+
+def fuzz(cases):
+    rng = random.Random(0)
+    # The pattern MCQInsights builds, searched the plain way
+    pattern = re.compile(MCQInsights.build_answer_pattern())
+    for _ in range(cases):
+        text = "".join(rng.choice(ALPHABET) for _ in range(rng.randint(0, 40)))
+        if rng.random() < 0.5:
+            # Long enough to be prefiltered, with the first window ending near the random part
+            cut = rng.randint(0, len(text))
+            text = text[:cut] + "x" * rng.randint(FIRST_WINDOW - 50, FIRST_WINDOW) + text[cut:]
+        pos = rng.randint(0, min(len(text), 40))
+        if not same(pattern.search(text, pos), ANSWER_PATTERN.search(text, pos)):
+            return text
+    return None
+
+
+def best_time(fn, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check and benchmark answer-marker search")
+    parser.add_argument("--kilobytes", type=float, nargs="+", default=[1, 10, 100, 1000],
+                        help="Sizes of the generated explanations")
+    parser.add_argument("--fuzz", type=int, default=20000, help="Random strings to check")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per search (best is reported)")
+    args = parser.parse_args()
+
+    failure = fuzz(args.fuzz)
+    if failure is not None:
+        print(f"Fuzz: DIFFERS on {failure!r}")
+        sys.exit(1)
+    print(f"Fuzz: {args.fuzz} random strings identical")
+
+    for marker in MARKERS:
+        match = ANSWER_PATTERN.search(marker + " rationale")
+        print(f"{marker + ' rationale'!r}: {match and match.groups()}")
+
+    rng = random.Random(1)
+    pattern = re.compile(MCQInsights.build_answer_pattern())
+    print(f"{'KB':>8} {'marker':>8} {'regex':>10} {'prefilter':>10} {'speedup':>8}  match")
+    for kilobytes in args.kilobytes:
+        for marker_at, label in ((None, "none"), (0.9, "end"), (0.0, "start")):
+            text = explanation(rng, int(kilobytes * 1000), marker_at)
+            verdict = "identical" if same(pattern.search(text), ANSWER_PATTERN.search(text)) else "DIFFERS"
+            regex_seconds = best_time(lambda: pattern.search(text), args.repeat)
+            seconds = best_time(lambda: ANSWER_PATTERN.search(text), args.repeat)
+            print(f"{kilobytes:>8g} {label:>8} {regex_seconds * 1e3:>8.3f}ms {seconds * 1e3:>8.3f}ms "
+                  f"{regex_seconds / seconds:>7.1f}x  {verdict}")
+
+
+if __name__ == "__main__":
+    main()
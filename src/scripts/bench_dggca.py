@@ -0,0 +1,157 @@
+"""
+DGGCA Parser Benchmark - State-machine question parser vs the previous regex
+
+The previous DggcaExtractor.extract_questions matched each date block with one
+DOTALL regex of eight lazy groups. When a record is malformed (no
+"Answer: X."), it backtracks through every later A./B./C./D. and its time
+grows polynomially with the block. This script:
+
+  1. checks the state machine returns the same questions on well-formed
+     blocks (generated, with options on one line or several), and on a PDF
+     with --pdf;
+  2. times both on blocks where every record lacks its answer, skipping the
+     regex once its next run would take longer than --legacy-limit seconds;
+  3. times the state machine on blocks written on a single line ("Q) x Q) x
+     ..."), where the time must double, not quadruple, with the size.
+
+Usage:
+    python src/scripts/bench_dggca.py
+    python src/scripts/bench_dggca.py --pdf data/dggca.pdf --sizes 4 8 12 1000 100000
+    python src/scripts/bench_dggca.py --line-sizes 10000 20000 40000 80000
+"""
+
+import argparse
+import logging
+import os
+import random
+import re
+import sys
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
+sys.path.insert(0, ROOT)
+
+from src.recipes.dggca_recipe import DggcaExtractor  # noqa: E402
+
+DATE = "1st May"
+
+
+class LegacyDggcaExtractor(DggcaExtractor):
+    """extract_questions as it was before the state machine, kept for comparison."""
+
+    def extract_questions(self, date, content):
+        questions = []
+        question_pattern = re.compile(
+            r'Q\)\s*(.*?)\s*'  # Question
+            r'A\.\s*(.*?)\s*'  # Option A
+            r'B\.\s*(.*?)\s*'  # Option B
+            r'C\.\s*(.*?)\s*'  # Option C
+            r'D\.\s*(.*?)\s*'  # Option D
+            r'Answer:\s*([A-D])\.\s*(.*?)\s*'  # Correct answer
+            r'(.*?)(?=Q\)|$)',  # Explanation (until next question or end)
+            re.DOTALL
+        )
+
+        matches = question_pattern.findall(content)
+        for match in matches:
+            question, a, b, c, d, answer, correct_option, explanation = match
+            questions.append({
+                "metadata": {
+                    "date": date},
+                "question": question.strip(),
+                "a": a.strip(),
+                "b": b.strip(),
+                "c": c.strip(),
+                "d": d.strip(),
+                "answer": answer.strip().lower(),
+                "explanation": explanation.strip() if explanation.strip() else None,
+                "source": self.kwargs.get("source"),
+            })
+        return questions
+
+
+def well_formed_block(rng, records):
+    parts = []
+    for i in range(records):
+        sep = rng.choice([" ", "\n"])
+        parts.append(
+            f"Q) Which body audits item {i} under the U.S.A. treaty?\n"
+            f"A. Option a {i}{sep}B. Option b{sep}C. Option c{sep}D. Option d\n"
+            f"Answer:{rng.choice([' ', '', chr(10)])}{'ABCD'[i % 4]}. {rng.choice(['Option text', ''])}\n"
+            + "Explanation line.\n" * rng.randint(0, 3))
+    return "".join(parts).strip()
+
+
+def malformed_block(records):
+    """Records whose answer line lost its "Answer: X." marker."""
+    return "\n".join(f"Q) Question {i}?\nA. a\nB. b\nC. c\nD. d\nAnswer pending\nExplanation {i}"
+                     for i in range(records))
+
+
+def timed(extractor, content):
+    start = time.perf_counter()
+    extractor.extract_questions(DATE, content)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the DGGCA question parser")
+    parser.add_argument("--pdf", help="Also compare full extraction of this PDF")
+    parser.add_argument("--blocks", type=int, default=2000, help="Random well-formed blocks to compare")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[2, 4, 6, 8, 10, 1000, 100000],
+                        help="Malformed records per block to time")
+    parser.add_argument("--line-sizes", type=int, nargs="+", default=[10000, 20000, 40000, 80000],
+                        help="Records of single-line blocks to time (each size double the last)")
+    parser.add_argument("--legacy-limit", type=float, default=5.0,
+                        help="Skip regex runs expected to take longer than this (seconds)")
+    args = parser.parse_args()
+
+    # Every malformed record is logged; keep the output readable
+    logging.getLogger("src.recipes.dggca_recipe").setLevel(logging.ERROR)
+    extractor = DggcaExtractor(args.pdf or "")
+    legacy = LegacyDggcaExtractor(args.pdf or "")
+
+    rng = random.Random(5)
+    diffs = 0
+    for _ in range(args.blocks):
+        content = well_formed_block(rng, rng.randint(0, 6))
+        for text in (content, content.replace("\n", " ")):
+            diffs += extractor.extract_questions(DATE, text) != legacy.extract_questions(DATE, text)
+    print(f"{args.blocks} well-formed blocks, as lines and on one line: "
+          + ("identical" if not diffs else f"{diffs} DIFFER"))
+
+    if args.pdf:
+        records = extractor.extract()
+        verdict = "identical" if records == legacy.extract() else "DIFFERS"
+        print(f"{args.pdf}: {len(records)} questions, {len(extractor.malformed)} malformed, output {verdict}")
+
+    print(f"{'records':>8} {'KB':>8} {'regex':>10} {'state machine':>14}  reported")
+    last_legacy = None
+    for size in args.sizes:
+        content = malformed_block(size)
+        extractor.malformed.clear()
+        seconds = timed(extractor, content)
+        # The regex's time grows roughly with the fifth power of the records
+        expected = last_legacy[1] * (size / last_legacy[0]) ** 5 if last_legacy else 0
+        if expected > args.legacy_limit:
+            legacy_column = "skipped"
+        else:
+            legacy_seconds = timed(legacy, content)
+            legacy_column = f"{legacy_seconds:.4f}s"
+            last_legacy = (size, legacy_seconds)
+        print(f"{size:>8} {len(content) / 1e3:>8.1f} {legacy_column:>10} {seconds:>13.4f}s  "
+              f"{len(extractor.malformed)}")
+
+    print(f"{'one line':>8} {'KB':>8} {'state machine':>14} {'ratio':>6}  reported")
+    last = None
+    for size in args.line_sizes:
+        content = "Q) x " * size
+        extractor.malformed.clear()
+        seconds = timed(extractor, content)
+        ratio = f"{seconds / last:.1f}" if last else ""
+        print(f"{size:>8} {len(content) / 1e3:>8.1f} {seconds:>13.4f}s {ratio:>6}  {len(extractor.malformed)}")
+        last = seconds
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""
+Explanation Benchmark - One-pass answer-key segmentation vs the previous implementation
+
+Builds a synthetic question bank followed by its answer key ("Q12.B" and an
+explanation per question) and runs GenericMCQExtractor.process_explanation
+on it, next to the previous implementation that copied the rest of the text
+and re-ran finditer for every explanation, checking the explanations match.
+
+Usage:
+    python src/scripts/bench_explanations.py
+    python src/scripts/bench_explanations.py --questions 2000 8000 16000
+    python src/scripts/bench_explanations.py --text book.txt
+"""
+
+import argparse
+import os
+import re
+import sys
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
+sys.path[:0] = [os.path.join(ROOT, 'src'), ROOT]
+
+from core.services.kiran import GenericMCQExtractor  # noqa: E402
+
+
+class LegacyGenericMCQExtractor(GenericMCQExtractor):
+    """The explanation lookup as it was before the one-pass segmentation, kept for comparison."""
+
+    explanation_pattern = re.compile(r"^Q\s*(\d+)\.([A-F | a-f])", re.DOTALL | re.MULTILINE)
+
+    def process_explanation(self):
+        explanation_pattern = self.explanation_pattern
+        last_question_no = 0
+
+        for match in explanation_pattern.finditer(self.text):
+            question_no = int(match.group(1))
+            if question_no != last_question_no + 1 and last_question_no != 0:
+                continue
+
+            explanation_content = self._get_explanation_content(match)
+            self.explanations[question_no] = {
+                "answer": match.group(2).lower(),
+                "explanation": explanation_content
+            }
+            last_question_no = question_no
+
+    def _get_explanation_content(self, match):
+        start = match.end()
+        next_match = next(self._find_next_explanation(match), None)
+        end = start + (next_match.start() if next_match else len(self.text))
+        return self.text[start:end].strip()
+
+    def _find_next_explanation(self, match):
+        return self.explanation_pattern.finditer(self.text[match.end():])
+
+
+def generate_text(questions):
+    """Questions in the layout GenericMCQExtractor expects, then the answer key."""
+    parts = []
+    for n in range(1, questions + 1):
+        parts.append(f"{n}.\nWhich of the following statements about item {n} is correct?\n"
+                     f"(a) Option one for {n}\n(b) Option two for {n}\n"
+                     f"(c) Option three for {n}\n(d) Option four for {n}\n")
+    for n in range(1, questions + 1):
+        parts.append(f"Q{n}.{'ABCD'[n % 4]}\nExplanation: item {n} follows from rule {n % 17}. "
+                     + "Statement 1 is correct as the act says so. " * (3 + n % 5) + "\n")
+    return "".join(parts)
+
+
+def run(extractor_cls, text):
+    extractor = extractor_cls(pdf_service=None)
+    extractor.text = text
+    start = time.perf_counter()
+    extractor.process_explanation()
+    return time.perf_counter() - start, extractor.explanations
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark answer-key segmentation")
+    parser.add_argument("--questions", type=int, nargs="+", default=[1000, 4000, 8000],
+                        help="Sizes of the generated question banks")
+    parser.add_argument("--text", help="Use this text file (e.g. an extracted book) instead")
+    args = parser.parse_args()
+
+    if args.text:
+        with open(args.text, encoding="utf-8") as f:
+            texts = [(args.text, f.read())]
+    else:
+        texts = [(f"{n} questions", generate_text(n)) for n in args.questions]
+
+    print(f"{'input':<16} {'MB':>6} {'legacy':>9} {'one-pass':>9} {'speedup':>8}  output")
+    for name, text in texts:
+        megabytes = len(text.encode("utf-8")) / 1e6
+        legacy_seconds, legacy = run(LegacyGenericMCQExtractor, text)
+        seconds, explanations = run(GenericMCQExtractor, text)
+        verdict = "identical" if explanations == legacy else "DIFFERS"
+        print(f"{name:<16} {megabytes:>6.2f} {legacy_seconds:>8.3f}s {seconds:>8.3f}s "
+              f"{legacy_seconds / seconds:>7.1f}x  {verdict}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+"""
+GST Parser Benchmark - Single-pass extractor vs the previous implementation
+
+Runs GstExtractor.parse_page over stored GST pages and compares it with the
+previous implementation (find_all + find_next_sibling per label, then a
+second walk over every <li>), checking the records match. Building the tree
+is timed separately, as it is the same for both.
+
+Pages come from a cassette recorded while scraping (see src/core/cassette.py)
+or a directory of saved HTML files.
+
+Usage:
+    python src/scripts/bench_gst.py data/gst.cassette
+    python src/scripts/bench_gst.py data/gst_pages/ --repeat 5 --parser lxml
+"""
+
+import argparse
+import os
+import re
+import sys
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
+sys.path.insert(0, ROOT)
+
+from src.recipes.gst_recipe import GstExtractor  # noqa: E402
+
+
+class LegacyGstExtractor(GstExtractor):
+    """The extractor as it was before the single-pass scan, kept for comparison."""
+
+    def scan_page(self):
+        data = {}
+        gstin_details = self.soup.find_all("p", class_="text-cyan-700")
+        for p in gstin_details:
+            label = p.get_text(strip=True).title()
+            value_element = p.find_next_sibling(["h2", "p"])
+            value = value_element.get_text(
+                strip=True).title() if value_element else "N/A"
+            data[label] = value
+        return data, None, None
+
+    def extract_hsn_codes(self, list_codes=None, strings=None):
+        hsn_codes = []
+        for li in self.soup.find_all('li'):
+            text = li.get_text(strip=True)
+            if text.isdigit() and len(text) in [6, 8]:
+                hsn_codes.append(text)
+        if not hsn_codes:
+            code_pattern = re.compile(r'\b(\d{6}|\d{8})\b')
+            for match in code_pattern.findall(self.soup.get_text()):
+                if not match.startswith(('19', '20', '01', '02', '03', '04', '05', '06',
+                                         '07', '08', '09', '10', '11', '12')):
+                    hsn_codes.append(match)
+        unique_codes = list(dict.fromkeys(hsn_codes))
+        return ", ".join(unique_codes[:10]) if unique_codes else "N/A"
+
+
+def load_pages(path):
+    """Return [(url, html)] from a directory of HTML files or a cassette."""
+    if os.path.isdir(path):
+        pages = []
+        for name in sorted(os.listdir(path)):
+            with open(os.path.join(path, name), encoding="utf-8", errors="replace") as f:
+                pages.append((name, f.read()))
+        return pages
+
+    from src.core.cassette import Cassette, REPLAY
+
+    cassette = Cassette(path, REPLAY)
+    pages = []
+    for url in cassette.urls():
+        response = cassette.play(url)
+        if response.status_code == 200:
+            pages.append((url, response.text))
+    cassette.close()
+    return pages
+
+
+def run(extractor_cls, pages, parser=None, repeat=1):
+    """
+    Parse every page `repeat` times; return (tree build seconds, extraction
+    seconds, records of the last pass).
+    """
+    build_time = extract_time = 0.0
+    records = []
+    for _ in range(repeat):
+        records = []
+        for url, html in pages:
+            extractor = extractor_cls(base_url=url, content=html, parser=parser)
+            start = time.perf_counter()
+            extractor.pre_parse(html)
+            built = time.perf_counter()
+            records.append(extractor.parse_page())
+            extract_time += time.perf_counter() - built
+            build_time += built - start
+    return build_time, extract_time, records
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the GST page extractor")
+    parser.add_argument("pages", help="Cassette file or directory of saved GST pages")
+    parser.add_argument("--repeat", type=int, default=3, help="Passes over the page set")
+    parser.add_argument("--parser", help="HTML parser backend (default: html.parser)")
+    args = parser.parse_args()
+
+    pages = load_pages(args.pages)
+    if not pages:
+        print(f"No GST pages found in {args.pages}")
+        sys.exit(1)
+
+    legacy_build, legacy_time, legacy_records = run(LegacyGstExtractor, pages, args.parser, args.repeat)
+    new_build, new_time, new_records = run(GstExtractor, pages, args.parser, args.repeat)
+    mismatches = [url for (url, _), a, b in zip(pages, legacy_records, new_records) if a != b]
+
+    total = len(pages) * args.repeat
+    print(f"{len(pages)} pages x{args.repeat}, tree build {(legacy_build + new_build) / 2 / total * 1000:.2f} ms/page")
+    print(f"Legacy:      {legacy_time:.3f}s ({legacy_time / total * 1000:.2f} ms/page)")
+    print(f"Single pass: {new_time:.3f}s ({new_time / total * 1000:.2f} ms/page, "
+          f"{legacy_time / new_time:.2f}x)")
+    if mismatches:
+        print(f"{len(mismatches)} pages differ, e.g. {mismatches[:5]}")
+        sys.exit(1)
+    print("Records identical")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+"""
+Normalizer Benchmark - src/core/normalize.py vs the previous step-by-step version
+
+Checks that src/core/normalize.py gives exactly the output of the previous
+DggcaExtractor.normalize_text (NFKC, four re.sub and four str.replace passes),
+both on the whole text and streamed page by page. Random strings built from
+the characters the rules care about are checked as well. Then it reports
+throughput in MB/s.
+
+Usage:
+    python src/scripts/bench_normalize.py
+    python src/scripts/bench_normalize.py --pdf data/dggca.pdf --fuzz 20000
+    python src/scripts/bench_normalize.py --megabytes 20 --repeat 5
+"""
+
+import argparse
+import os
+import random
+import re
+import sys
+import time
+import unicodedata
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
+sys.path.insert(0, ROOT)
+
+from src.core.normalize import iter_normalized, normalize_text  # noqa: E402
+
+# Characters the rules treat specially, plus a few that NFKC rewrites
+# (no-break space, full-width letters, ligature, combining accent)
+ALPHABET = list("aZ9_ .,()\t\n\n\u202a\u202e\u00a0\uff21\ufb01\u0301\u00e9") + ["ab", "Cd", " (", "\n\n\n"]
+
+
+def legacy_normalize(text):
+    """DggcaExtractor.normalize_text before the fused version, kept for comparison."""
+    text = unicodedata.normalize("NFKC", text)
+    text = re.sub(r'[\u202a-\u202e]', '', text)
+    text = re.sub(r'[ \t]+', ' ', text)
+    text = re.sub(r'\n+', '\n', text)
+    text = re.sub(r'(\w)([A-Z])', r'\1 \2', text)
+    text = text.replace(" .", ".").replace(" ,", ",")
+    text = text.replace(" (", "(").replace(" )", ")")
+    return text.strip()
+
+
+def generate_pages(megabytes, page_size=4000):
+    """DGGCA-like pages with the artefacts PDF extraction leaves behind."""
+    rng = random.Random(7)
+    lines = [
+        "Q) Which scheme was launched by the Ministry of Rural Development in the year 2005?",
+        "A. Pradhan Mantri Awas Yojana B. Rural Employment Guarantee C. Livelihood Mission D. Gram Sadak",
+        "Answer: B. Rural Employment Guarantee",
+        "Explanation: The scheme was notified under the Act and guarantees wage employment to every",
+        "rural household whose adult members volunteer to do unskilled manual work.",
+        "It is implemented by the  Ministry of Rural Development (MoRD) , with the states .",
+        "\u202aThe schemeWas\treviewed in\t2020\u202c by the NITI Aayog.",
+        "",
+        "12th March",
+    ]
+    pages, size = [], 0
+    while size < megabytes * 1e6:
+        page = []
+        while sum(map(len, page)) < page_size:
+            page.append(rng.choice(lines) + "\n" * rng.randint(1, 3))
+        pages.append("".join(page))
+        size += page_size
+    return pages
+
+
+def pdf_pages(pdf_path):
+    from src.core.services.pdf_service import PDFService
+
+    return [text for _, text in PDFService(pdf_path).iter_pages()]
+
+
+def check(text, pieces):
+    expected = legacy_normalize(text)
+    return normalize_text(text) == expected and "".join(iter_normalized(pieces)) == expected
+
+
+def fuzz(cases):
+    rng = random.Random(0)
+    for _ in range(cases):
+        text = "".join(rng.choice(ALPHABET) for _ in range(rng.randint(0, 60)))
+        cuts = sorted(rng.sample(range(len(text) + 1), min(len(text) + 1, rng.randint(0, 4))))
+        pieces = [text[a:b] for a, b in zip([0] + cuts, cuts + [len(text)])]
+        if not check(text, pieces):
+            return text, pieces
+    return None
+
+
+def best_time(fn, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check and benchmark the PDF text normalizer")
+    parser.add_argument("--pdf", help="Use the pages of this PDF (default: generated text)")
+    parser.add_argument("--megabytes", type=float, default=8, help="Size of the generated text")
+    parser.add_argument("--fuzz", type=int, default=5000, help="Random strings to check")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per implementation (best is reported)")
+    args = parser.parse_args()
+
+    failure = fuzz(args.fuzz)
+    if failure:
+        print(f"Fuzz: DIFFERS on {failure[1]!r}")
+        sys.exit(1)
+    print(f"Fuzz: {args.fuzz} random strings identical (whole and streamed)")
+
+    pages = pdf_pages(args.pdf) if args.pdf else generate_pages(args.megabytes)
+    text = "".join(pages)
+    megabytes = len(text.encode("utf-8")) / 1e6
+    verdict = "identical" if check(text, pages) else "DIFFERS"
+    print(f"{len(pages)} pages, {megabytes:.1f} MB: output {verdict}")
+
+    print(f"{'implementation':<24} {'best':>9} {'MB/s':>8}")
+    runs = [
+        ("legacy (9 passes)", lambda: legacy_normalize(text)),
+        ("normalize_text", lambda: normalize_text(text)),
+        ("iter_normalized (pages)", lambda: "".join(iter_normalized(pages))),
+    ]
+    for name, fn in runs:
+        seconds = best_time(fn, args.repeat)
+        print(f"{name:<24} {seconds:>8.3f}s {megabytes / seconds:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
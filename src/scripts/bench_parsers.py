@@ -0,0 +1,108 @@
+"""
+Parser Benchmark - Compare HTML parser backends on archived pages
+
+Parses the HTML stored in a SQLite archive (e.g. the `scraped_html` table of
+data/current.db) with each backend and reports pages/s and MB/s. With
+--recipe, the recipe's parse_page also runs and its output is compared with
+html.parser's on the full document, so a faster backend, or the recipe's
+parse_only regions, can be checked before they are switched on.
+
+Usage:
+    python src/scripts/bench_parsers.py data/current.db
+    python src/scripts/bench_parsers.py data/current.db --recipe mcq_insights --limit 200
+"""
+
+import argparse
+import os
+import sys
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
+sys.path[:0] = [os.path.join(ROOT, 'src'), ROOT]
+
+from bench_scrapers import RECIPES, load_recipe  # noqa: E402
+
+BACKENDS = ["html.parser", "lxml", "html5lib"]
+
+
+def load_pages(db_path, table, limit=None):
+    from core.db import GenericDatabase
+
+    db = GenericDatabase(f"sqlite:///{db_path}")
+    pages = []
+    for url, html in db.get_urls_and_html(table):
+        if html:
+            pages.append((url, html))
+        if limit and len(pages) >= limit:
+            break
+    db.close()
+    return pages
+
+
+def run(backend, pages, recipe_cls=None, partial=False):
+    """Parse every page; return (seconds, recipe outputs or None)."""
+    from core.parsers import make_soup
+
+    outputs = []
+    start = time.perf_counter()
+    for url, html in pages:
+        if recipe_cls is None:
+            make_soup(html, backend)
+            continue
+        options = {} if partial else {"parse_only": None}
+        scraper = recipe_cls(base_url=url, content=html, parser=backend, **options)
+        scraper.pre_parse(html)
+        try:
+            result = scraper.parse_page()
+            # Older recipes keep their rows on the scraper instead of returning them
+            outputs.append(result if result is not None else getattr(scraper, "scraped_data", None))
+        except Exception as e:
+            outputs.append(f"error: {e}")
+    return time.perf_counter() - start, outputs if recipe_cls else None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark HTML parser backends on archived pages")
+    parser.add_argument("db", help="SQLite archive, e.g. data/current.db")
+    parser.add_argument("--table", default="scraped_html", help="Table with url/html columns")
+    parser.add_argument("--limit", type=int, help="Parse at most this many pages")
+    parser.add_argument("--recipe", choices=sorted(RECIPES), help="Also run this recipe's parse_page")
+    parser.add_argument("--backends", nargs="+", default=BACKENDS, help="Backends to compare")
+    args = parser.parse_args()
+
+    from bs4.builder import builder_registry
+
+    pages = load_pages(args.db, args.table, args.limit)
+    if not pages:
+        print(f"No pages in {args.db}:{args.table}")
+        sys.exit(1)
+    megabytes = sum(len(html.encode("utf-8")) for _, html in pages) / 1e6
+    recipe_cls = load_recipe(args.recipe) if args.recipe else None
+    print(f"{len(pages)} pages, {megabytes:.1f} MB" + (f", recipe {recipe_cls.__name__}" if recipe_cls else ""))
+
+    modes = [False]
+    if recipe_cls is not None and recipe_cls.parse_only is not None:
+        modes.append(True)
+
+    reference = None
+    print(f"{'backend':<26} {'seconds':>9} {'pages/s':>9} {'MB/s':>7}  output")
+    for backend in args.backends:
+        if builder_registry.lookup(backend) is None:
+            print(f"{backend:<26} not installed")
+            continue
+        for partial in modes:
+            name = f"{backend} (parse_only)" if partial else backend
+            seconds, outputs = run(backend, pages, recipe_cls, partial)
+            if outputs is None:
+                verdict = "-"
+            elif reference is None:
+                reference, verdict = outputs, "reference"
+            else:
+                diffs = sum(a != b for a, b in zip(reference, outputs))
+                verdict = "identical" if not diffs else f"{diffs} pages differ"
+            print(f"{name:<26} {seconds:>9.3f} {len(pages) / seconds:>9.1f} "
+                  f"{megabytes / seconds:>7.2f}  {verdict}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+PDF Benchmark - Serial vs multi-process page extraction
+
+Generates a multi-hundred-page MCQ-style PDF (or uses one you pass) and times
+PDFService.extract_text_string with different worker counts, checking every
+run returns exactly the serial text.
+
+Usage:
+    python src/scripts/bench_pdf.py
+    python src/scripts/bench_pdf.py --pages 800 --workers 1 2 4 8
+    python src/scripts/bench_pdf.py --pdf "data/SSC English KIRAN 11600+.pdf"
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
+sys.path.insert(0, ROOT)
+
+
+def generate_pdf(path, page_count, questions_per_page=8):
+    """Write a PDF of numbered MCQs, a few per page, like the question banks we parse."""
+    import fitz
+
+    doc = fitz.open()
+    number = 1
+    for _ in range(page_count):
+        page = doc.new_page()
+        y = 50
+        for _ in range(questions_per_page):
+            lines = [
+                f"{number}. Which of the following statements about item {number} is correct?",
+                f"(a) Option one for {number}   (b) Option two for {number}",
+                f"(c) Option three for {number}   (d) Option four for {number}",
+                f"Ans. ({'abcd'[number % 4]}) Explanation: item {number} follows from rule {number % 17}.",
+            ]
+            for line in lines:
+                page.insert_text((40, y), line, fontsize=9)
+                y += 12
+            y += 14
+            number += 1
+    doc.save(path)
+    doc.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark PDFService page extraction")
+    parser.add_argument("--pdf", help="PDF to read (default: generate one)")
+    parser.add_argument("--pages", type=int, default=400, help="Pages in the generated PDF")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4], help="Worker counts to time")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per worker count (best is reported)")
+    args = parser.parse_args()
+
+    import fitz
+    from src.core.services.pdf_service import PDFService
+
+    pdf_path = args.pdf
+    if not pdf_path:
+        pdf_path = os.path.join(tempfile.mkdtemp(), "bench.pdf")
+        start = time.perf_counter()
+        generate_pdf(pdf_path, args.pages)
+        print(f"Generated {args.pages} pages in {time.perf_counter() - start:.2f}s: {pdf_path}")
+
+    with fitz.open(pdf_path) as doc:
+        page_count = doc.page_count
+    service = PDFService(pdf_path)
+    reference = None
+    print(f"{'workers':>7} {'best':>9} {'pages/s':>9} {'speedup':>8}  output")
+    baseline = None
+    for workers in args.workers:
+        timings = []
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            text = service.extract_text_string(workers=workers)
+            timings.append(time.perf_counter() - start)
+        best = min(timings)
+        baseline = baseline or best
+        if reference is None:
+            reference, verdict = text, "reference"
+        else:
+            verdict = "identical" if text == reference else "DIFFERS"
+        print(f"{workers:>7} {best:>8.3f}s {page_count / best:>9.1f} {baseline / best:>7.2f}x  {verdict}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""
+Scraper Benchmark - Replay recorded traffic through a recipe
+
+Runs a recipe end to end against a cassette (see src/core/cassette.py), with no
+network access, and reports fetch and parse time separately so parser
+regressions can be measured without network noise.
+
+Record a cassette first by running any recipe with:
+    SCRAPER_CASSETTE=data/gst.cassette SCRAPER_CASSETTE_MODE=record ...
+
+Usage:
+    python src/scripts/bench_scrapers.py gst data/gst.cassette
+    python src/scripts/bench_scrapers.py mcq_insights data/quiz.cassette --latency 0.05
+"""
+
+import argparse
+import importlib
+import os
+import sys
+import time
+
+# Older recipes import `core`/`utils` from src/, newer ones `src.*` from the root
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
+sys.path[:0] = [os.path.join(ROOT, 'src'), ROOT]
+
+RECIPES = {
+    "gst": ("src.recipes.gst_recipe", "GstExtractor"),
+    "mcq_insights": ("utils.scraper", "MCQInsights"),
+    "exambot": ("src.recipes.exambot.scrape", "ExamBot"),
+    "iasscore": ("utils.scraper", "MicroTopicsIasscore"),
+}
+
+
+def load_recipe(name):
+    module_name, class_name = RECIPES[name]
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+def cassette_module(recipe_cls):
+    """
+    src.core.cassette, or core.cassette for recipes whose Fetcher comes from
+    `core`: the Fetcher only stops retrying on its own package's CassetteMiss.
+    """
+    for cls in recipe_cls.__mro__:
+        fetcher = getattr(sys.modules[cls.__module__], "Fetcher", None)
+        if fetcher is not None:
+            package = fetcher.__module__.rpartition(".")[0]
+            return importlib.import_module(package + ".cassette")
+    return importlib.import_module("src.core.cassette")
+
+
+def run(recipe_cls, cassette, urls, repeat=1):
+    """Fetch and parse every URL; return (pages, fetch seconds, parse seconds, failures)."""
+    fetch_time = parse_time = 0.0
+    pages = failures = 0
+    for _ in range(repeat):
+        for url in urls:
+            scraper = recipe_cls(base_url=url, cassette=cassette)
+            try:
+                start = time.perf_counter()
+                html = scraper.fetch_page()
+                fetched = time.perf_counter()
+                scraper.pre_parse(html)
+                scraper.parse_page()
+                parsed = time.perf_counter()
+            except Exception as e:
+                print(f"  failed: {url}: {e}")
+                failures += 1
+                continue
+            fetch_time += fetched - start
+            parse_time += parsed - fetched
+            pages += 1
+    return pages, fetch_time, parse_time, failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark a recipe against a recorded cassette")
+    parser.add_argument("recipe", choices=sorted(RECIPES))
+    parser.add_argument("cassette", help="Cassette file recorded with SCRAPER_CASSETTE_MODE=record")
+    parser.add_argument("--host", help="Only replay URLs on this host")
+    parser.add_argument("--limit", type=int, help="Replay at most this many URLs")
+    parser.add_argument("--repeat", type=int, default=1, help="Replay the URL set this many times")
+    parser.add_argument("--latency", type=float, default=0.0, help="Simulated latency per response (seconds)")
+    parser.add_argument("--recorded-latency", action="store_true", help="Replay the recorded response times")
+    args = parser.parse_args()
+
+    recipe_cls = load_recipe(args.recipe)
+    cassettes = cassette_module(recipe_cls)
+    cassette = cassettes.Cassette(args.cassette, cassettes.REPLAY, latency=args.latency,
+                                  recorded_latency=args.recorded_latency)
+    urls = cassette.urls(args.host)[:args.limit]
+    if not urls:
+        print("No recorded URLs to replay")
+        sys.exit(1)
+
+    print(f"Replaying {len(urls)} URLs x{args.repeat} through {recipe_cls.__name__}")
+    start = time.perf_counter()
+    pages, fetch_time, parse_time, failures = run(recipe_cls, cassette, urls, args.repeat)
+    total = time.perf_counter() - start
+    cassette.close()
+
+    print(f"Pages:       {pages} ({failures} failed)")
+    print(f"Total:       {total:.3f}s ({pages / total:.1f} pages/s)")
+    print(f"Fetch:       {fetch_time:.3f}s")
+    if pages:
+        print(f"Parse:       {parse_time:.3f}s ({parse_time / pages * 1000:.2f} ms/page)")
+
+
+if __name__ == "__main__":
+    main()
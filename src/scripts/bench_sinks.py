@@ -0,0 +1,181 @@
+"""
+Sink Benchmark - Streaming record sinks vs building the list and dumping it
+
+Generates DGGCA-like records and checks that every sink in src/core/sinks.py
+(.csv, .json, .jsonl, their .gz variants and .db) gives back exactly the
+records written, that the CSV matches the previous csv.DictWriter output
+byte for byte, and that a run failing halfway leaves its flushed records in
+the .part file and no final file. Then it compares peak Python memory and
+time of the previous save (list + json.dump(indent=4) / DictWriter) with
+streaming the same records from a generator.
+
+Usage:
+    python src/scripts/bench_sinks.py
+    python src/scripts/bench_sinks.py --records 1000000 --dir /tmp/sinks
+"""
+
+import argparse
+import csv
+import gzip
+import io
+import json
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+import tracemalloc
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
+sys.path.insert(0, ROOT)
+
+from src.core.sinks import PART_SUFFIX, open_sink  # noqa: E402
+
+FORMATS = [".csv", ".csv.gz", ".json", ".json.gz", ".jsonl", ".jsonl.gz", ".db"]
+
+
+def records(count, fail_at=None):
+    for n in range(count):
+        if n == fail_at:
+            raise RuntimeError(f"failed at record {n}")
+        yield {
+            "metadata": {"date": f"{n % 28 + 1}th May"},
+            "question": f"Which body audits item {n} under the treaty, and why (आयोग)?",
+            "a": f"Option a {n}",
+            "b": "Option b",
+            "c": "Option c, with a comma",
+            "d": "Option \"d\"",
+            "answer": "abcd"[n % 4],
+            "explanation": "Explanation line.\n" * (n % 3) or None,
+            "source": "dggca",
+        }
+
+
+def read_back(path):
+    """The records stored in `path` (a sink's output or .part file)."""
+    name = path[:-len(PART_SUFFIX)] if path.endswith(PART_SUFFIX) else path
+    opener = gzip.open if name.endswith(".gz") else open
+    if ".csv" in name:
+        with opener(path, "rt", encoding="utf-8", newline="") as f:
+            return list(csv.DictReader(f))
+    if ".jsonl" in name:
+        with opener(path, "rt", encoding="utf-8") as f:
+            return [json.loads(line) for line in f]
+    if ".json" in name:
+        with opener(path, "rt", encoding="utf-8") as f:
+            return json.load(f)
+    conn = sqlite3.connect(path)
+    conn.row_factory = sqlite3.Row
+    rows = [dict(row) for row in conn.execute("SELECT * FROM records")]
+    conn.close()
+    return rows
+
+
+def as_written(record, path):
+    """`record` the way the format stores it."""
+    if ".csv" in path:
+        return {key: "" if value is None else str(value) for key, value in record.items()}
+    if path.endswith(".db"):
+        return {key: json.dumps(value, ensure_ascii=False) if isinstance(value, dict) else value
+                for key, value in record.items()}
+    return record
+
+
+def legacy_csv(data):
+    """BaseScraper._save_to_csv before the sinks, into a string."""
+    f = io.StringIO(newline="")
+    writer = csv.DictWriter(f, fieldnames=data[0].keys())
+    writer.writeheader()
+    writer.writerows(data)
+    return f.getvalue()
+
+
+def check(directory, count):
+    failures = []
+    expected = list(records(count))
+    for ext in FORMATS:
+        path = os.path.join(directory, "check" + ext)
+        with open_sink(path, flush_every=97) as sink:
+            sink.write_many(records(count))
+        if read_back(path) != [as_written(record, path) for record in expected]:
+            failures.append(f"{ext}: records differ")
+        if os.path.exists(path + PART_SUFFIX):
+            failures.append(f"{ext}: .part left behind")
+
+    with open(os.path.join(directory, "check.csv"), encoding="utf-8", newline="") as f:
+        if f.read() != legacy_csv(expected):
+            failures.append(".csv: differs from the previous DictWriter output")
+
+    # A run that fails after 250 records with a flush every 100
+    for ext in FORMATS:
+        path = os.path.join(directory, "crash" + ext)
+        try:
+            with open_sink(path, flush_every=100) as sink:
+                sink.write_many(records(count, fail_at=250))
+        except RuntimeError:
+            pass
+        if os.path.exists(path):
+            failures.append(f"{ext}: final file written by a failed run")
+        elif len(read_back(path + PART_SUFFIX)) != 250:
+            failures.append(f"{ext}: .part does not hold the 250 written records")
+    return failures
+
+
+def measure(fn):
+    tracemalloc.start()
+    start = time.perf_counter()
+    fn()
+    seconds = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return seconds, peak
+
+
+def legacy_save(count, path):
+    data = list(records(count))
+    if path.endswith(".csv"):
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=data[0].keys())
+            writer.writeheader()
+            writer.writerows(data)
+    else:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=4)
+
+
+def stream_save(count, path):
+    with open_sink(path) as sink:
+        sink.write_many(records(count))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check and benchmark the record sinks")
+    parser.add_argument("--records", type=int, default=200000, help="Records for the memory/time comparison")
+    parser.add_argument("--check-records", type=int, default=1000, help="Records for the round-trip checks")
+    parser.add_argument("--dir", help="Directory for the output files (default: a temporary one)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        directory = args.dir or tmp
+        os.makedirs(directory, exist_ok=True)
+
+        failures = check(directory, args.check_records)
+        for failure in failures:
+            print(f"FAIL {failure}")
+        if failures:
+            sys.exit(1)
+        print(f"{', '.join(FORMATS)}: round trip, CSV bytes and failed-run .part files OK")
+
+        print(f"{'output':<22} {'seconds':>8} {'peak MB':>8}")
+        for ext in (".csv", ".json"):
+            path = os.path.join(directory, "bench" + ext)
+            seconds, peak = measure(lambda: legacy_save(args.records, path))
+            print(f"{'list + dump ' + ext:<22} {seconds:>8.2f} {peak / 1e6:>8.1f}")
+        for ext in (".csv", ".json", ".jsonl", ".jsonl.gz", ".db"):
+            path = os.path.join(directory, "bench" + ext)
+            seconds, peak = measure(lambda: stream_save(args.records, path))
+            print(f"{'sink ' + ext:<22} {seconds:>8.2f} {peak / 1e6:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+Startup Benchmark - CLI import and launch time
+
+Measures how long short CLI invocations take to start, and which heavy
+third-party modules each code path imports. A PDF-only run should not load
+the HTTP stack, and `--help` should load no recipe at all.
+
+Usage:
+    python src/scripts/bench_startup.py
+    python src/scripts/bench_startup.py --runs 20
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
+
+HEAVY_MODULES = ["requests", "bs4", "fake_useragent", "tenacity", "fitz", "sqlalchemy", "pandas"]
+
+CASES = {
+    "main --help": [sys.executable, "-m", "src.main", "--help"],
+    "import src.main": [sys.executable, "-c", "import src.main"],
+    "load dggca recipe": [sys.executable, "-c",
+                          "import src.main as m; m.load_recipe('dggca')"],
+    "load gst recipe": [sys.executable, "-c",
+                        "import src.main as m; m.load_recipe('gst')"],
+}
+
+
+def time_command(cmd, runs):
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(cmd, cwd=ROOT, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True)
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def heavy_imports(cmd):
+    """Return which HEAVY_MODULES the Python snippet in `cmd` ends up importing."""
+    if cmd[1] != "-c":
+        return None
+    probe = cmd[2] + f"; import sys; print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    result = subprocess.run([sys.executable, "-c", probe], cwd=ROOT,
+                            capture_output=True, text=True, check=True)
+    return result.stdout.strip().splitlines()[-1] if result.stdout.strip() else ""
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark CLI startup time")
+    parser.add_argument("--runs", type=int, default=10, help="Runs per case")
+    args = parser.parse_args()
+
+    baseline = statistics.median(time_command([sys.executable, "-c", "pass"], args.runs))
+    print(f"{'case':<20} {'median':>9} {'min':>9}  heavy imports")
+    print(f"{'python -c pass':<20} {baseline * 1000:>7.1f}ms")
+    for name, cmd in CASES.items():
+        timings = time_command(cmd, args.runs)
+        heavy = heavy_imports(cmd)
+        print(f"{name:<20} {statistics.median(timings) * 1000:>7.1f}ms "
+              f"{min(timings) * 1000:>7.1f}ms  {heavy if heavy is not None else '-'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""
+Answer Marker Check - What MCQInsights reads off explanations, before and after
+
+Runs the answer-marker pattern as it was before the branch reordering and
+the option-letter lookahead, and the current MCQInsights.split_answer, on
+explanations where the old pattern read the wrong letter, and on ones it
+already got right (which must not change). Then it parses quiz pages with
+and without an answer key through MCQInsights.get_questions:
+- with a key, the answers come from the key as before;
+- without one, they are read off the explanations. The old code answered
+  "f" for the first six questions and raised IndexError on the seventh.
+
+Usage:
+    python src/scripts/check_answer_markers.py
+"""
+
+import os
+import re
+import sys
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
+sys.path[:0] = [os.path.join(ROOT, 'src'), ROOT]
+
+from utils.scraper import MCQInsights  # noqa: E402
+
+# (explanation, answer read before, answer read now)
+CASES = [
+    # Fixed: a longer marker used to stop at its prefix
+    ("Correct Answer: c Statement 2 is wrong", "a", "c"),
+    ("Correct Answer: (d) as per Article 163", "a", "d"),
+    ("Ans: 2) d The Governor acts on advice", None, "d"),
+    # Fixed: the first letter of a word used to be read as the option
+    ("Answer - Both statements are correct", "b", None),
+    ("Solution: Article 21 covers it", "a", None),
+    # Unchanged
+    ("Ans: (b) Statement 1 is correct", "b", "b"),
+    ("Ans. c because of the 42nd amendment", "c", "c"),
+    ("Solution:\nA is the only correct pair", "a", "a"),
+    ("Correct Option: a", "a", "a"),
+    ("Sol. b The act provides that", "b", "b"),
+    ("SOLUTION: d", "d", "d"),
+    ("उत्तर: (a) संविधान", "a", "a"),
+    ("No marker in this explanation", None, None),
+]
+
+
+def legacy_answer_pattern():
+    """MCQInsights.build_answer_pattern before the fixes, kept for comparison."""
+    parts = [r"Ans\s*[:\.\-]\s*", r"Ans-\.\s*", r"Solution\s*[:\-\n]*", r"Correct\s*Option[:\-]?\s*",
+             r"Correct\s*[:\-]?\s*", r"Answeer\s*[:\-]?\s*", r"Sol[:\.\-]\s*", r"उत्तर\s*[:\-]?\s*",
+             r"Correct\s*Answer[:\-]?\s*", r"Answer\s*[:\-]?\s*", r"Sol\s*[:\-]?\s*",
+             r"SOLUTION[:\-]\s*", r"Ans[:\.\-]\s*(?:\d+\)\s*)?"]
+    return re.compile(r"(" + "|".join(parts) + r")" + r"\s*(?:\(?([a-dA-D])\)?)*" + r"(.*)")
+
+
+def legacy_answer(pattern, explanation):
+    match = pattern.search(explanation)
+    return match.group(2).lower() if match and match.group(2) else None
+
+
+def quiz_page(explanations, answer_key=None):
+    items = "".join(
+        f'<li class="wpProQuiz_listItem"><div class="wpProQuiz_question_text">Question {n}?</div>'
+        + "".join(f'<li class="wpProQuiz_questionListItem">Option {letter}</li>' for letter in "abcd")
+        + f'<div class="wpProQuiz_correct">{explanation}</div></li>'
+        for n, explanation in enumerate(explanations))
+    script = ""
+    if answer_key is not None:
+        key = ", ".join(f'"{n}": {{"correct": [{", ".join("1" if i == "abcd".index(letter) else "0" for i in range(4))}]}}'
+                        for n, letter in enumerate(answer_key))
+        script = f'<script type="text/javascript">var wpProQuizInitList = {{json: {{{key}}}}};</script>'
+    return f"<html><body><ul>{items}</ul>{script}</body></html>"
+
+
+def answers(html):
+    scraper = MCQInsights(base_url="https://example.com/quiz", content=html)
+    scraper.pre_parse(html)
+    return [question["answer"] for question in scraper.get_questions()]
+
+
+def main():
+    failures = []
+    legacy = legacy_answer_pattern()
+    scraper = MCQInsights.__new__(MCQInsights)
+    print(f"{'explanation':<42} {'before':>6} {'now':>6}")
+    for explanation, before, now in CASES:
+        got_before, got_now = legacy_answer(legacy, explanation), scraper.split_answer(explanation)[0]
+        print(f"{explanation[:42]!r:<42} {str(got_before):>6} {str(got_now):>6}")
+        if (got_before, got_now) != (before, now):
+            failures.append(f"{explanation!r}: expected {before} -> {now}, got {got_before} -> {got_now}")
+
+    explanations = [explanation for explanation, _, _ in CASES]
+    keyed = answers(quiz_page(explanations, answer_key="abcd" * 4))
+    if keyed != list(("abcd" * 4)[:len(explanations)]):
+        failures.append(f"answer key not used: {keyed}")
+    unkeyed = answers(quiz_page(explanations))
+    expected = [now or "f" for _, _, now in CASES]
+    if unkeyed != expected:
+        failures.append(f"answers without a key: {unkeyed}, expected {expected}")
+    print(f"{len(explanations)} questions with a key: {keyed}")
+    print(f"{len(explanations)} questions without one: {unkeyed}")
+
+    for failure in failures:
+        print(f"FAIL {failure}")
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
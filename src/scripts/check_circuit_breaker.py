@@ -0,0 +1,111 @@
+"""
+Circuit Breaker Check - An abandoned half-open probe is handed back
+
+When a host's breaker is half-open, the first request claims the single probe
+and every other request polls until the probe's outcome is recorded. This
+script opens a breaker, lets an afetch claim the probe and cancels it while
+it waits for its rate-limit reservation (as aiter_extract does with its
+pending requests), then checks that the next request may probe instead of
+polling forever. It does the same for a blocking fetch whose reservation
+raises, and checks that a probe whose outcome was recorded is not released
+a second time, so a newer probe keeps its claim.
+
+No request leaves the machine: every probe is abandoned before it is sent.
+
+Usage:
+    python src/scripts/check_circuit_breaker.py
+"""
+
+import asyncio
+import contextvars
+import os
+import sys
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
+sys.path.insert(0, ROOT)
+
+from src.core.circuit_breaker import HALF_OPEN, PROBE_POLL_INTERVAL, get_circuit_breaker  # noqa: E402
+from src.core.fetch import Fetcher  # noqa: E402
+
+URL = "https://breaker-check.invalid/page"
+RESERVATION = 30.0
+
+
+class SlowLimiter:
+    """A rate limiter that makes every request wait `RESERVATION` seconds."""
+
+    def reserve(self, url):
+        return RESERVATION
+
+
+class FailingLimiter:
+    def reserve(self, url):
+        raise KeyboardInterrupt
+
+
+def half_open():
+    """The breaker for URL, opened and due for a probe."""
+    breaker = get_circuit_breaker(URL)
+    breaker.reset_timeout = 0.0
+    for _ in range(breaker.failure_threshold):
+        breaker.record_failure()
+    return breaker
+
+
+async def cancel_during_reservation(breaker):
+    fetcher = Fetcher(rate_limiter=SlowLimiter(), user_agent=object())
+    task = asyncio.ensure_future(fetcher.afetch(URL))
+    # Let the task claim the probe and start sleeping on its reservation
+    for _ in range(10):
+        await asyncio.sleep(0)
+    claimed = breaker.state == HALF_OPEN and breaker.before_request() == PROBE_POLL_INTERVAL
+    task.cancel()
+    try:
+        await task
+    except asyncio.CancelledError:
+        pass
+    return claimed
+
+
+def main():
+    failures = []
+
+    breaker = half_open()
+    if not asyncio.run(cancel_during_reservation(breaker)):
+        failures.append("afetch did not claim the probe")
+    if breaker.before_request() != 0:
+        failures.append("probe still held after the afetch was cancelled")
+    else:
+        print("afetch cancelled during its reservation: probe handed back")
+
+    breaker = half_open()
+    try:
+        Fetcher(rate_limiter=FailingLimiter(), user_agent=object()).fetch(URL)
+    except KeyboardInterrupt:
+        pass
+    if breaker.before_request() != 0:
+        failures.append("probe still held after fetch was interrupted")
+    else:
+        print("fetch interrupted before sending: probe handed back")
+
+    # A recorded outcome ends the probe; releasing it afterwards must not
+    # free the probe another request claimed since
+    breaker = half_open()
+    first = contextvars.copy_context()
+    first.run(breaker.before_request)
+    breaker.record_failure()
+    breaker.before_request()
+    first.run(breaker.release_probe)
+    if breaker.before_request() != PROBE_POLL_INTERVAL:
+        failures.append("a late release freed a newer probe")
+    else:
+        print("late release leaves the newer probe in flight")
+
+    for failure in failures:
+        print(f"FAIL {failure}")
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
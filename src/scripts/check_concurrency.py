@@ -0,0 +1,108 @@
+"""
+Concurrency Check - What --concurrency buys with and without --rate
+
+Scrapes a few pages through BaseScraper.extract_many with a fake session
+that answers after a fixed latency, so the run goes through the real fetch
+layer (rate limiter, circuit breaker, retries) without touching the network.
+It reports the wall time at concurrency 1 and N:
+- with the default per-host rate (0.5 requests/s), concurrency changes
+  nothing, since requests are spaced by the limiter, not by their latency;
+  this is why main.py warns when --concurrency is given without --rate;
+- with the rate raised, requests overlap and concurrency N is about N times
+  faster.
+It also checks that parse_page ran off the event loop's thread.
+
+Usage:
+    python src/scripts/check_concurrency.py
+    python src/scripts/check_concurrency.py --pages 8 --latency 0.5 --concurrency 8
+"""
+
+import argparse
+import os
+import sys
+import threading
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
+sys.path.insert(0, ROOT)
+
+from src.core.base_scraper import BaseScraper  # noqa: E402
+from src.core.rate_limit import DEFAULT_RATE, get_rate_limiter  # noqa: E402
+
+
+class FakeResponse:
+    status_code = 200
+    encoding = apparent_encoding = "utf-8"
+    headers = {"Content-Type": "text/html"}
+
+    def __init__(self, url):
+        self.text = f"<html><body><p>{url}</p></body></html>"
+        self.content = self.text.encode("utf-8")
+
+
+class FakeSession:
+    def __init__(self, latency):
+        self.latency = latency
+
+    def get(self, url, headers=None, timeout=None):
+        time.sleep(self.latency)
+        return FakeResponse(url)
+
+
+class PageScraper(BaseScraper):
+    parse_threads = set()
+
+    def parse_page(self):
+        PageScraper.parse_threads.add(threading.get_ident())
+        return [{"url": self.soup.p.text}]
+
+
+def run(host, pages, concurrency, latency):
+    urls = [f"https://{host}/page/{n}" for n in range(pages)]
+    start = time.perf_counter()
+    results = PageScraper.extract_many(urls, concurrency=concurrency, session=FakeSession(latency))
+    seconds = time.perf_counter() - start
+    if [records[0]["url"] for records in results] != urls:
+        raise SystemExit(f"FAIL {host}: wrong results")
+    return seconds
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check what --concurrency does with and without --rate")
+    parser.add_argument("--pages", type=int, default=4, help="Pages per run")
+    parser.add_argument("--latency", type=float, default=0.3, help="Seconds the fake server takes per page")
+    parser.add_argument("--concurrency", type=int, default=4, help="Concurrency compared with 1")
+    args = parser.parse_args()
+
+    limiter = get_rate_limiter()
+    print(f"{'rate':>12} {'concurrency':>12} {'seconds':>8}")
+    timings = {}
+    for label, rate in ((f"{DEFAULT_RATE} (default)", None), ("100", 100)):
+        for concurrency in (1, args.concurrency):
+            host = f"rate-{rate}-c{concurrency}.invalid"
+            limiter.configure(host, rate=rate, jitter=0)
+            seconds = run(host, args.pages, concurrency, args.latency)
+            timings[rate, concurrency] = seconds
+            print(f"{label:>12} {concurrency:>12} {seconds:>8.2f}")
+
+    failures = []
+    default_gain = timings[None, 1] / timings[None, args.concurrency]
+    raised_gain = timings[100, 1] / timings[100, args.concurrency]
+    if default_gain > 1.5:
+        failures.append(f"concurrency sped up the default rate {default_gain:.1f}x; the warning is wrong")
+    if raised_gain < args.concurrency / 2:
+        failures.append(f"concurrency only sped up a raised rate {raised_gain:.1f}x")
+    if threading.main_thread().ident in PageScraper.parse_threads:
+        failures.append("parse_page ran on the event loop's thread")
+    print(f"speedup from concurrency {args.concurrency}: {default_gain:.1f}x at the default rate, "
+          f"{raised_gain:.1f}x with the rate raised; parse_page ran in "
+          f"{len(PageScraper.parse_threads)} worker threads")
+
+    for failure in failures:
+        print(f"FAIL {failure}")
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
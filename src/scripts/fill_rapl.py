@@ -10,7 +10,6 @@ import logging
 import os
 import sys
 import json
-import time
 from tqdm import tqdm
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from threading import Lock
@@ -29,6 +28,7 @@ logger.setLevel(logging.INFO)
 # Silence all third-party library logs
 logging.getLogger('urllib3').setLevel(logging.CRITICAL)
 logging.getLogger('src.core.base_scraper').setLevel(logging.CRITICAL)
+logging.getLogger('src.core.fetch').setLevel(logging.CRITICAL)
 logging.getLogger('src.services.gst_data_service').setLevel(logging.CRITICAL)
 
 INPUT_FILE = "data/input/Estimated Data Rapl.xlsx"
@@ -38,6 +38,8 @@ CHECKPOINT_FILE = "data/input/.rapl_checkpoint_v2.json"
 # Configuration
 MAX_WORKERS = 3
 BATCH_SIZE = 10
+GST_HOST = "gst.jamku.app"
+REQUESTS_PER_SECOND = 0.5  # Shared by all workers
 
 # Global shutdown flag
 shutdown_requested = False
@@ -71,16 +73,18 @@ def extract_unique_gstins(df):
     return list(unique_gstins)
 
 
-from src.services.gst_data_service import GstDataService, AdaptiveRateLimiter
+from src.core.rate_limit import get_rate_limiter
+from src.core.sessions import configure_pool
+from src.services.gst_data_service import GstDataService
 
 
-def scrape_unique_gstins(unique_gstins, gst_service, rate_limiter):
-    """Scrape all unique GSTINs in parallel with adaptive rate limiting."""
+def scrape_unique_gstins(unique_gstins, gst_service):
+    """Scrape all unique GSTINs in parallel; requests are paced per host by the fetch layer."""
     logger.info(f"📥 Scraping {len(unique_gstins)} unique GSTINs...")
     
     results = []
     with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
-        futures = {executor.submit(scrape_with_rate_limit, gstin, gst_service, rate_limiter): gstin 
+        futures = {executor.submit(gst_service.get_gst_data, gstin): gstin 
                    for gstin in unique_gstins}
         
         with tqdm(total=len(unique_gstins), desc="Scraping GSTINs", unit="GSTIN") as pbar:
@@ -93,20 +97,9 @@ def scrape_unique_gstins(unique_gstins, gst_service, rate_limiter):
                 
                 gstin = futures[future]
                 try:
-                    data, had_429 = future.result()
+                    data = future.result()
                     results.append((gstin, data))
                     
-                    # Update rate limiter
-                    if had_429:
-                        rate_limiter.record_429()
-                        # Check if we need a long pause
-                        pause = rate_limiter.should_pause()
-                        if pause > 0:
-                            time.sleep(pause)
-                            rate_limiter.consecutive_429s = 0  # Reset after break
-                    else:
-                        rate_limiter.record_success()
-                    
                     # Save checkpoint periodically
                     batch_count += 1
                     if batch_count >= BATCH_SIZE:
@@ -122,24 +115,6 @@ def scrape_unique_gstins(unique_gstins, gst_service, rate_limiter):
     save_checkpoint(gst_service.cache)
     return results
 
-def scrape_with_rate_limit(gstin, gst_service, rate_limiter):
-    """Scrape a single GSTIN with adaptive rate limiting."""
-    # Apply adaptive delay before request
-    delay = rate_limiter.get_delay()
-    time.sleep(delay)
-    
-    # Track if we encountered 429
-    had_429 = False
-    
-    try:
-        data = gst_service.get_gst_data(gstin)
-        return data, had_429
-    except Exception as e:
-        # Check if it's a rate limit error
-        if '429' in str(e) or 'Too many requests' in str(e):
-            had_429 = True
-        raise
-
 def fill_dataframe(df, gst_service):
     """Fill all rows using the cached GSTIN data."""
     logger.info("📝 Filling Excel rows from cache...")
@@ -224,12 +199,15 @@ def main():
     checkpoint = load_checkpoint()
     gstin_cache = checkpoint.get("gstin_cache", {})
     
+    # One pooled connection per worker to the GST host
+    configure_pool(MAX_WORKERS)
+
     # Initialize service with cache (loaded from file)
     gst_service = GstDataService(cache=gstin_cache, cache_lock=cache_lock)
     
-    # Initialize adaptive rate limiter
-    rate_limiter = AdaptiveRateLimiter(base_delay=1.0, max_delay=10.0)
-    logger.info("✓ Adaptive rate limiting enabled (1s-10s delays)")
+    # Rate limit the GST host across all workers
+    get_rate_limiter().configure(GST_HOST, rate=REQUESTS_PER_SECOND, burst=MAX_WORKERS)
+    logger.info(f"✓ Rate limiting enabled ({REQUESTS_PER_SECOND} requests/s to {GST_HOST})")
     
     # Extract unique GSTINs
     unique_gstins = extract_unique_gstins(df)
@@ -252,9 +230,9 @@ def main():
     if args.retry_failed:
         logger.info(f"  (Including retries for previously failed items)")
 
-    # Scrape with adaptive rate limiting
+    # Scrape with per-host rate limiting
     if gstins_to_scrape and not shutdown_requested:
-        scrape_unique_gstins(gstins_to_scrape, gst_service, rate_limiter)
+        scrape_unique_gstins(gstins_to_scrape, gst_service)
     
     # Show cache stats
     stats = gst_service.get_cache_stats()
@@ -0,0 +1,85 @@
+"""
+Page Cache CLI - Warm, inspect or clear the PDF page-text cache
+
+The cache (see src/core/page_cache.py) is keyed by PDF SHA-256, page,
+extraction mode and PyMuPDF version. Warm it once for a big book, then point
+recipes at it with SCRAPER_PAGE_CACHE (or --page-cache for main.py) and
+parser iterations skip MuPDF.
+
+Usage:
+    python src/scripts/page_cache.py warm "data/SSC English KIRAN 11600+.pdf" --workers 4
+    python src/scripts/page_cache.py info
+    python src/scripts/page_cache.py clear data/book.pdf
+"""
+
+import argparse
+import os
+import sys
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
+sys.path.insert(0, ROOT)
+
+DEFAULT_CACHE = "data/page_cache.db"
+
+
+def warm(cache, args):
+    from src.core.services.pdf_service import PDFService
+
+    for pdf_path in args.pdfs:
+        start = time.perf_counter()
+        pages = sum(1 for _ in PDFService(pdf_path, workers=args.workers or None, cache=cache).iter_pages())
+        print(f"{pdf_path}: {pages} pages in {time.perf_counter() - start:.2f}s")
+
+
+def info(cache, args):
+    rows = cache.stats()
+    if not rows:
+        print("Cache is empty")
+        return
+    print(f"{'sha256':<14} {'pages':>11} {'MB':>8}  {'mode':<6} {'pymupdf':<9} path")
+    for digest, path, page_count, mode, engine, cached, size in rows:
+        pages = f"{cached}/{page_count}" if page_count else str(cached)
+        print(f"{digest[:12]:<14} {pages:>11} {size / 1e6:>8.2f}  {mode:<6} {engine:<9} {path}")
+
+
+def clear(cache, args):
+    from src.core.page_cache import file_sha256
+
+    if not args.pdfs:
+        print(f"Removed {cache.clear()} pages")
+    for pdf_path in args.pdfs:
+        print(f"{pdf_path}: removed {cache.clear(file_sha256(pdf_path))} pages")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Manage the PDF page-text cache")
+    parser.add_argument("--cache", default=os.environ.get("SCRAPER_PAGE_CACHE", DEFAULT_CACHE),
+                        help=f"Cache file (default: $SCRAPER_PAGE_CACHE or {DEFAULT_CACHE})")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    warm_parser = commands.add_parser("warm", help="Extract and cache every page of the given PDFs")
+    warm_parser.add_argument("pdfs", nargs="+")
+    warm_parser.add_argument("--workers", type=int, default=1, help="Extraction processes (0 = all cores)")
+    warm_parser.set_defaults(handler=warm)
+
+    info_parser = commands.add_parser("info", help="Show cached documents")
+    info_parser.set_defaults(handler=info)
+
+    clear_parser = commands.add_parser("clear", help="Remove the given PDFs (or everything) from the cache")
+    clear_parser.add_argument("pdfs", nargs="*")
+    clear_parser.set_defaults(handler=clear)
+
+    args = parser.parse_args()
+
+    from src.core.page_cache import PageTextCache
+
+    cache = PageTextCache(args.cache)
+    try:
+        args.handler(cache, args)
+    finally:
+        cache.close()
+
+
+if __name__ == "__main__":
+    main()
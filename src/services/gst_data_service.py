@@ -3,14 +3,13 @@ GST Data Service - Reusable GST extraction with caching and rate limiting.
 
 This service provides a clean interface for extracting GST data with built-in:
 - Caching (avoid duplicate requests)
-- Rate limiting (prevent IP blocking)
 - Thread-safe operations
 - Persistent checkpoint support
+
+Rate limiting is done by the fetch layer (see src.core.rate_limit).
 """
 
 import logging
-import time
-import random
 from threading import Lock
 from typing import Dict, Optional, Any
 from src.recipes.gst_recipe import GstExtractor
@@ -24,7 +23,7 @@ class GstDataService:
     
     Features:
     - Thread-safe caching to avoid duplicate GSTIN requests
-    - Random delays between requests to prevent rate limiting
+    - Requests paced by the per-host rate limiter of the fetch layer
     - Persistent cache support via external checkpoint
     - Graceful error handling
     
@@ -33,21 +32,18 @@ class GstDataService:
         data = service.get_gst_data("06AAFCC9473R1ZT")
     """
     
-    def __init__(self, cache: Dict[str, Any], cache_lock: Lock, 
-                 min_delay: float = 0.5, max_delay: float = 1.5):
+    def __init__(self, cache: Dict[str, Any], cache_lock: Lock, rate_limiter=None):
         """
         Initialize the GST data service.
         
         Args:
             cache: Shared dictionary for caching GSTIN results
             cache_lock: Thread lock for cache synchronization
-            min_delay: Minimum delay between requests (seconds)
-            max_delay: Maximum delay between requests (seconds)
+            rate_limiter: Rate limiter for requests (default: the process-wide one)
         """
         self.cache = cache
         self.cache_lock = cache_lock
-        self.min_delay = min_delay
-        self.max_delay = max_delay
+        self.rate_limiter = rate_limiter
         self._shutdown = False
     
     def shutdown(self):
@@ -76,14 +72,10 @@ class GstDataService:
                 logger.debug(f"Cache hit for GSTIN: {gstin}")
                 return self.cache[gstin]
         
-        # Not in cache - fetch from API with rate limiting
+        # Not in cache - fetch from API (paced by the rate limiter)
         try:
-            # Random delay to avoid rate limiting (anti-IP-block strategy)
-            delay = random.uniform(self.min_delay, self.max_delay)
-            time.sleep(delay)
-            
             url = f"https://gst.jamku.app/gstin/{gstin}"
-            extractor = GstExtractor(base_url=url)
+            extractor = GstExtractor(base_url=url, rate_limiter=self.rate_limiter)
             results = extractor.extract()
             
             if results:
@@ -124,48 +116,3 @@ class GstDataService:
             'successful': successful,
             'failed': failed
         }
-
-"""
-Adaptive Rate Limiting Service
-Automatically adjusts delays based on rate limit detection.
-"""
-class AdaptiveRateLimiter:
-    """Tracks 429 errors and adjusts delays dynamically."""
-    
-    def __init__(self, base_delay=1.0, max_delay=10.0):
-        self.base_delay = base_delay
-        self.max_delay = max_delay
-        self.current_delay = base_delay
-        self.consecutive_429s = 0
-        self.lock = Lock()
-    
-    def record_success(self):
-        """Record a successful request - gradually reduce delay."""
-        with self.lock:
-            self.consecutive_429s = 0
-            # Slowly decrease delay back to base
-            self.current_delay = max(self.base_delay, self.current_delay * 0.95)
-    
-    def record_429(self):
-        """Record a 429 error - increase delay exponentially."""
-        with self.lock:
-            self.consecutive_429s += 1
-            # Double the delay, up to max
-            self.current_delay = min(self.max_delay, self.current_delay * 2)
-            logger.warning(f"⚠️  Rate limit detected! Slowing down to {self.current_delay:.1f}s delay (429 count: {self.consecutive_429s})")
-    
-    def get_delay(self):
-        """Get current delay with some randomness."""
-        with self.lock:
-            import random
-            # Add ±20% randomness
-            return self.current_delay * random.uniform(0.8, 1.2)
-    
-    def should_pause(self):
-        """Check if we should take a longer break."""
-        with self.lock:
-            # If we've hit 5+ consecutive 429s, take a long break
-            if self.consecutive_429s >= 5:
-                logger.warning(f"🛑 Too many rate limits ({self.consecutive_429s})! Taking 30s break...")
-                return 30
-            return 0
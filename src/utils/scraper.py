@@ -1,60 +1,38 @@
 import re
 from core import (
-    UserAgent,
-    retry,
-    stop_after_attempt,
-    wait_exponential,
     RetryError,
     logger,
-    requests,
-    BeautifulSoup,
     re,
-    time,
-    random,
     json
 )
+from core.fetch import Fetcher, get_user_agent
+from core.parsers import Regions, SoupStrainer, has_class, make_soup
+from core.prefilter import PrefilteredPattern
+from core.sessions import get_session
 
 
 class Scraper:
+    parser = None
+    parse_only = None
+
     def __init__(self, **kwargs):
         self.base_url = kwargs.get('base_url', '').strip()
         self.content = kwargs.get('content')
-        self.ua = UserAgent()
-        self.session = requests.Session()
+        self.ua = get_user_agent()
+        self.session = kwargs.get('session') or get_session(self.base_url)
+        self.fetcher = Fetcher(session=self.session,
+                               rate_limiter=kwargs.get('rate_limiter'),
+                               user_agent=self.ua,
+                               cache=kwargs.get('cache'),
+                               cassette=kwargs.get('cassette'))
+        self.parser = kwargs.get('parser') or self.parser
+        self.parse_only = kwargs.get('parse_only', self.parse_only)
 
-    @retry(stop=stop_after_attempt(5), wait=wait_exponential(multiplier=2, min=5, max=30), reraise=True)
     def fetch_page(self):
-        headers = {
-            "User-Agent": self.ua.random,
-            "Accept-Language": "en-US,en;q=0.9"
-        }
-        self.session.headers.update(headers)
-
-        delay = random.uniform(2, 5)
-        logger.info(
-            f"Waiting {delay:.2f} seconds before request to {self.base_url}")
-        time.sleep(delay)
-
-        response = self.session.get(self.base_url, timeout=10)
-
-        if response.status_code == 404:
-            logger.warning(f"Page not found: {self.base_url} (404)")
-            return ""
-
-        if response.status_code == 429:
-            logger.warning(f"Rate limit hit! Retrying... ({self.base_url})")
-            raise Exception(f"Too many requests: {self.base_url} (429)")
-
-        if response.status_code != 200:
-            logger.error(
-                f"Failed to fetch {self.base_url} (Status Code: {response.status_code})")
-            raise Exception(
-                f"Failed to fetch {self.base_url} (Status Code: {response.status_code})")
-
-        return response.text
+        return self.fetcher.fetch(self.base_url)
 
     def pre_parse(self, html_content):
-        self.soup = BeautifulSoup(html_content, "html.parser")
+        self.soup = make_soup(html_content, self.parser, self.parse_only)
 
     def scrape(self, content=None):
         try:
@@ -73,36 +51,74 @@ class Scraper:
         return self.soup.prettify()
 
 
+QUIZ_MARKER = "wpProQuizInitList"
+# A type attribute whose value is exactly text/javascript, as the soup lookup
+# it replaces requires (not data-type=, not text/javascript;charset=...)
+SCRIPT_JS_TYPE = re.compile(r"""\s(?i:type)\s*=\s*(?:"text/javascript"|'text/javascript'|text/javascript(?=[\s>]|$))""")
+QUIZ_FIELDS = ("wpProQuiz_question_text", "wpProQuiz_questionListItem", "wpProQuiz_correct")
+
+
 class MCQInsights(Scraper):
+    # Only the quiz items and the script holding the answer key are read
+    parse_only = Regions(SoupStrainer(class_=has_class("wpProQuiz_listItem")),
+                         SoupStrainer("script"))
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
+        self.answer_key = None
+
+    def pre_parse(self, html_content):
+        # The answer key is read from the raw HTML before the tree is built;
+        # extract_correct_answers falls back to the soup if this finds nothing
+        self.answer_key = self.scan_answer_key(html_content)
+        super().pre_parse(html_content)
+
+    def scan_answer_key(self, html_content):
+        """Return the text of the text/javascript script holding the quiz JSON, or None."""
+        if not isinstance(html_content, str):
+            return None
+        index = html_content.find(QUIZ_MARKER)
+        while index != -1:
+            tag_start = html_content.rfind("<script", 0, index)
+            tag_end = html_content.find(">", tag_start)
+            script_end = html_content.find("</script>", index)
+            if (tag_start != -1 and script_end != -1
+                    and html_content.rfind("</script>", tag_start, index) == -1
+                    and SCRIPT_JS_TYPE.search(html_content, tag_start, tag_end)):
+                return html_content[tag_end + 1:script_end]
+            index = html_content.find(QUIZ_MARKER, index + len(QUIZ_MARKER))
+        return None
 
     def parse_page(self):
         self.scraped_data = []
         questions = self.get_questions()
         self.scraped_data.append(questions)
 
-    def build_answer_pattern(self):
+    @staticmethod
+    def build_answer_pattern():
+        # Longer markers come before their prefixes ("Correct Answer" before
+        # "Correct"), as the first branch that matches wins
         parts = []
 
-        parts.append(r"Ans\s*[:\.\-]\s*")  # Ans., Ans:, Ans-
         parts.append(r"Ans-\.\s*")
+        parts.append(r"Ans[:\.\-]\s*(?:\d+\)\s*)?")  # Number is optional
+        parts.append(r"Ans\s*[:\.\-]\s*")  # Ans., Ans:, Ans-
         parts.append(r"Solution\s*[:\-\n]*")
         parts.append(r"Correct\s*Option[:\-]?\s*")
+        parts.append(r"Correct\s*Answer[:\-]?\s*")
         parts.append(r"Correct\s*[:\-]?\s*")
         parts.append(r"Answeer\s*[:\-]?\s*")
         parts.append(r"Sol[:\.\-]\s*")  # Handling Sol. format
         parts.append(r"उत्तर\s*[:\-]?\s*")
-        parts.append(r"Correct\s*Answer[:\-]?\s*")
         parts.append(r"Answer\s*[:\-]?\s*")  # Answer: or Answer -
         parts.append(r"Sol\s*[:\-]?\s*")  # Sol: or Sol -
         parts.append(r"SOLUTION[:\-]\s*")  # Handling SOLUTION: format
-        parts.append(r"Ans[:\.\-]\s*(?:\d+\)\s*)?")  # Number is optional
 
         start_part = "|".join(parts)
 
-        # Capture the option (in parentheses or without parentheses)
-        option_part = r"\s*(?:\(?([a-dA-D])\)?)*"
+        # Capture the option (in parentheses or without parentheses), but
+        # not the first letter of a word ("Answer: Both ...")
+        option_part = r"\s*(?:\(?([a-dA-D])\)?(?!\w))*"
 
         # Capture the remaining text (non-greedy)
         remaining_part = r"(.*)"
@@ -112,15 +128,31 @@ class MCQInsights(Scraper):
 
         return regex
 
+    def split_answer(self, explanation):
+        """
+        Split an explanation such as "Ans: (b) Statement 1 is ..." into the
+        answer letter and the rationale after it. Markers with no option
+        letter after them are skipped; (None, explanation) if none has one.
+        """
+        pos = 0
+        while (match := ANSWER_PATTERN.search(explanation, pos)) is not None:
+            if match.group(2):
+                return match.group(2).lower(), explanation[match.start(3):].strip()
+            pos = match.start() + 1
+        return None, explanation
+
     def normalize_whitespace(self, text):
         return re.sub(r'(\s)\1+', r'\1', text).strip()
 
     def extract_correct_answers(self):
-        script_tag = self.soup.find('script', type='text/javascript',
-                                    string=lambda text: "wpProQuizInitList" in text if text else False)
+        if self.answer_key is not None:
+            script_content = self.answer_key
+        else:
+            script_tag = self.soup.find('script', type='text/javascript',
+                                        string=lambda text: "wpProQuizInitList" in text if text else False)
+            script_content = script_tag.string if script_tag else None
 
-        if script_tag:
-            script_content = script_tag.string
+        if script_content:
             start = script_content.find("json:") + len("json:")
             end = script_content.find("}}", start) + 2
 
@@ -143,8 +175,23 @@ class MCQInsights(Scraper):
             print("Script tag not found.")
             return None  # Return None if the script tag is not found
 
+    def index_list_items(self):
+        """
+        Return one {class: [tags]} index per quiz item, for the classes in
+        QUIZ_FIELDS, built in a single walk of each item.
+        """
+        indexes = []
+        for item in self.soup.find_all(class_="wpProQuiz_listItem"):
+            index = {field: [] for field in QUIZ_FIELDS}
+            for tag in item.find_all(True):
+                for css_class in tag.get("class", ()):
+                    if css_class in index:
+                        index[css_class].append(tag)
+            indexes.append(index)
+        return indexes
+
     def get_questions(self):
-        quiz_list_items = self.soup.select('.wpProQuiz_listItem')
+        quiz_list_items = self.index_list_items()
         questions = []
         option_labels = ["a", "b", "c", "d", "e", "f"]
         correct_answers = self.extract_correct_answers()
@@ -153,17 +200,19 @@ class MCQInsights(Scraper):
         if correct_answers:
             for idx, no in enumerate(correct_answers):
                 correct_answers[idx] = correct_answer_map[no]
-        else:
-            correct_answers = ["f", "f", "f", "f", "f", "f"]
 
         for index, item in enumerate(quiz_list_items):
             question = self.normalize_whitespace(
-                item.select_one('.wpProQuiz_question_text').text)
-            options = [self.normalize_whitespace(itm.text) for itm in item.select(
-                '.wpProQuiz_questionListItem')]
+                item["wpProQuiz_question_text"][0].text)
+            options = [self.normalize_whitespace(itm.text) for itm in item[
+                'wpProQuiz_questionListItem']]
             explanation = self.normalize_whitespace(
-                item.select_one('.wpProQuiz_correct').text)
-            answer = correct_answers[index]
+                item["wpProQuiz_correct"][0].text)
+            if correct_answers:
+                answer = correct_answers[index]
+            else:
+                # No answer key: read the answer off the explanation
+                answer = self.split_answer(explanation)[0] or "f"
             ret = {
                 "question": question,
                 "answer": answer,
@@ -179,6 +228,12 @@ class MCQInsights(Scraper):
         return questions
 
 
+# Every answer marker starts with one of these, so the pattern is only tried
+# where one of them is found
+ANSWER_PATTERN = PrefilteredPattern(MCQInsights.build_answer_pattern(),
+                                    ("Ans", "Sol", "SOLUTION", "Correct", "उत्तर"))
+
+
 class QuestionInsights(Scraper):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)